@@ -43,10 +43,16 @@ export async function unsaveJob(jobId: string): Promise<SaveJobResponse> {
 }
 
 export async function getSavedJobs(candidateId: string): Promise<Job[]> {
-  const { data } = await apiClient.get<Job[]>(
-    `/candidates/${candidateId}/saved-jobs`,
-  );
-  return data;
+  // The endpoint is paginated, callers want every saved job
+  const jobs: Job[] = [];
+  for (let page = 1; ; page++) {
+    const { data } = await apiClient.get<JobSearchResponse>(
+      `/candidates/${candidateId}/saved-jobs`,
+      { params: { page, limit: 100 } },
+    );
+    jobs.push(...data.jobs);
+    if (page >= data.total_pages) return jobs;
+  }
 }
 
 export async function applyToJob(
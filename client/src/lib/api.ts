@@ -200,25 +200,34 @@ export const candidatesApi = {
   },
 
   getSavedJobs: async (id: number): Promise<SavedJob[]> => {
-    const { data } = await apiClient.get<
-      Array<{
-        id: number;
-        title: string;
-        description: string;
-        company: string;
-        employer_id: number;
-        location: string;
-        salary_range: string;
-        emp_type: string;
-        responsibilities: string[];
-        skills: Array<{ id: number; name: string }>;
-        created_at: string;
-        updated_at: string;
-        saved_at: string;
-      }>
-    >(`/api/candidates/${id}/saved-jobs`);
-
-    return data.map((job) => ({
+    type SavedJobRow = {
+      id: number;
+      title: string;
+      description: string;
+      company: string;
+      employer_id: number;
+      location: string;
+      salary_range: string;
+      emp_type: string;
+      responsibilities: string[];
+      skills: Array<{ id: number; name: string }>;
+      created_at: string;
+      updated_at: string;
+      saved_at: string;
+    };
+
+    // The endpoint is paginated, the saved jobs page lists them all
+    const rows: SavedJobRow[] = [];
+    for (let page = 1; ; page++) {
+      const { data } = await apiClient.get<{
+        jobs: SavedJobRow[];
+        total_pages: number;
+      }>(`/api/candidates/${id}/saved-jobs`, { params: { page, limit: 100 } });
+      rows.push(...data.jobs);
+      if (page >= data.total_pages) break;
+    }
+
+    return rows.map((job) => ({
       id: job.id,
       user_id: id,
       job_id: job.id,
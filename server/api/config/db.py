@@ -1,8 +1,8 @@
 import os
+from threading import Lock
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 load_dotenv()
@@ -14,8 +14,59 @@ DB_PORT = os.getenv("DB_PORT", "5432")
 DB_NAME = os.getenv("DB_NAME")
 
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# Per-request query stats come from middlewares/instrumentation.py instead
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() == "true"
 
-engine = create_engine(DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# gunicorn.conf.py derives pool sizes from the worker count, so that
+# workers x (pool_size + max_overflow) stays under max_connections
+ENGINE_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+    # Timestamps are stored naive; now() defaults must be UTC like utcnow(),
+    # since the API writes them out with a "Z"
+    "connect_args": {"options": "-c timezone=UTC"},
+}
 
-Base = declarative_base()
+_engine = None
+_engine_lock = Lock()
+
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker that creates the engine when the first session is opened"""
+
+    def __call__(self, **local_kw):
+        get_engine()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
+
+
+def get_engine():
+    """The process-wide engine, created on first use (never at import)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(DATABASE_URL, echo=SQL_ECHO, **ENGINE_OPTIONS)
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def dispose_engine(close: bool = True):
+    """
+    Drop pooled connections. Forked workers call this with close=False so
+    they don't close sockets still used by the parent.
+    """
+    if _engine is not None:
+        _engine.dispose(close=close)
+
+
+def __getattr__(name):
+    # `from config.db import engine` keeps working, without an import-time engine
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,14 @@ from flask import Blueprint, jsonify, request
 from sqlalchemy import func, text
 from sqlalchemy.exc import IntegrityError
 from config.db import SessionLocal
-from core.models import User, Job, Application, ReportedJob, Skill, Category, ConnectionRequest, DeleteRequest, Education, Notification, Experience
-from werkzeug.security import generate_password_hash
+from core.models import User, Job, Application, Report, Skill, Category, ConnectionRequest, DeleteRequest, Education, Notification, Experience
+from services.passwords import HasherBusy, busy_response, hash_password
 import jwt
 import os
 from sqlalchemy.orm import joinedload
 from datetime import datetime, timedelta
+from services.skill_registry import skill_registry
+from services.cache import cached_response, invalidate
 
 SECRET_KEY = os.getenv("JWT_SECRET")
 
@@ -17,6 +19,7 @@ admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
 # ============================================================
 # 1. GET /admin/stats → Platform metrics
 # ============================================================
+@cached_response(tags=("users", "jobs", "applications"))
 def get_platform_stats():
     db = SessionLocal()
 
@@ -56,7 +59,7 @@ def get_all_users():
             "image": u.image,
             "phone": u.phone,
             "headLine": u.headLine,
-            "created_at": u.created_at.isoformat() if u.created_at else None,
+            "created_at": u.created_at,
         }
         for u in users
     ]
@@ -105,7 +108,7 @@ def delete_user(user_id):
         db.query(DeleteRequest).filter(DeleteRequest.user_id == user_id).delete()
 
         # Reported jobs
-        db.query(ReportedJob).filter(ReportedJob.user_id == user_id).delete()
+        db.query(Report).filter(Report.user_id == user_id).delete()
 
         # M2M cleanup
         db.execute(
@@ -125,6 +128,9 @@ def delete_user(user_id):
         # Delete user
         db.delete(user)
         db.commit()
+        invalidate(
+            f"user:{user_id}", "users", "jobs", "applications", "delete_requests"
+        )
 
         return jsonify({"message": "User deleted successfully"}), 200
 
@@ -161,7 +167,7 @@ def delete_job_internal(job_id, db):
         {"jid": job_id},
     )
 
-    reported_jobs = db.query(ReportedJob).filter(ReportedJob.job_id == job_id).all()
+    reported_jobs = db.query(Report).filter(Report.job_id == job_id).all()
     for rj in reported_jobs:
         db.delete(rj)
 
@@ -185,7 +191,7 @@ def get_all_jobs():
             "salary_range": j.salary_range,
             "employer_id": j.employer_id,
             "category_id": j.category_id,
-            "created_at": j.created_at.isoformat() if j.created_at else None,
+            "created_at": j.created_at,
         }
         for j in jobs
     ]
@@ -202,6 +208,7 @@ def delete_job(job_id):
     try:
         delete_job_internal(job_id, db)
         db.commit()
+        invalidate(f"job:{job_id}", "jobs", "applications")
         return jsonify({"message": f"Job {job_id} deleted successfully"}), 200
     except Exception as e:
         db.rollback()
@@ -215,6 +222,7 @@ def delete_job(job_id):
 # ============================================================
 # 6. GET /admin/skills → List all skills
 # ============================================================
+@cached_response(tags=("skills",))
 def get_all_skills():
     db = SessionLocal()
     skills = db.query(Skill).all()
@@ -237,7 +245,7 @@ def add_skill():
     if not name:
         return jsonify({"error": "Skill name is required"}), 400
 
-    if db.query(Skill).filter(Skill.name.ilike(name)).first():
+    if skill_registry.resolve(db, [name], create=False):
         return jsonify({"error": "Skill already exists"}), 400
 
     new_skill = Skill(name=name)
@@ -245,6 +253,7 @@ def add_skill():
     db.add(new_skill)
     try:
         db.commit()
+        invalidate("skills")
     except IntegrityError:
         db.rollback()
         return jsonify({"error": "Skill already exists"}), 400
@@ -258,9 +267,28 @@ def add_skill():
 # ============================================================
 # 8. DELETE /admin/skills/<id> → Delete skill
 # ============================================================
+def touch_skill_holders(skill_id, db):
+    """Profiles and jobs listing the skill change too (ETag / Last-Modified)"""
+    db.execute(
+        text(
+            "UPDATE users SET updated_at = now() WHERE id IN "
+            "(SELECT user_id FROM user_skills WHERE skill_id = :sid)"
+        ),
+        {"sid": skill_id},
+    )
+    db.execute(
+        text(
+            "UPDATE jobs SET updated_at = now() WHERE id IN "
+            "(SELECT job_id FROM job_skills WHERE skill_id = :sid)"
+        ),
+        {"sid": skill_id},
+    )
+
+
 def delete_skill(skill_id):
     db = SessionLocal()
     try:
+        touch_skill_holders(skill_id, db)
         db.execute(
             text("DELETE FROM user_skills WHERE skill_id = :sid"),
             {"sid": skill_id},
@@ -276,6 +304,8 @@ def delete_skill(skill_id):
 
         db.delete(skill)
         db.commit()
+        skill_registry.forget_ids([skill_id])
+        invalidate("skills", "skill-names")
 
         return jsonify({"message": "Skill deleted successfully"}), 200
 
@@ -307,8 +337,11 @@ def update_skill(skill_id):
         return jsonify({"error": "Missing field: name"}), 400
 
     skill.name = new_name
+    touch_skill_holders(skill_id, db)
     db.commit()
     db.close()
+    skill_registry.forget_ids([skill_id])
+    invalidate("skills", "skill-names")
 
     return jsonify({"message": "Skill updated successfully"}), 200
 
@@ -316,6 +349,7 @@ def update_skill(skill_id):
 # ============================================================
 # 10. GET /admin/categories → List all categories
 # ============================================================
+@cached_response(tags=("categories",))
 def get_all_categories():
     db = SessionLocal()
     categories = db.query(Category).all()
@@ -347,6 +381,7 @@ def add_category():
     db.add(new_category)
     try:
         db.commit()
+        invalidate("categories")
     except IntegrityError:
         db.rollback()
         return jsonify({"error": "Category already exists"}), 400
@@ -377,6 +412,7 @@ def delete_category(category_id):
 
     db.delete(category)
     db.commit()
+    invalidate("categories")
     db.close()
 
     return jsonify({"message": "Category deleted successfully"}), 200
@@ -402,7 +438,12 @@ def update_category(category_id):
         return jsonify({"error": "Missing field: name"}), 400
 
     category.name = new_name
+    # Jobs in the category show its name
+    db.query(Job).filter(Job.category_id == category_id).update(
+        {Job.updated_at: func.now()}, synchronize_session=False
+    )
     db.commit()
+    invalidate("categories")
     db.close()
 
     return jsonify({"message": "Category updated successfully"}), 200
@@ -438,7 +479,7 @@ def getAdmins():
             "id": u.id,
             "full_name": u.full_name,
             "email": u.email,
-            "created_at": u.created_at.isoformat() if u.created_at else None,
+            "created_at": u.created_at,
         }
         for u in admins
     ]
@@ -470,12 +511,13 @@ def create_admin():
         new_admin = User(
             full_name=full_name,
             email=email,
-            password=generate_password_hash(password),
+            password=hash_password(password),
             role="admin",
         )
 
         db.add(new_admin)
         db.commit()
+        invalidate("users")
         db.refresh(new_admin)
 
         return (
@@ -493,6 +535,8 @@ def create_admin():
             201,
         )
 
+    except HasherBusy:
+        return busy_response()
     except Exception as e:
         db.rollback()
         return jsonify({"error": str(e)}), 500
@@ -552,6 +596,7 @@ def delete_admin(admin_id, current_user=None):
 
         db.delete(admin)
         db.commit()
+        invalidate(f"user:{admin_id}", "users")
 
         return jsonify(
             {"message": f"Admin {admin_id} deleted successfully"}
@@ -578,7 +623,7 @@ def get_all_delete_requests():
             data.append({
                 "id": dr.id,
                 "reason": dr.reason,
-                "created_at": dr.created_at.isoformat() if dr.created_at else None,
+                "created_at": dr.created_at,
                 "user": {
                     "id": dr.user.id,
                     "full_name": dr.user.full_name,
@@ -603,16 +648,16 @@ def get_all_delete_requests():
 def get_reported_jobs():
     db = SessionLocal()
     try:
-        reported_jobs = db.query(ReportedJob).options(
-            joinedload(ReportedJob.user),
-            joinedload(ReportedJob.job)
+        reported_jobs = db.query(Report).options(
+            joinedload(Report.user),
+            joinedload(Report.job)
         ).all()
 
         data = [
             {
                 "id": rj.id,
                 "reason": rj.reason,
-                "created_at": rj.created_at.isoformat() if rj.created_at else None,
+                "created_at": rj.created_at,
                 "user": {
                     "id": rj.user.id,
                     "full_name": getattr(rj.user, "full_name", None),
@@ -640,6 +685,7 @@ def get_reported_jobs():
 # ============================================================
 # 18. GET /admin/stats → Get dashboard stats
 # ============================================================
+@cached_response(tags=("users", "jobs", "applications"))
 def get_dashboard_data(days: int = 90):
     db = SessionLocal()
     try:
@@ -683,6 +729,7 @@ def get_dashboard_data(days: int = 90):
 # ============================================================
 # 19. GET /admin/user-roles → Get pie chart user-roles
 # ============================================================
+@cached_response(tags=("users",))
 def user_roles_chart():
     db = SessionLocal()
     try:
@@ -710,6 +757,7 @@ def user_roles_chart():
 # ============================================================
 # 20. GET /admin/delete-requests-chart → Get pie chart user-roles
 # ============================================================
+@cached_response(tags=("delete_requests",))
 def delete_requests_chart():
     db = SessionLocal()
     try:
@@ -742,6 +790,7 @@ def delete_requests_chart():
 # ============================================================
 # 21. GET /admin/jobs-per-category → Get pie chart jobs per category
 # ============================================================
+@cached_response(tags=("jobs", "categories"))
 def jobs_per_category_chart():
     db = SessionLocal()
     try:
@@ -783,6 +832,7 @@ def jobs_per_category_chart():
 # ============================================================
 # 22. GET /admin/app-status-chart → Get applications status chart
 # ============================================================
+@cached_response(tags=("applications",))
 def application_status_chart():
     db = SessionLocal()
     try:
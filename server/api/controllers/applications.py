@@ -6,6 +6,7 @@ from core.models import Application, Job, User
 from typing import Optional
 import os
 from datetime import datetime
+from services.cache import invalidate
 
 
 def get_db():
@@ -45,9 +46,7 @@ def get_all_applications():
                     "cv_file_path": app.cv_file_path,
                     "resume_url": app.cv_file_path,
                     "status": app.status,
-                    "applied_at": (
-                        app.applied_at.isoformat() if app.applied_at else None
-                    ),
+                    "applied_at": app.applied_at,
                     "job": (
                         {
                             "id": job.id,
@@ -101,9 +100,7 @@ def get_application(application_id: int):
                     "cv_file_path": app.cv_file_path,
                     "resume_url": app.cv_file_path,
                     "status": app.status,
-                    "applied_at": (
-                        app.applied_at.isoformat() if app.applied_at else None
-                    ),
+                    "applied_at": app.applied_at,
                     "job": (
                         {
                             "id": job.id,
@@ -158,6 +155,7 @@ def update_application(application_id: int):
                 )
 
         db.commit()
+        invalidate("applications")
         db.refresh(app)
 
         return (
@@ -170,9 +168,7 @@ def update_application(application_id: int):
                     "cover_letter": app.cover_letter,
                     "cv_file_path": app.cv_file_path,
                     "status": app.status,
-                    "applied_at": (
-                        app.applied_at.isoformat() if app.applied_at else None
-                    ),
+                    "applied_at": app.applied_at,
                 }
             ),
             200,
@@ -1,14 +1,28 @@
 from flask import request, jsonify, redirect, session
-from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, timedelta
 import jwt
 from dotenv import load_dotenv
 from config.db import SessionLocal
 from core.models import User, DeleteRequest
-from google_auth_oauthlib.flow import Flow
 import os
-import requests
 from middlewares.auth import is_auth
+from middlewares.ratelimit import by_email, rate_limit
+from services.images import thumbnail_urls
+from services.cache import invalidate
+from services.oauth import (
+    GOOGLE_AUTH_URL,
+    GOOGLE_TOKEN_URL,
+    OAuthError,
+    exchange_code,
+    verify_id_token,
+)
+from services.passwords import (
+    HasherBusy,
+    busy_response,
+    hash_password,
+    needs_rehash,
+    verify_password,
+)
 
 load_dotenv()
 SECRET_KEY = os.getenv("JWT_SECRET")
@@ -40,6 +54,9 @@ def get_db():
 
 
 def google_login():
+    # google-auth / oauthlib are slow to import and only needed here
+    from google_auth_oauthlib.flow import Flow
+
     # Ensure redirect URI is set (must point to Next.js frontend, not Flask backend)
     redirect_uri = (
         GOOGLE_REDIRECT_URI or "http://localhost:3000/api/auth/google/callback"
@@ -51,8 +68,8 @@ def google_login():
                 "client_id": GOOGLE_CLIENT_ID,
                 "client_secret": GOOGLE_CLIENT_SECRET,
                 "redirect_uris": [redirect_uri],
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
+                "auth_uri": GOOGLE_AUTH_URL,
+                "token_uri": GOOGLE_TOKEN_URL,
             }
         },
         scopes=["openid", "email", "profile"],
@@ -69,33 +86,28 @@ def google_login():
 
 
 def google_callback():
+    from requests import RequestException
+
     code = request.args.get("code")
     if not code:
         return jsonify({"error": "Missing authorization code"}), 400
 
-    token_url = "https://oauth2.googleapis.com/token"
     redirect_uri = (
         GOOGLE_REDIRECT_URI or "http://localhost:3000/api/auth/google/callback"
     )
 
-    token_data = {
-        "code": code,
-        "client_id": GOOGLE_CLIENT_ID,
-        "client_secret": GOOGLE_CLIENT_SECRET,
-        "redirect_uri": redirect_uri,
-        "grant_type": "authorization_code",
-    }
-
-    token_res = requests.post(token_url, data=token_data).json()
-    access_token = token_res.get("access_token")
-
-    if not access_token:
-        return jsonify({"error": "Token exchange failed", "details": token_res}), 400
-
-    user_info = requests.get(
-        "https://www.googleapis.com/oauth2/v2/userinfo",
-        headers={"Authorization": f"Bearer {access_token}"},
-    ).json()
+    # The ID token in the exchange response carries the profile: verified
+    # here against Google's cached keys instead of calling userinfo
+    try:
+        tokens = exchange_code(
+            code, GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET, redirect_uri
+        )
+        user_info = verify_id_token(tokens["id_token"], GOOGLE_CLIENT_ID)
+    except OAuthError as e:
+        return jsonify({"error": str(e), "details": e.details}), 400
+    except RequestException as e:
+        print(f"Google OAuth unreachable: {e}")
+        return jsonify({"error": "Google sign in is unavailable, try again"}), 502
 
     email = user_info.get("email")
     if not email:
@@ -118,10 +130,12 @@ def google_callback():
             )
             db.add(user)
             db.commit()
+            invalidate("users")
             db.refresh(user)
         else:
             user.image = picture
             db.commit()
+            invalidate(f"user:{user.id}")
 
         token = jwt.encode(
             {"id": user.id, "exp": datetime.utcnow() + timedelta(hours=24)},
@@ -172,6 +186,7 @@ def get_current_user():
                 "email": user.email,
                 "role": user.role,
                 "image": user.image,
+                "thumbnails": thumbnail_urls(user.image),
                 "headLine": user.headLine,
                 "github_url": user.github_url,
                 "website": user.webSite,
@@ -198,6 +213,7 @@ def logout():
     return jsonify({"message": "Logged out"})
 
 
+@rate_limit("signup", "10/hour")
 def signup():
     data = request.json
     name = data.get("full_name")
@@ -213,13 +229,14 @@ def signup():
         if db.query(User).filter_by(email=email).first():
             return jsonify({"error": "Email already exists"}), 400
 
-        password_hash = generate_password_hash(password)
+        password_hash = hash_password(password)
         new_user = User(
             full_name=name, email=email, password=password_hash, role=role, image=None
         )
 
         db.add(new_user)
         db.commit()
+        invalidate("users")
         db.refresh(new_user)
 
         token = jwt.encode(
@@ -240,12 +257,20 @@ def signup():
                 },
             }
         )
+    except HasherBusy:
+        return busy_response()
     finally:
         db.close()
 
 
+@rate_limit("login", "20/minute")
+# Only wrong passwords count, and more of them than one IP may try, so
+# guessing from one place can't lock the owner out of their account
+@rate_limit("login-account", "30/minute", key=by_email, failures_only=True)
 def login():
-    data = request.json
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Invalid email or password"}), 400
     email = data.get("email")
     password = data.get("password")
     db = SessionLocal()
@@ -267,9 +292,14 @@ def login():
             )
 
         # Verify password hash
-        if not check_password_hash(user.password, password):
+        if not verify_password(user.password, password):
             return jsonify({"error": "Invalid email or password"}), 400
 
+        # Hashed with an older method / cost: upgrade while we know the password
+        if needs_rehash(user.password):
+            user.password = hash_password(password)
+            db.commit()
+
         token = jwt.encode(
             {"id": user.id,"role": user.role, "exp": datetime.utcnow() + timedelta(hours=24)},
             JWT_SECRET,
@@ -288,6 +318,8 @@ def login():
                 },
             }
         )
+    except HasherBusy:
+        return busy_response()
     finally:
         db.close()
 
@@ -314,14 +346,16 @@ def update_password():
         if not user:
             return jsonify({"message": "User not found."}), 404
 
-        if not check_password_hash(user.password, current_password):
+        if not verify_password(user.password, current_password):
             return jsonify({"message": "Current password is incorrect."}), 400
 
-        user.password = generate_password_hash(new_password)
+        user.password = hash_password(new_password)
         db.commit()
 
         return jsonify({"message": "Password updated successfully!"}), 200
 
+    except HasherBusy:
+        return busy_response()
     except Exception as e:
         db.rollback()
         return jsonify({"message": str(e)}), 500
@@ -347,6 +381,7 @@ def delete_account_request():
         delete_request = DeleteRequest(user_id=user_id, reason=reason.strip())
         db.add(delete_request)
         db.commit()
+        invalidate("delete_requests")
 
         return jsonify({"message": "Delete request submitted successfully!"}), 200
 
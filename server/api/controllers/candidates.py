@@ -2,11 +2,21 @@ from flask import request, jsonify
 from werkzeug.utils import secure_filename
 from sqlalchemy.orm import Session
 from config.db import SessionLocal
-from core.models import User, SavedJob, Education, Experience, Skill, user_skills
+from core.models import Job, User, SavedJob, Education, Experience, Skill, user_skills
 import os
 from datetime import datetime
 from middlewares.auth import is_auth 
+from services.uploads import save_content_addressed
+from services.images import schedule_thumbnails, thumbnail_url, thumbnail_urls
+from services.resumes import schedule_resume_indexing
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from services.skill_registry import skill_registry
+from services.cache import cached_response, invalidate
+from services.conditional import conditional
+from controllers.utils import get_pagination, profile_validators, touch_user
+from controllers.job import JOB_FIELDS, job_fields, job_to_dict
+from services.geo import geo_columns
 
 def get_db():
     db = SessionLocal()
@@ -18,6 +28,8 @@ def get_db():
 
 
 # Unified public user endpoint (read‑only, no auth)
+@conditional(profile_validators)
+@cached_response(tags=("user:{user_id}", "skill-names"))
 def get_public_user(user_id: int):
     """Return public profile for any user (candidate or employer)."""
     db = next(get_db())
@@ -32,13 +44,14 @@ def get_public_user(user_id: int):
             "email": user.email,
             "role": user.role,
             "image": user.image,
+            "thumbnails": thumbnail_urls(user.image),
             "location": user.location,
             "bio": user.bio,
             "headline": user.headLine,
             "website": user.webSite,
             "github_url": user.github_url,
             "resume_url": user.resume_url,
-            "created_at": user.created_at.isoformat() if getattr(user, "created_at", None) else None,
+            "created_at": user.created_at,
         }
         # Candidate‑specific data
         if user.role == "candidate":
@@ -49,8 +62,8 @@ def get_public_user(user_id: int):
                     "school_name": e.school_name,
                     "degree": e.degree,
                     "field_of_study": e.field_of_study,
-                    "start_date": e.start_date.isoformat() if e.start_date else None,
-                    "end_date": e.end_date.isoformat() if e.end_date else None,
+                    "start_date": e.start_date,
+                    "end_date": e.end_date,
                     "description": e.description,
                 }
                 for e in user.educations
@@ -60,8 +73,8 @@ def get_public_user(user_id: int):
                     "id": ex.id,
                     "job_title": ex.job_title,
                     "company": ex.company,
-                    "start_date": ex.start_date.isoformat() if ex.start_date else None,
-                    "end_date": ex.end_date.isoformat() if ex.end_date else None,
+                    "start_date": ex.start_date,
+                    "end_date": ex.end_date,
                     "description": ex.description,
                 }
                 for ex in user.experiences
@@ -100,8 +113,8 @@ def get_candidate_career():
                 "school_name": edu.school_name,
                 "degree": edu.degree,
                 "field_of_study": edu.field_of_study,
-                "start_date": edu.start_date.isoformat() if edu.start_date else None,
-                "end_date": edu.end_date.isoformat() if edu.end_date else None,
+                "start_date": edu.start_date,
+                "end_date": edu.end_date,
                 "description": edu.description,
             }
             for edu in user.educations
@@ -113,8 +126,8 @@ def get_candidate_career():
                 "id": exp.id,
                 "job_title": exp.job_title,
                 "company": exp.company,
-                "start_date": exp.start_date.isoformat() if exp.start_date else None,
-                "end_date": exp.end_date.isoformat() if exp.end_date else None,
+                "start_date": exp.start_date,
+                "end_date": exp.end_date,
                 "description": exp.description,
             }
             for exp in user.experiences
@@ -171,6 +184,8 @@ def update_candidate():
             user.phone = data.get("phone")
         if "location" in data:
             user.location = data.get("location")
+            for key, value in geo_columns(user.location).items():
+                setattr(user, key, value)
         if "bio" in data:
             user.bio = data.get("bio")
         if "headLine" in data or "headline" in data:
@@ -186,6 +201,7 @@ def update_candidate():
 
 
         db.commit()
+        invalidate(f"user:{user.id}")
         db.refresh(user)
 
         return (
@@ -262,6 +278,10 @@ def upload_cv(candidate_id: int):
         resume_url = f"/uploads/cvs/{filename}"
         user.resume_url = resume_url
         db.commit()
+        invalidate(f"user:{user.id}")
+
+        # Text extraction and indexing happen off the request path
+        schedule_resume_indexing(filepath, user.id, resume_url)
 
         return (
             jsonify(
@@ -307,20 +327,24 @@ def upload_profile_image(candidate_id: int):
         if ext not in ["png", "jpg", "jpeg", "webp"]:
             return jsonify({"error": "Invalid file type"}), 400
 
+        # Content-addressed name, served with an immutable Cache-Control
         upload_dir = os.path.join(os.getcwd(), "uploads", "profile")
-        os.makedirs(upload_dir, exist_ok=True)
+        saved_name = save_content_addressed(
+            file, upload_dir, prefix=f"user_{candidate_id}", ext=ext
+        )
 
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
-        saved_name = f"user_{candidate_id}_{timestamp}.{ext}"
-        save_path = os.path.join(upload_dir, saved_name)
-        file.save(save_path)
+        schedule_thumbnails(os.path.join(upload_dir, saved_name))
 
         image_url = f"/uploads/profile/{saved_name}"
         user.image = image_url
         db.commit()
+        invalidate(f"user:{user.id}")
         db.refresh(user)
 
-        return jsonify({"image": image_url}), 200
+        return (
+            jsonify({"image": image_url, "thumbnails": thumbnail_urls(image_url)}),
+            200,
+        )
 
     except Exception as e:
         db.rollback()
@@ -330,7 +354,7 @@ def upload_profile_image(candidate_id: int):
 
 
 def get_saved_jobs(candidate_id: int):
-    """Get all saved jobs for a candidate"""
+    """Jobs a candidate saved, most recent first, paginated"""
     db: Session = next(get_db())
 
     try:
@@ -343,48 +367,43 @@ def get_saved_jobs(candidate_id: int):
         if not user:
             return jsonify({"error": "Candidate not found"}), 404
 
-        saved_jobs = db.query(SavedJob).filter(SavedJob.user_id == candidate_id).all()
+        try:
+            page, limit = get_pagination()
+            fields = job_fields()
+        except ValueError as e:  # ProjectionError included
+            return jsonify({"error": str(e)}), 400
+
+        # Jobs come with their save in one query, deleted ones drop out
+        query = (
+            db.query(Job, SavedJob.saved_at)
+            .join(SavedJob, SavedJob.job_id == Job.id)
+            .filter(SavedJob.user_id == candidate_id)
+        )
+        total = query.count()
+        rows = (
+            query.options(*JOB_FIELDS.options(fields))
+            .order_by(SavedJob.saved_at.desc(), SavedJob.id.desc())
+            .offset((page - 1) * limit)
+            .limit(limit)
+            .all()
+        )
 
-        jobs_data = []
-        for saved_job in saved_jobs:
-            job = saved_job.job
-            if job:
-                jobs_data.append(
-                    {
-                        "id": job.id,
-                        "title": job.title,
-                        "description": job.description,
-                        "company_name": job.company_name,
-                        "employer_id": job.employer_id,
-                        "location": job.location,
-                        "salary_min": float(job.salary_min) if job.salary_min else None,
-                        "salary_max": float(job.salary_max) if job.salary_max else None,
-                        "salary_currency": job.salary_currency,
-                        "employment_type": job.employment_type,
-                        "experience_level": job.experience_level,
-                        "skills": job.skills or [],
-                        "requirements": job.requirements,
-                        "benefits": job.benefits,
-                        "application_deadline": (
-                            job.application_deadline.isoformat()
-                            if job.application_deadline
-                            else None
-                        ),
-                        "posted_at": (
-                            job.posted_at.isoformat() if job.posted_at else None
-                        ),
-                        "updated_at": (
-                            job.updated_at.isoformat() if job.updated_at else None
-                        ),
-                        "saved_at": (
-                            saved_job.saved_at.isoformat()
-                            if saved_job.saved_at
-                            else None
-                        ),
-                    }
-                )
+        jobs_data = [
+            {**job_to_dict(job, fields), "saved_at": saved_at} for job, saved_at in rows
+        ]
 
-        return jsonify(jobs_data), 200
+        return (
+            jsonify(
+                {
+                    "jobs": jobs_data,
+                    "total": total,
+                    "page": page,
+                    "limit": limit,
+                    "total_pages": (total + limit - 1) // limit,
+                }
+            ),
+            200,
+        )
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -414,7 +433,9 @@ def add_education():
         )
 
         db.add(education)
+        touch_user(db, user_id)
         db.commit()
+        invalidate(f"user:{user_id}")
         db.refresh(education)
 
         # Return the newly added education
@@ -471,7 +492,9 @@ def update_education(education_id):
         if "description" in data:
             education.description = data["description"]
 
+        touch_user(db, user_id)
         db.commit()
+        invalidate(f"user:{user_id}")
         db.refresh(education)
 
         return jsonify({"message": "Education updated successfully"}), 200
@@ -501,7 +524,9 @@ def delete_education(education_id):
             return jsonify({"error": "Education not found"}), 404
 
         db.delete(education)
+        touch_user(db, user_id)
         db.commit()
+        invalidate(f"user:{user_id}")
 
         return jsonify({"message": "Education deleted successfully"}), 200
 
@@ -533,7 +558,9 @@ def add_experience():
         )
 
         db.add(experience)
+        touch_user(db, user_id)
         db.commit()
+        invalidate(f"user:{user_id}")
         db.refresh(experience)
 
         return jsonify({
@@ -586,7 +613,9 @@ def update_experience(experience_id):
         if "description" in data:
             experience.description = data["description"]
 
+        touch_user(db, user_id)
         db.commit()
+        invalidate(f"user:{user_id}")
         db.refresh(experience)
 
         return jsonify({"message": "Experience updated successfully"}), 200
@@ -617,7 +646,9 @@ def delete_experience(experience_id):
             return jsonify({"error": "Experience not found"}), 404
 
         db.delete(experience)
+        touch_user(db, user_id)
         db.commit()
+        invalidate(f"user:{user_id}")
 
         return jsonify({"message": "Experience deleted successfully"}), 200
 
@@ -666,27 +697,24 @@ def add_skill():
         if not skill_name:
             return jsonify({"message": "Skill name is required"}), 400
 
-        skill = (
-            db.query(Skill)
-            .filter(Skill.name.ilike(skill_name))
-            .first()
-        )
-
-        if not skill:
-            skill = Skill(name=skill_name)
-            db.add(skill)
-            db.commit()
-            db.refresh(skill)
+        skill = skill_registry.get_or_create(db, [skill_name])[0]
 
-        user = db.query(User).filter(User.id == user_id).first()
+        # ON CONFLICT tells us about duplicates without loading user.skills
+        added = db.execute(
+            pg_insert(user_skills)
+            .values(user_id=user_id, skill_id=skill.id)
+            .on_conflict_do_nothing()
+        ).rowcount
 
-        if skill in user.skills:
+        if not added:
+            db.rollback()
             return jsonify({
                 "message": "Skill already added to user"
             }), 400
 
-        user.skills.append(skill)
+        touch_user(db, user_id)
         db.commit()
+        invalidate(f"user:{user_id}", "skills")
 
         return jsonify({
             "message": "Skill added successfully",
@@ -719,7 +747,9 @@ def delete_skill(skill_id):
         # Remove skill from user's skills if exists
         if skill in user.skills:
             user.skills.remove(skill)
+            touch_user(db, user_id)
             db.commit()
+            invalidate(f"user:{user_id}")
 
         # Check if any other users have this skill
         stmt = select(user_skills).where(user_skills.c.skill_id == skill.id)
@@ -727,6 +757,8 @@ def delete_skill(skill_id):
         if len(result) == 0:
             db.delete(skill)
             db.commit()
+            skill_registry.forget_ids([skill_id])
+            invalidate("skills", "skill-names")
 
         return jsonify({"message": "Skill removed successfully"}), 200
 
@@ -803,6 +835,7 @@ def get_random_candidates():
                         "full_name": cand.full_name,
                         "headline": cand.headLine,
                         "image": cand.image,
+                        "thumbnail": thumbnail_url(cand.image),
                         "role": cand.role,
                     }
                     for cand in candidates
@@ -2,6 +2,7 @@ from flask import request, jsonify
 from sqlalchemy.orm import Session
 from config.db import SessionLocal
 from core.models import User, ConnectionRequest, Notification
+from services.images import thumbnail_url
 import jwt
 import os
 
@@ -121,11 +122,12 @@ def get_requests():
                                 "id": req.sender.id,
                                 "full_name": req.sender.full_name,
                                 "image": req.sender.image,
+                                "thumbnail": thumbnail_url(req.sender.image),
                                 "headline": req.sender.headLine,
                                 "role": req.sender.role,
                             },
                             "status": req.status,
-                            "created_at": req.created_at.isoformat(),
+                            "created_at": req.created_at,
                         }
                         for req in received
                     ],
@@ -136,11 +138,12 @@ def get_requests():
                                 "id": req.receiver.id,
                                 "full_name": req.receiver.full_name,
                                 "image": req.receiver.image,
+                                "thumbnail": thumbnail_url(req.receiver.image),
                                 "headline": req.receiver.headLine,
                                 "role": req.receiver.role,
                             },
                             "status": req.status,
-                            "created_at": req.created_at.isoformat(),
+                            "created_at": req.created_at,
                         }
                         for req in sent
                     ],
@@ -297,14 +300,13 @@ def get_connections():
                         "id": other_user.id,
                         "full_name": other_user.full_name,
                         "image": other_user.image,
+                        "thumbnail": thumbnail_url(other_user.image),
                         "headline": getattr(other_user, "headLine", None)
                         or getattr(other_user, "role", "Professional"),
                         "role": other_user.role,
                         "bio": other_user.bio,
                     },
-                    "created_at": (
-                        conn.created_at.isoformat() if conn.created_at else None
-                    ),
+                    "created_at": conn.created_at,
                 }
             )
 
@@ -6,6 +6,12 @@ from sqlalchemy.orm import Session
 from config.db import SessionLocal
 from core.models import User
 from middlewares.auth import is_auth
+from services.uploads import save_content_addressed
+from services.images import schedule_thumbnails, thumbnail_url, thumbnail_urls
+from services.cache import cached_response, invalidate
+from services.conditional import conditional
+from controllers.utils import profile_validators
+from services.geo import geo_columns
 
 def get_db():
     db = SessionLocal()
@@ -15,6 +21,8 @@ def get_db():
         db.close()
 
 
+@conditional(lambda employer_id: profile_validators(employer_id))
+@cached_response(tags=("user:{employer_id}",))
 def get_employer(employer_id: int):
     """Get employer profile"""
     db: Session = next(get_db())
@@ -42,6 +50,7 @@ def get_employer(employer_id: int):
                     "company_name": user.companyName,
                     "website": user.webSite,
                     "image": user.image,
+                    "thumbnails": thumbnail_urls(user.image),
                     "user": {
                         "id": user.id,
                         "full_name": user.full_name,
@@ -92,6 +101,8 @@ def update_employer():
             user.phone = data.get("phone")
         if "location" in data:
             user.location = data.get("location")
+            for key, value in geo_columns(user.location).items():
+                setattr(user, key, value)
         if "headLine" in data or "headline" in data:
             user.headLine = data.get("headLine") or data.get("headline")
         if "bio" in data:
@@ -102,6 +113,7 @@ def update_employer():
             user.webSite = data.get("website")
 
         db.commit()
+        invalidate(f"user:{user.id}")
         db.refresh(user)
 
         return (
@@ -155,20 +167,24 @@ def upload_profile_image(employer_id: int):
         if ext not in ["png", "jpg", "jpeg", "webp"]:
             return jsonify({"error": "Invalid file type"}), 400
 
+        # Content-addressed name, served with an immutable Cache-Control
         upload_dir = os.path.join(os.getcwd(), "uploads", "profile")
-        os.makedirs(upload_dir, exist_ok=True)
+        saved_name = save_content_addressed(
+            file, upload_dir, prefix=f"user_{employer_id}", ext=ext
+        )
 
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
-        saved_name = f"user_{employer_id}_{timestamp}.{ext}"
-        save_path = os.path.join(upload_dir, saved_name)
-        file.save(save_path)
+        schedule_thumbnails(os.path.join(upload_dir, saved_name))
 
         image_url = f"/uploads/profile/{saved_name}"
         user.image = image_url
         db.commit()
+        invalidate(f"user:{user.id}")
         db.refresh(user)
 
-        return jsonify({"image": image_url}), 200
+        return (
+            jsonify({"image": image_url, "thumbnails": thumbnail_urls(image_url)}),
+            200,
+        )
 
     except Exception as e:
         db.rollback()
@@ -227,6 +243,7 @@ def get_random_employers():
                         "full_name": emp.full_name,
                         "company_name": emp.companyName,
                         "image": emp.image,
+                        "thumbnail": thumbnail_url(emp.image),
                         "role": emp.role,
                     }
                     for emp in employers
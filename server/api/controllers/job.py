@@ -4,23 +4,34 @@ from sqlalchemy import or_, and_
 from sqlalchemy.orm import Session
 from config.db import SessionLocal
 from core.models import (
+    Category,
     Job,
     User,
     SavedJob,
     Application,
     Skill,
     job_skills,
+    job_applicants,
     Notification,
     Report,
 )
 from controllers.utils import get_user_id_from_token
 from typing import Optional, List
-from decimal import Decimal
 from datetime import datetime
 import os
 from middlewares.auth import is_auth
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from services.images import thumbnail_url
+from services.resumes import schedule_resume_indexing
+from services.job_import import parse_rows, import_jobs
+from services.skill_registry import skill_registry
+from services.fanout import schedule_job_fanout
+from services.cache import add_tags, cached_response, cached_value, invalidate
+from services.conditional import conditional
+from services.projection import Field, Projection, ProjectionError, column
+from services.geo import distance_km, geo_columns, search_point, within
+from services.salary import MAX_SALARY, salary_columns
+from sqlalchemy.orm import Session, selectinload, with_expression
+from sqlalchemy import desc, func, literal_column, select, tuple_
 
 def get_db():
     db = SessionLocal()
@@ -50,24 +61,44 @@ def get_jobs_for_user():
 
         
         print(user_skill_ids)
-        user_location = user.location or ""
 
         jobs_query = db.query(Job)
 
-        # if user_location:
-        #     jobs_query = jobs_query.filter(Job.location.ilike(f"%{user_location}%"))
-
         if user_skill_ids:
             jobs_query = jobs_query.join(Job.skills).filter(Job.skills.any(Skill.id.in_(user_skill_ids)))
 
-        
+        options = [
+            selectinload(Job.category),
+            selectinload(Job.skills),
+            selectinload(Job.employer).load_only(
+                User.full_name, User.image, User.headLine
+            ),
+            with_expression(Job.applicants_count, APPLICANTS_COUNT),
+        ]
+
+        # Nearest jobs first when the user's location geocoded, ?radius=<km>
+        # leaves out the ones further away
+        if user.latitude is not None:
+            distance = distance_km(Job, user.latitude, user.longitude)
+            options.append(with_expression(Job.distance_km, distance))
+            radius = request.args.get("radius", type=float)
+            if radius:
+                jobs_query = jobs_query.filter(
+                    *within(Job, user.latitude, user.longitude, radius)
+                )
+            jobs_query = jobs_query.order_by(distance.asc().nulls_last())
 
         jobs_query = jobs_query.order_by(desc(Job.created_at))
 
         total_jobs = jobs_query.count()
         total_pages = (total_jobs + page_size - 1) // page_size
         
-        jobs = jobs_query.offset((page - 1) * page_size).limit(page_size).all()
+        jobs = (
+            jobs_query.options(*options)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
 
         results = []
         for job in jobs:
@@ -82,16 +113,22 @@ def get_jobs_for_user():
                 "description": job.description,
                 "responsibilities": job.responsibilities or [],
                 "skills": [skill.name for skill in job.skills],
-                "created_at": job.created_at.isoformat() if job.created_at else None,
+                "created_at": job.created_at,
                 "employer": {
                     "id": job.employer.id,
                     "full_name": job.employer.full_name,
                     "image": job.employer.image,
+                    "thumbnail": thumbnail_url(job.employer.image),
                     "headline": getattr(job.employer, "headLine", ""),
                 },
-                "applicants": len(job.applicants),
+                "applicants": _applicants_count(job),
+                "distance_km": (
+                    round(job.distance_km, 1) if job.distance_km is not None else None
+                ),
             })
 
+        add_viewer_state(db, jobs, results, user_id)
+
         
         return jsonify({
             "jobs": results,
@@ -106,62 +143,197 @@ def get_jobs_for_user():
         db.close()
 
 
+# Seconds facet counts of a search are reused, new jobs show up after that
+FACET_CACHE_TTL = int(os.getenv("FACET_CACHE_TTL", 60))
+# Only the most common locations are counted in the facets
+FACET_LOCATIONS = int(os.getenv("FACET_LOCATIONS", 20))
+
+
+def job_search_filters(point: tuple = None) -> list:
+    """
+    WHERE criteria of a job search from the query string, plus jobs within
+    the radius of `point` (search_point()) when there is one. Raises
+    ValueError for salary bounds that can't be searched.
+    """
+    search = request.args.get("search", "").strip()
+    location = request.args.get("location", "").strip()
+    # Salary bounds wanted, jobs whose range overlaps them match
+    salary_min = request.args.get("salary_min", type=int)
+    salary_max = request.args.get("salary_max", type=int)
+    currency = request.args.get("currency", "").strip().upper()
+    emp_types = request.args.get(
+        "emp_type", request.args.get("employment_type", "")
+    ).split(",")
+    emp_types = [t.strip() for t in emp_types if t.strip()]
+    category = request.args.get("category", "").strip()
+    skill = request.args.get("skill", "").strip()
+
+    for bound in (salary_min, salary_max):
+        if bound is not None and not 0 <= bound <= MAX_SALARY:
+            raise ValueError(f"salary_min and salary_max must be 0 to {MAX_SALARY}")
+    if salary_min is not None and salary_max is not None and salary_min > salary_max:
+        raise ValueError("salary_min can't be above salary_max")
+
+    criteria = []
+
+    if search:
+        criteria.append(
+            or_(
+                Job.title.ilike(f"%{search}%"),
+                Job.description.ilike(f"%{search}%"),
+                Job.company.ilike(f"%{search}%"),
+            )
+        )
+
+    if location:
+        criteria.append(Job.location.ilike(f"%{location}%"))
+
+    if salary_min is not None or salary_max is not None:
+        # Same expression as ix_jobs_salary_span, unparsed salaries excluded
+        wanted = func.int4range(salary_min, salary_max, literal_column("'[]'"))
+        criteria.append(Job.salary_currency.isnot(None))
+        criteria.append(Job.salary_span().op("&&")(wanted))
+
+    if currency:
+        criteria.append(Job.salary_currency == currency)
+
+    if emp_types:
+        criteria.append(Job.emp_type.in_(emp_types))
+
+    if category.isdigit():
+        criteria.append(Job.category_id == int(category))
+    elif category:
+        criteria.append(Job.category.has(func.lower(Category.name) == category.lower()))
+
+    if skill:
+        criteria.append(Job.skills.any(func.lower(Skill.name) == skill.lower()))
+
+    if point:
+        criteria.extend(within(Job, *point))
+
+    return criteria
+
+
+def job_facets(db: Session, criteria: list) -> dict:
+    """
+    Counts of the matching jobs by category, employment type and location,
+    plus their total, in one GROUPING SETS query.
+    """
+    grouping = func.grouping(Job.category_id, Job.emp_type, Job.location)
+    rows = db.execute(
+        select(
+            Job.category_id,
+            Category.name,
+            Job.emp_type,
+            Job.location,
+            grouping,
+            func.count(),
+        )
+        .select_from(Job)
+        .outerjoin(Category, Category.id == Job.category_id)
+        .where(*criteria)
+        .group_by(
+            func.grouping_sets(
+                tuple_(Job.category_id, Category.name),
+                tuple_(Job.emp_type),
+                tuple_(Job.location),
+                tuple_(),
+            )
+        )
+    ).all()
+
+    # grouping() has a bit set for each column the row is not grouped by
+    facets = {"category": [], "emp_type": [], "location": []}
+    total = 0
+    for category_id, category_name, emp_type, location, bits, count in rows:
+        if bits == 0b011:
+            facets["category"].append(
+                {"id": category_id, "name": category_name, "count": count}
+            )
+        elif bits == 0b101:
+            facets["emp_type"].append({"value": emp_type, "count": count})
+        elif bits == 0b110:
+            facets["location"].append({"value": location, "count": count})
+        else:
+            total = count
+
+    for values in facets.values():
+        values.sort(key=lambda v: -v["count"])
+    facets["location"] = facets["location"][:FACET_LOCATIONS]
+    return {"total": total, "facets": facets}
+
+
 def search_jobs():
-    """Search and filter jobs"""
+    """Search and filter jobs, with facet counts when ?facets=true"""
     db: Session = next(get_db())
 
     try:
-        search = request.args.get("search", "").strip()
-        location = request.args.get("location", "").strip()
-        salary_min = request.args.get("salary_min")
-        skill = request.args.get("skill", "").strip()
         page = int(request.args.get("page", 1))
         limit = int(request.args.get("limit", 10))
+        with_facets = request.args.get("facets", "").lower() in ("1", "true")
 
-        query = db.query(Job)
-
-        if search:
-            search_filter = or_(
-                Job.title.ilike(f"%{search}%"),
-                Job.description.ilike(f"%{search}%"),
-                Job.company_name.ilike(f"%{search}%"),
+        try:
+            fields = job_fields()
+            point = search_point(request.args)
+            criteria = job_search_filters(point)
+        except ValueError as e:  # ProjectionError, GeoError, bad salary bounds
+            return jsonify({"error": str(e)}), 400
+
+        query = db.query(Job).filter(*criteria)
+
+        if with_facets:
+            # The same filters share counts for a while, whatever the page
+            filters = sorted(
+                (k, v)
+                for k, v in request.args.items(multi=True)
+                if k not in ("page", "limit", "fields", "facets")
             )
-            query = query.filter(search_filter)
-
-        if location:
-            query = query.filter(Job.location.ilike(f"%{location}%"))
-
-        if salary_min:
-            try:
-                min_salary = Decimal(salary_min)
-                query = query.filter(Job.salary_min >= min_salary)
-            except (ValueError, TypeError):
-                pass
+            counted = cached_value(
+                f"job-facets:{filters}",
+                lambda: job_facets(db, criteria),
+                tags=("jobs", "categories"),
+                ttl=FACET_CACHE_TTL,
+            )
+            total = counted["total"]
+        else:
+            total = query.count()
 
-        if skill:
-            query = query.filter(Job.skills.contains([skill]))
-
-        total = query.count()
+        options = JOB_FIELDS.options(fields)
+        order = [Job.created_at.desc(), Job.id.desc()]
+        if point:
+            # Nearest first around the searched place
+            distance = distance_km(Job, point[0], point[1])
+            options.append(with_expression(Job.distance_km, distance))
+            order.insert(0, distance)
 
         offset = (page - 1) * limit
-        jobs = query.order_by(Job.posted_at.desc()).offset(offset).limit(limit).all()
+        jobs = (
+            query.options(*options)
+            .order_by(*order)
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
 
         total_pages = (total + limit - 1) // limit
 
-        jobs_data = [job_to_dict(job) for job in jobs]
+        jobs_data = [job_to_dict(job, fields) for job in jobs]
+        if point:
+            for job, data in zip(jobs, jobs_data):
+                data["distance_km"] = round(job.distance_km, 1)
+        add_viewer_state(db, jobs, jobs_data)
+
+        result = {
+            "jobs": jobs_data,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "total_pages": total_pages,
+        }
+        if with_facets:
+            result["facets"] = counted["facets"]
 
-        return (
-            jsonify(
-                {
-                    "jobs": jobs_data,
-                    "total": total,
-                    "page": page,
-                    "limit": limit,
-                    "total_pages": total_pages,
-                }
-            ),
-            200,
-        )
+        return jsonify(result), 200
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -169,16 +341,95 @@ def search_jobs():
         db.close()
 
 
+def job_validators(job_id: int):
+    """ETag parts / Last-Modified of a job page, without loading the job"""
+    db: Session = next(get_db())
+    try:
+        applicants = (
+            select(func.count())
+            .select_from(job_applicants)
+            .where(job_applicants.c.job_id == job_id)
+            .scalar_subquery()
+        )
+        last_applied = (
+            select(func.max(Application.applied_at))
+            .where(Application.job_id == job_id)
+            .scalar_subquery()
+        )
+        row = (
+            db.query(Job.updated_at, User.updated_at, last_applied, applicants)
+            .outerjoin(User, User.id == Job.employer_id)
+            .filter(Job.id == job_id)
+            .first()
+        )
+        if row is None:
+            return None
+        return (job_id, *row), max(filter(None, row[:3]), default=None)
+    finally:
+        db.close()
+
+
+def employer_jobs_validators():
+    """Same for the caller's job list: their jobs, profile and applicants"""
+    try:
+        user_id = get_user_id_from_token()
+    except ValueError:
+        return None
+
+    db: Session = next(get_db())
+    try:
+        employer_updated_at = (
+            select(User.updated_at).where(User.id == user_id).scalar_subquery()
+        )
+        applicants = (
+            select(func.count())
+            .select_from(job_applicants)
+            .join(Job, Job.id == job_applicants.c.job_id)
+            .where(Job.employer_id == user_id)
+            .scalar_subquery()
+        )
+        last_applied = (
+            select(func.max(Application.applied_at))
+            .join(Job, Job.id == Application.job_id)
+            .where(Job.employer_id == user_id)
+            .scalar_subquery()
+        )
+        row = (
+            db.query(
+                func.count(Job.id),
+                func.max(Job.updated_at),
+                employer_updated_at,
+                last_applied,
+                applicants,
+            )
+            .filter(Job.employer_id == user_id)
+            .one()
+        )
+        return (user_id, *row), max(filter(None, row[1:4]), default=None)
+    finally:
+        db.close()
+
+
+@conditional(job_validators)
+@cached_response(tags=("job:{job_id}", "skill-names", "categories"))
 def get_job_by_id(job_id: int):
     """Get a single job by ID"""
     db: Session = next(get_db())
 
     try:
-        job = db.query(Job).filter(Job.id == job_id).first()
+        job = (
+            db.query(Job)
+            .options(*JOB_FIELDS.options(JOB_FIELDS.default))
+            .filter(Job.id == job_id)
+            .first()
+        )
 
         if not job:
             return jsonify({"error": "Job not found"}), 404
 
+        # Embeds the employer's name and picture
+        add_tags(f"user:{job.employer_id}")
+
         return jsonify(job_to_dict(job)), 200
 
     except Exception as e:
@@ -266,11 +517,9 @@ def create_job():
 
         # Handle skill_names (create new skills if they don't exist)
         if skill_names:
-            for skill_name in skill_names:
-                if skill_name.strip():
-                    skill = create_skill_if_not_exists(skill_name, db)
-                    if skill not in job_skills:
-                        job_skills.append(skill)
+            for skill in skill_registry.get_or_create(db, skill_names):
+                if skill not in job_skills:
+                    job_skills.append(skill)
 
         # Create new job
         job = Job(
@@ -279,7 +528,9 @@ def create_job():
             company=data.get("company", employer.companyName or ""),
             employer_id=employer.id,
             location=data.get("location"),
+            **geo_columns(data.get("location")),
             salary_range=data.get("salary_range"),
+            **salary_columns(data.get("salary_range")),
             emp_type=data.get("employment_type"),
             responsibilities=data.get("responsibilities"),
             created_at=datetime.utcnow(),
@@ -295,6 +546,8 @@ def create_job():
 
         db.add(job)
         db.commit()
+        invalidate("jobs", "skills")
+        schedule_job_fanout([job.id])
         db.refresh(job)
 
         return jsonify(job_to_dict(job)), 201
@@ -306,6 +559,61 @@ def create_job():
         db.close()
 
 
+def create_jobs_bulk():
+    """Create many job postings from an NDJSON or CSV payload"""
+    db: Session = next(get_db())
+
+    try:
+        try:
+            user_id = get_user_id_from_token()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 401
+
+        employer = db.query(User).filter(User.id == user_id).first()
+        if not employer:
+            return jsonify({"error": "User not found"}), 404
+
+        if employer.role != "employer":
+            return (
+                jsonify(
+                    {
+                        "error": "Only employers can post jobs",
+                        "current_role": employer.role,
+                    }
+                ),
+                403,
+            )
+
+        rows = parse_rows(request.get_data(), request.mimetype)
+        if not rows:
+            return (
+                jsonify(
+                    {
+                        "error": "No rows to import",
+                        "hint": "Send application/x-ndjson (one job per line) or text/csv",
+                    }
+                ),
+                400,
+            )
+
+        try:
+            result = import_jobs(db, employer, rows)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 413
+
+        db.commit()
+        invalidate("jobs", "skills")
+        schedule_job_fanout(result["job_ids"])
+
+        return jsonify(result), 201 if result["created"] else 400
+
+    except Exception as e:
+        db.rollback()
+        return jsonify({"error": str(e)}), 500
+    finally:
+        db.close()
+
+
 def update_job(job_id: int):
     """Update an existing job"""
     db: Session = next(get_db())
@@ -336,8 +644,12 @@ def update_job(job_id: int):
             job.company = data["company"]
         if "location" in data:
             job.location = data["location"]
+            for key, value in geo_columns(job.location).items():
+                setattr(job, key, value)
         if "salary_range" in data:
             job.salary_range = data["salary_range"]
+            for key, value in salary_columns(job.salary_range).items():
+                setattr(job, key, value)
         if "emp_type" in data:
             job.emp_type = data["emp_type"]
         if "responsibilities" in data:
@@ -387,6 +699,7 @@ def update_job(job_id: int):
 
         job.updated_at = datetime.utcnow()
         db.commit()
+        invalidate(f"job:{job_id}", "jobs")
         db.refresh(job)
 
         return jsonify(job_to_dict(job)), 200
@@ -420,6 +733,7 @@ def delete_job(job_id: int):
 
         db.delete(job)
         db.commit()
+        invalidate(f"job:{job_id}", "jobs")
 
         return jsonify({"message": "Job deleted successfully"}), 200
 
@@ -588,8 +902,14 @@ def apply_to_job(job_id: int):
             db.add(notification)
 
         db.commit()
+        invalidate(f"job:{job_id}", "applications")
         db.refresh(application)
 
+        if cv_file_path:
+            schedule_resume_indexing(
+                filepath, user_id, cv_file_path, application_id=application.id
+            )
+
         return (
             jsonify(
                 {
@@ -648,6 +968,7 @@ def report_job(job_id: int):
         db.close()
 
 
+@conditional(employer_jobs_validators, private=True)
 def get_employer_jobs():
     """Get all jobs created by the authenticated employer"""
     db: Session = next(get_db())
@@ -676,6 +997,11 @@ def get_employer_jobs():
         sort = request.args.get("sort", "created_at")  # created_at or title
         order = request.args.get("order", "desc")  # asc or desc
 
+        try:
+            fields = job_fields()
+        except ProjectionError as e:
+            return jsonify({"error": str(e)}), 400
+
         # Build query for jobs by this employer
         query = db.query(Job).filter(Job.employer_id == user_id)
 
@@ -693,14 +1019,19 @@ def get_employer_jobs():
         # Get total count
         total = query.count()
 
-        # Apply pagination
+        # Apply pagination, loading only what the fields need
         offset = (page - 1) * limit
-        jobs = query.offset(offset).limit(limit).all()
+        jobs = (
+            query.options(*JOB_FIELDS.options(fields))
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
 
         # Calculate total pages
         total_pages = (total + limit - 1) // limit
 
-        jobs_data = [job_to_dict(job) for job in jobs]
+        jobs_data = [job_to_dict(job, fields) for job in jobs]
 
         return (
             jsonify(
@@ -721,40 +1052,135 @@ def get_employer_jobs():
         db.close()
 
 
-def job_to_dict(job: Job) -> dict:
+# Counted in SQL for the jobs of a page instead of loading every applicant
+APPLICANTS_COUNT = (
+    select(func.count())
+    .select_from(job_applicants)
+    .where(job_applicants.c.job_id == Job.id)
+    .correlate(Job)
+    .scalar_subquery()
+)
+
+
+def _employer_card(job: Job) -> Optional[dict]:
+    employer = job.employer
+    if employer is None:
+        return None
+    return {
+        "id": employer.id,
+        "full_name": employer.full_name,
+        "email": employer.email,
+        "role": employer.role,
+        "headLine": employer.headLine,
+        "image": employer.image,
+        "thumbnail": thumbnail_url(employer.image),
+    }
+
+
+def _applicants_count(job: Job) -> int:
+    if job.applicants_count is not None:
+        return job.applicants_count
+    return len(job.applicants) if job.applicants else 0
+
+
+# ?fields= of the job list endpoints, e.g. fields=id,title,employer,created_at
+JOB_FIELDS = Projection(
+    {
+        "id": column(Job.id),
+        "title": column(Job.title),
+        "description": column(Job.description),
+        "company": column(Job.company),
+        "employer_id": column(Job.employer_id),
+        "employer": Field(
+            _employer_card,
+            columns=(Job.employer_id,),
+            loads=(
+                selectinload(Job.employer).load_only(
+                    User.full_name, User.email, User.role, User.headLine, User.image
+                ),
+            ),
+        ),
+        "location": column(Job.location),
+        "category": Field(
+            lambda job: job.category.name if job.category else None,
+            columns=(Job.category_id,),
+            loads=(selectinload(Job.category),),
+        ),
+        "salary_range": column(Job.salary_range),
+        "salary_min": column(Job.salary_min),
+        "salary_max": column(Job.salary_max),
+        "salary_currency": column(Job.salary_currency),
+        "emp_type": column(Job.emp_type),
+        "responsibilities": column(Job.responsibilities),
+        "skills": Field(
+            lambda job: [{"id": s.id, "name": s.name} for s in job.skills],
+            loads=(selectinload(Job.skills),),
+        ),
+        "created_at": column(Job.created_at),
+        "updated_at": column(Job.updated_at),
+        "applicants_count": Field(
+            _applicants_count,
+            loads=(with_expression(Job.applicants_count, APPLICANTS_COUNT),),
+        ),
+    },
+    always=(Job.id,),
+)
+
+
+def job_fields():
+    """Requested job fields, raises ProjectionError for unknown ones"""
+    return JOB_FIELDS.parse(request.args.get("fields"))
+
+
+def job_to_dict(job: Job, fields=JOB_FIELDS.default) -> dict:
     """Convert Job model to dictionary"""
-    employer = getattr(job, "employer", None)
-    category = getattr(job, "category", None)
+    return JOB_FIELDS.dump(job, fields)
+
+
+def viewer_state(db: Session, user_id: int, job_ids) -> dict:
+    """
+    {job_id: {"saved": ..., "applied": ..., "reported": ...}} for the given
+    user: one membership query per flag, whatever the number of jobs.
+    """
+    job_ids = list(set(job_ids))
+    if not job_ids:
+        return {}
+
+    found = {}
+    for flag, model in (
+        ("saved", SavedJob),
+        ("applied", Application),
+        ("reported", Report),
+    ):
+        query = select(model.job_id).where(
+            model.user_id == user_id, model.job_id.in_(job_ids)
+        )
+        found[flag] = set(db.scalars(query))
     return {
-        "id": job.id,
-        "title": job.title,
-        "description": job.description,
-        "company": job.company,
-        "employer_id": job.employer_id,
-        "employer": {
-            "id": employer.id if employer else None,
-            "full_name": getattr(employer, "full_name", None) if employer else None,
-            "email": getattr(employer, "email", None) if employer else None,
-            "role": getattr(employer, "role", None) if employer else None,
-            "headLine": getattr(employer, "headLine", None) if employer else None,
-            "image": getattr(employer, "image", None) if employer else None,
-        }
-        if employer
-        else None,
-        "location": job.location,
-        "category": category.name if category else None,
-        "salary_range": job.salary_range,
-        "emp_type": job.emp_type,
-        "responsibilities": job.responsibilities,
-        "skills": [
-            {"id": skill.id, "name": skill.name} for skill in (job.skills or [])
-        ],
-        "created_at": job.created_at.isoformat() if job.created_at else None,
-        "updated_at": job.updated_at.isoformat() if job.updated_at else None,
-        "applicants_count": len(job.applicants) if job.applicants else 0,
+        job_id: {flag: job_id in ids for flag, ids in found.items()}
+        for job_id in job_ids
     }
 
 
+def add_viewer_state(
+    db: Session, jobs: list, jobs_data: list, user_id: Optional[int] = None
+):
+    """
+    Attach "viewer" flags to the serialized `jobs_data` of `jobs` when the
+    request is logged in (or for `user_id`). Anonymous lists are left as is.
+    """
+    if user_id is None:
+        try:
+            user_id = get_user_id_from_token()
+        except ValueError:
+            return jobs_data
+    state = viewer_state(db, user_id, [job.id for job in jobs])
+    for job, data in zip(jobs, jobs_data):
+        data["viewer"] = state[job.id]
+    return jobs_data
+
+
+@cached_response(tags=("skills",))
 def get_skills():
     """Get all available skills (public endpoint)"""
     db: Session = next(get_db())
@@ -772,21 +1198,8 @@ def get_skills():
 
 def create_skill_if_not_exists(skill_name: str, db: Session) -> Skill:
     """Create a skill if it doesn't exist, return the existing or new skill"""
-    # Check if skill exists (case-insensitive)
-    existing_skill = (
-        db.query(Skill).filter(Skill.name.ilike(skill_name.strip())).first()
-    )
-
-    if existing_skill:
-        return existing_skill
-
-    # Create new skill
-    new_skill = Skill(name=skill_name.strip())
-    db.add(new_skill)
-    db.commit()
-    db.refresh(new_skill)
-
-    return new_skill
+    # Case-insensitive lookup through the registry, the caller commits
+    return skill_registry.get_or_create(db, [skill_name])[0]
 
 
 def create_or_get_skill():
@@ -801,6 +1214,8 @@ def create_or_get_skill():
             return jsonify({"error": "Skill name is required"}), 400
 
         skill = create_skill_if_not_exists(skill_name, db)
+        db.commit()
+        invalidate("skills")
 
         return (
             jsonify(
@@ -2,6 +2,7 @@ from flask import request, jsonify
 from sqlalchemy.orm import Session
 from config.db import SessionLocal
 from core.models import Notification, User
+from services.images import thumbnail_url
 import jwt
 import os
 
@@ -48,12 +49,13 @@ def get_notifications():
                         "title": notif.title,
                         "message": notif.message,
                         "is_read": notif.is_read,
-                        "created_at": notif.created_at.isoformat(),
+                        "created_at": notif.created_at,
                         "sender": (
                             {
                                 "id": notif.sender.id,
                                 "full_name": notif.sender.full_name,
                                 "image": notif.sender.image,
+                                "thumbnail": thumbnail_url(notif.sender.image),
                             }
                             if notif.sender
                             else None
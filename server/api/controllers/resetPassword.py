@@ -1,19 +1,22 @@
 from flask import request, jsonify
 from sqlalchemy.orm import Session
-from core.models import User, PasswordResetToken, engine
-from datetime import datetime, timedelta
-import secrets
-from werkzeug.security import generate_password_hash
+from config.db import get_engine
+from core.models import User
+from services.passwords import HasherBusy, busy_response, hash_password
 from services.email import send_reset_email
+from services import reset_tokens
+from middlewares.ratelimit import by_email, rate_limit
 import os
 
 
+@rate_limit("password-reset", "10/hour")
+@rate_limit("password-reset-account", "3/hour", key=by_email)
 def request_password_reset():
     """
     Request a password reset link.
     Sends an email with a reset token to the user.
     """
-    session = Session(engine)
+    session = Session(get_engine())
     try:
         data = request.get_json()
         email = data.get("email")
@@ -30,30 +33,13 @@ def request_password_reset():
                 "message": "If an account exists with this email, a reset link has been sent."
             }), 200
 
-        # Generate secure random token
-        token = secrets.token_urlsafe(32)
-        
-        # Set expiration (1 hour from now)
-        expires_at = datetime.utcnow() + timedelta(hours=1)
-
-        # Invalidate any existing unused tokens for this user
-        existing_tokens = session.query(PasswordResetToken).filter(
-            PasswordResetToken.user_id == user.id,
-            PasswordResetToken.used == 0
-        ).all()
-        
-        for token_obj in existing_tokens:
-            token_obj.used = 1
-
-        # Create new reset token
-        reset_token = PasswordResetToken(
-            user_id=user.id,
-            token=token,
-            expires_at=expires_at
-        )
-        session.add(reset_token)
+        # New token (stored hashed), older unused ones are invalidated
+        token = reset_tokens.issue(session, user.id)
         session.commit()
 
+        # Drop used / expired tokens now and then
+        reset_tokens.schedule_sweep()
+
         # Send email with reset link
         # reset_url = f"{request.host_url}reset-password?token={token}"
         frontend_url = os.getenv("FRONTEND_URL", "http://localhost:3000")
@@ -75,25 +61,20 @@ def request_password_reset():
         session.close()
 
 
+@rate_limit("password-reset-verify", "30/hour")
 def verify_reset_token():
     """
     Verify if a reset token is valid.
     Used to check token before showing reset form.
     """
-    session = Session(engine)
+    session = Session(get_engine())
     try:
         token = request.args.get("token")
 
         if not token:
             return jsonify({"error": "Token is required"}), 400
 
-        reset_token = session.query(PasswordResetToken).filter(
-            PasswordResetToken.token == token,
-            PasswordResetToken.used == 0,
-            PasswordResetToken.expires_at > datetime.utcnow()
-        ).first()
-
-        if not reset_token:
+        if not reset_tokens.is_valid(session, token):
             return jsonify({"error": "Invalid or expired token"}), 400
 
         return jsonify({
@@ -111,11 +92,12 @@ def verify_reset_token():
         session.close()
 
 
+@rate_limit("password-reset-verify", "30/hour")
 def reset_password():
     """
     Reset password using the token.
     """
-    session = Session(engine)
+    session = Session(get_engine())
     try:
         data = request.get_json()
         token = data.get("token")
@@ -127,37 +109,33 @@ def reset_password():
         if len(new_password) < 8:
             return jsonify({"error": "Password must be at least 8 characters"}), 400
 
-        # Find valid token
-        reset_token = session.query(PasswordResetToken).filter(
-            PasswordResetToken.token == token,
-            PasswordResetToken.used == 0,
-            PasswordResetToken.expires_at > datetime.utcnow()
-        ).first()
+        # Mark the token used, it only counts once this commits
+        user_id = reset_tokens.consume(session, token)
 
-        if not reset_token:
+        if user_id is None:
             return jsonify({"error": "Invalid or expired token"}), 400
 
         # Get user
-        user = session.query(User).filter(User.id == reset_token.user_id).first()
+        user = session.query(User).filter(User.id == user_id).first()
         
         if not user:
             return jsonify({"error": "User not found"}), 404
 
-        # Hash new password (using werkzeug - same as Flask's default)
-        hashed_password = generate_password_hash(new_password)
+        # Hash new password (PASSWORD_HASH_METHOD, off the request thread)
+        hashed_password = hash_password(new_password)
 
         # Update password
         user.password = hashed_password
 
-        # Mark token as used
-        reset_token.used = 1
-
         session.commit()
 
         return jsonify({
             "message": "Password has been reset successfully"
         }), 200
 
+    except HasherBusy:
+        session.rollback()
+        return busy_response()
     except Exception as e:
         session.rollback()
         print(f"Error in reset_password: {str(e)}")
@@ -0,0 +1,270 @@
+from flask import request, jsonify
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from config.db import SessionLocal
+from controllers.job import JOB_FIELDS, job_fields, job_to_dict
+from controllers.utils import get_pagination
+from core.models import Category, Job, SavedSearch, SavedSearchMatch, Skill, User
+from middlewares.auth import is_auth
+from services.cache import invalidate
+from services.geo import DEFAULT_RADIUS_KM, MAX_RADIUS_KM, geocode
+from services.saved_searches import MAX_SAVED_SEARCHES, index_search, words
+from services.skill_registry import skill_registry
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def search_to_dict(search: SavedSearch, skill_names: dict) -> dict:
+    return {
+        "id": search.id,
+        "name": search.name,
+        "keyword": search.keyword,
+        "skills": [
+            {"id": i, "name": skill_names[i]}
+            for i in search.skill_ids or []
+            if i in skill_names
+        ],
+        "category": (
+            {"id": search.category.id, "name": search.category.name}
+            if search.category
+            else None
+        ),
+        "location": search.location,
+        "radius_km": search.radius_km,
+        "frequency": search.frequency,
+        "created_at": search.created_at,
+    }
+
+
+def _skill_names(db: Session, searches) -> dict:
+    ids = {i for search in searches for i in search.skill_ids or []}
+    if not ids:
+        return {}
+    return dict(db.execute(select(Skill.id, Skill.name).where(Skill.id.in_(ids))).all())
+
+
+def _own_search(db: Session, search_id: int):
+    return (
+        db.query(SavedSearch)
+        .filter(SavedSearch.id == search_id, SavedSearch.user_id == request.user_id)
+        .first()
+    )
+
+
+@is_auth
+def get_saved_searches():
+    """The current candidate's saved searches"""
+    db: Session = next(get_db())
+
+    try:
+        searches = (
+            db.query(SavedSearch)
+            .filter(SavedSearch.user_id == request.user_id)
+            .order_by(SavedSearch.created_at.desc(), SavedSearch.id.desc())
+            .all()
+        )
+        skill_names = _skill_names(db, searches)
+        return jsonify([search_to_dict(s, skill_names) for s in searches]), 200
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    finally:
+        db.close()
+
+
+@is_auth
+def create_saved_search():
+    """
+    Save a job search to be alerted of new jobs matching it. Filters:
+    keyword, skills (names), category (id or name), location + radius_km;
+    frequency is "instant" (a notification per job) or "digest".
+    """
+    db: Session = next(get_db())
+
+    try:
+        data = request.get_json() or {}
+
+        user = (
+            db.query(User.id)
+            .filter(User.id == request.user_id, User.role == "candidate")
+            .first()
+        )
+        if not user:
+            return jsonify({"error": "Only candidates can save searches"}), 403
+
+        count = db.execute(
+            select(func.count())
+            .select_from(SavedSearch)
+            .where(SavedSearch.user_id == request.user_id)
+        ).scalar()
+        if count >= MAX_SAVED_SEARCHES:
+            return (
+                jsonify({"error": f"At most {MAX_SAVED_SEARCHES} saved searches"}),
+                400,
+            )
+
+        keyword = (data.get("keyword") or "").strip() or None
+        skill_names = [n for n in data.get("skills") or [] if isinstance(n, str)]
+        category = str(data.get("category") or "").strip()
+        location = (data.get("location") or "").strip() or None
+        frequency = data.get("frequency", "instant")
+
+        if not (keyword or skill_names or category or location):
+            return (
+                jsonify(
+                    {
+                        "error": "Set at least one of keyword, skills, category "
+                        "or location"
+                    }
+                ),
+                400,
+            )
+        if frequency not in ("instant", "digest"):
+            return jsonify({"error": "frequency must be instant or digest"}), 400
+        if keyword and not words(keyword):
+            # Punctuation only: it would match every job
+            return jsonify({"error": "keyword must contain letters or digits"}), 400
+
+        search = SavedSearch(
+            user_id=request.user_id,
+            name=(data.get("name") or keyword or location or "My search")[:100],
+            keyword=keyword[:200] if keyword else None,
+            frequency=frequency,
+        )
+
+        if category:
+            found = (
+                db.query(Category)
+                .filter(
+                    Category.id == int(category)
+                    if category.isdigit()
+                    else func.lower(Category.name) == category.lower()
+                )
+                .first()
+            )
+            if not found:
+                return jsonify({"error": f"Unknown category: {category}"}), 400
+            search.category = found
+
+        if location:
+            point = geocode(location)
+            if point is None:
+                return jsonify({"error": f"Unknown location: {location}"}), 400
+            try:
+                radius = float(data.get("radius_km", DEFAULT_RADIUS_KM))
+            except (TypeError, ValueError):
+                radius = 0
+            if not 0 < radius <= MAX_RADIUS_KM:
+                return (
+                    jsonify(
+                        {"error": f"radius_km must be between 0 and {MAX_RADIUS_KM:g}"}
+                    ),
+                    400,
+                )
+            search.location = location[:200]
+            search.latitude, search.longitude = point
+            search.radius_km = radius
+
+        if skill_names:
+            # Created when unknown, so jobs posted with them later still match.
+            # Ids only, no rows: cached names cost no query
+            search.skill_ids = sorted(
+                set(skill_registry.resolve(db, skill_names).values())
+            )
+
+        db.add(search)
+        db.flush()
+        index_search(db, search)
+        db.commit()
+        if skill_names:
+            invalidate("skills")
+
+        return jsonify(search_to_dict(search, _skill_names(db, [search]))), 201
+
+    except Exception as e:
+        db.rollback()
+        return jsonify({"error": str(e)}), 500
+    finally:
+        db.close()
+
+
+@is_auth
+def delete_saved_search(search_id: int):
+    """Stop the alerts of a saved search, its terms and matches go with it"""
+    db: Session = next(get_db())
+
+    try:
+        search = _own_search(db, search_id)
+        if not search:
+            return jsonify({"error": "Saved search not found"}), 404
+
+        db.delete(search)
+        db.commit()
+        return jsonify({"message": "Saved search deleted"}), 200
+
+    except Exception as e:
+        db.rollback()
+        return jsonify({"error": str(e)}), 500
+    finally:
+        db.close()
+
+
+@is_auth
+def get_saved_search_jobs(search_id: int):
+    """Jobs a saved search matched since it was saved, most recent first"""
+    db: Session = next(get_db())
+
+    try:
+        search = _own_search(db, search_id)
+        if not search:
+            return jsonify({"error": "Saved search not found"}), 404
+
+        try:
+            page, limit = get_pagination()
+            fields = job_fields()
+        except ValueError as e:  # ProjectionError included
+            return jsonify({"error": str(e)}), 400
+
+        query = (
+            db.query(Job, SavedSearchMatch.matched_at)
+            .join(SavedSearchMatch, SavedSearchMatch.job_id == Job.id)
+            .filter(SavedSearchMatch.saved_search_id == search.id)
+        )
+        total = query.count()
+        rows = (
+            query.options(*JOB_FIELDS.options(fields))
+            .order_by(SavedSearchMatch.matched_at.desc(), SavedSearchMatch.id.desc())
+            .offset((page - 1) * limit)
+            .limit(limit)
+            .all()
+        )
+
+        jobs_data = [
+            {**job_to_dict(job, fields), "matched_at": matched_at}
+            for job, matched_at in rows
+        ]
+
+        return (
+            jsonify(
+                {
+                    "jobs": jobs_data,
+                    "total": total,
+                    "page": page,
+                    "limit": limit,
+                    "total_pages": (total + limit - 1) // limit,
+                }
+            ),
+            200,
+        )
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    finally:
+        db.close()
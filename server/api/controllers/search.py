@@ -1,10 +1,14 @@
 from flask import request, jsonify
 from config.db import SessionLocal
-from core.models import User, Job, Skill, Category
+from core.models import User, Job, Skill, Category, ResumeDocument
 from controllers.utils import get_user_id_from_token
 from sqlalchemy import or_, func
+from sqlalchemy.orm import load_only
+from services.images import thumbnail_url
+from middlewares.ratelimit import by_user, rate_limit
 
 
+@rate_limit("search", "60/minute", burst=20, key=by_user)
 def search_all():
     q = request.args.get("query") or request.args.get("q") or request.args.get("search") or ""
     q = q.strip()
@@ -24,9 +28,13 @@ def search_all():
 
         like_q = f"%{q}%"
 
+        # Only what the result cards show, not bios / descriptions
+        card = load_only(User.id, User.role, User.full_name, User.headLine, User.image)
+
         # Employers: search by companyName, full_name, email
         employers = (
             db.query(User)
+            .options(card)
             .filter(User.role == "employer")
             .filter(
                 or_(
@@ -49,12 +57,14 @@ def search_all():
                     "full_name": e.full_name,
                     "headLine": getattr(e, "headLine", ""),
                     "image": e.image,
+                    "thumbnail": thumbnail_url(e.image),
                 }
             )
 
         # Candidates: search by full_name, headLine, skills
         candidates_q = (
             db.query(User)
+            .options(card)
             .filter(User.role == "candidate")
             .filter(
                 or_(
@@ -76,12 +86,14 @@ def search_all():
                     "full_name": c.full_name,
                     "headLine": getattr(c, "headLine", ""),
                     "image": c.image,
+                    "thumbnail": thumbnail_url(c.image),
                 }
             )
 
         # Also search candidates by skill name
         skill_matches = (
             db.query(User)
+            .options(card)
             .join(User.skills)
             .filter(User.role == "candidate")
             .filter(Skill.name.ilike(like_q))
@@ -89,7 +101,23 @@ def search_all():
             .all()
         )
 
-        for c in skill_matches:
+        # And by resume content, straight from the full-text index
+        resume_matches = (
+            db.query(User)
+            .options(card)
+            .join(ResumeDocument, ResumeDocument.user_id == User.id)
+            .filter(User.role == "candidate")
+            .filter(
+                ResumeDocument.search_vector.op("@@")(
+                    func.plainto_tsquery("english", q)
+                )
+            )
+            .distinct()
+            .limit(6)
+            .all()
+        )
+
+        for c in skill_matches + resume_matches:
             if any(cm["id"] == c.id for cm in result["candidates"]):
                 continue
             if current_user_id and c.id == current_user_id:
@@ -101,12 +129,15 @@ def search_all():
                     "full_name": c.full_name,
                     "headLine": getattr(c, "headLine", ""),
                     "image": c.image,
+                    "thumbnail": thumbnail_url(c.image),
                 }
             )
 
         # Jobs: search by title, company, description, category
         jobs = (
-            db.query(Job)
+            db.query(
+                Job.id, Job.title, func.left(Job.description, 101).label("description")
+            )
             .outerjoin(Category, Job.category)
             .filter(
                 or_(
@@ -2,6 +2,7 @@
 
 from flask import request
 import jwt
+from sqlalchemy import func
 from config.db import SessionLocal
 from core.models import User
 import os
@@ -40,3 +41,35 @@ def get_current_user_from_token() -> User:
         return user
     finally:
         db.close()
+
+
+def get_pagination(default_limit: int = 10, max_limit: int = 100) -> tuple:
+    """(page, limit) from the query string, ValueError when they're invalid"""
+    page = request.args.get("page", 1)
+    limit = request.args.get("limit", default_limit)
+    try:
+        page, limit = int(page), int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("page and limit must be integers")
+    if page < 1 or not 1 <= limit <= max_limit:
+        raise ValueError(f"page must be 1 or more, limit between 1 and {max_limit}")
+    return page, limit
+
+
+def touch_user(db, user_id: int):
+    """Bump users.updated_at for profile changes stored in other tables"""
+    db.query(User).filter(User.id == user_id).update(
+        {User.updated_at: func.now()}, synchronize_session=False
+    )
+
+
+def profile_validators(user_id: int):
+    """ETag parts / Last-Modified of a user's public profile"""
+    db = SessionLocal()
+    try:
+        updated_at = db.query(User.updated_at).filter(User.id == user_id).scalar()
+        if updated_at is None:
+            return None
+        return (user_id, updated_at), updated_at
+    finally:
+        db.close()
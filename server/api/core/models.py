@@ -1,34 +1,26 @@
 from sqlalchemy import (
-    create_engine,
     Column,
     Integer,
     String,
     Text,
     DateTime,
     Date,
+    Float,
     Enum,
     ForeignKey,
     Table,
     ARRAY,
     MetaData,
+    Computed,
+    Index,
+    literal_column,
 )
-from sqlalchemy.orm import relationship
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import declarative_base, query_expression, relationship
 from sqlalchemy.sql import func
-import os
-from dotenv import load_dotenv
 
-load_dotenv()
-
-DB_USER = os.getenv("DB_USERNAME")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = os.getenv("DB_PORT")
-DB_NAME = os.getenv("DB_NAME")
-
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-
-engine = create_engine(DATABASE_URL, echo=True)
+# Schema changes go through Alembic (server/api/migrations), importing the
+# models never touches the database
 Base = declarative_base(metadata=MetaData(schema="public"))
 
 # ============================================================
@@ -46,6 +38,8 @@ user_skills = Table(
         ForeignKey("skills.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # Skill -> users, what job alerts go through (services/fanout.py)
+    Index("ix_user_skills_skill_id_user_id", "skill_id", "user_id"),
 )
 
 # ============================================================
@@ -96,6 +90,10 @@ class User(Base):
     image = Column(Text)
     phone = Column(String(150))
     location = Column(String(200))
+    # Geocoded from location on write (services/geo.py), None = not found
+    latitude = Column(Float)
+    longitude = Column(Float)
+    geohash = Column(String(12))
     bio = Column(Text)
     headLine = Column(String(200))  # ex: "Frontend engineer"
     companyName = Column(Text)
@@ -104,6 +102,9 @@ class User(Base):
     github_url = Column(String(100))
 
     created_at = Column(DateTime, server_default=func.now())
+    # Also bumped by writes to the profile's educations / experiences / skills,
+    # it is what conditional GETs of the profile compare against
+    updated_at = Column(DateTime, onupdate=func.now(), server_default=func.now())
 
     # Relationships
     educations = relationship("Education", backref="user", cascade="all, delete-orphan")
@@ -160,6 +161,9 @@ class Skill(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(150), unique=True, nullable=False)
 
+    # Case-insensitive uniqueness, also what skill lookups by name go through
+    __table_args__ = (Index("uq_skills_name_lower", func.lower(name), unique=True),)
+
 
 # ============================================================
 # CATEGORY MODEL
@@ -185,6 +189,14 @@ class Job(Base):
     company = Column(String(255), nullable=False)
     location = Column(String(255), nullable=False)
     salary_range = Column(String(100))
+    # Parsed from salary_range on write (services/salary.py), None = open end
+    salary_min = Column(Integer)
+    salary_max = Column(Integer)
+    salary_currency = Column(String(3))
+    # Geocoded from location on write (services/geo.py), None = not found
+    latitude = Column(Float)
+    longitude = Column(Float)
+    geohash = Column(String(12))
     emp_type = Column(String(50))
     description = Column(Text)
     responsibilities = Column(ARRAY(String))
@@ -196,6 +208,35 @@ class Job(Base):
     applicants = relationship("User", secondary=job_applicants, backref="applied_jobs")
     skills = relationship("Skill", secondary=job_skills, backref="job_with_skill")
 
+    # Filled by with_expression() in queries that ask for it, None otherwise
+    applicants_count = query_expression()
+    distance_km = query_expression()
+
+    __table_args__ = (
+        Index("ix_jobs_employer_id_updated_at", "employer_id", "updated_at"),
+        Index("ix_jobs_created_at", "created_at"),
+        Index("ix_jobs_emp_type_created_at", "emp_type", "created_at"),
+        Index("ix_jobs_category_id_created_at", "category_id", "created_at"),
+        # Salary filters are range overlaps, see Job.salary_span()
+        Index(
+            "ix_jobs_salary_span",
+            func.int4range(salary_min, salary_max, literal_column("'[]'")),
+            postgresql_using="gist",
+            postgresql_where=salary_currency.isnot(None),
+        ),
+        # Radius queries are geohash prefix LIKEs, see services.geo.within()
+        Index(
+            "ix_jobs_geohash",
+            "geohash",
+            postgresql_ops={"geohash": "text_pattern_ops"},
+        ),
+    )
+
+    @classmethod
+    def salary_span(cls):
+        """The indexed int4range of the salary, inclusive bounds"""
+        return func.int4range(cls.salary_min, cls.salary_max, literal_column("'[]'"))
+
 
 # ============================================================
 # APPLICATION MODEL
@@ -215,6 +256,11 @@ class Application(Base):
     )
     applied_at = Column(DateTime, server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_applications_job_id_applied_at", "job_id", "applied_at"),
+        Index("ix_applications_user_id_job_id", "user_id", "job_id"),
+    )
+
 
 # ============================================================
 # SAVED JOB MODEL
@@ -227,6 +273,11 @@ class SavedJob(Base):
     job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"))
     saved_at = Column(DateTime, server_default=func.now())
 
+    __table_args__ = (
+        Index("ix_saved_jobs_user_id_saved_at", "user_id", "saved_at"),
+        Index("ix_saved_jobs_user_id_job_id", "user_id", "job_id"),
+    )
+
 
 # ============================================================
 # NOTIFICATION MODEL
@@ -273,6 +324,11 @@ class Notification(Base):
         backref="received_notifications",
     )
 
+    __table_args__ = (
+        # A user's latest notifications, and job alert caps
+        Index("ix_notifications_receiver_id_created_at", "receiver_id", "created_at"),
+    )
+
 
 # ============================================================
 # REPORT MODEL
@@ -289,6 +345,8 @@ class Report(Base):
     user = relationship("User", backref="reports")
     job = relationship("Job", backref="reports")
 
+    __table_args__ = (Index("ix_reports_user_id_job_id", "user_id", "job_id"),)
+
 
 # ============================================================
 # CONNECTION REQUEST MODEL
@@ -348,7 +406,8 @@ class PasswordResetToken(Base):
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    token = Column(String(255), unique=True, nullable=False)
+    # sha256 of the token in the link, see services/reset_tokens.py
+    token_hash = Column(String(64), unique=True, nullable=False)
     expires_at = Column(DateTime, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     used = Column(Integer, server_default="0")  # 0 = unused, 1 = used
@@ -356,9 +415,125 @@ class PasswordResetToken(Base):
     # Relationship
     user = relationship("User", backref="reset_tokens")
 
+    __table_args__ = (
+        Index("ix_password_reset_tokens_user_id", "user_id"),
+        Index("ix_password_reset_tokens_expires_at", "expires_at"),
+    )
+
+
+# ============================================================
+# RESUME DOCUMENT MODEL (extracted CV text, full-text indexed)
+# ============================================================
+class ResumeDocument(Base):
+    __tablename__ = "resume_documents"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    application_id = Column(
+        Integer, ForeignKey("applications.id", ondelete="CASCADE"), nullable=True
+    )
 
-Base.metadata.create_all(engine)
-print("Tables created successfully!")
+    file_url = Column(Text, unique=True, nullable=False)
+    content = Column(Text)  # normalized plain text
+    skill_tokens = Column(ARRAY(String))  # lower-cased known skill names
+    search_vector = Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(content, ''))", persisted=True),
+    )
+    extracted_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    user = relationship("User", backref="resume_documents")
 
+    __table_args__ = (
+        Index(
+            "ix_resume_documents_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_resume_documents_skill_tokens", "skill_tokens", postgresql_using="gin"
+        ),
+        Index("ix_resume_documents_user_id", "user_id"),
+    )
 
+
+# ============================================================
+# SAVED SEARCH MODEL (job alerts)
+# ============================================================
+class SavedSearch(Base):
+    __tablename__ = "saved_searches"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    name = Column(String(100), nullable=False)
+
+    # Filters, all optional; a job must pass every one that is set
+    keyword = Column(String(200))  # every word in the title / company / description
+    skill_ids = Column(ARRAY(Integer))  # any of them
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="SET NULL"))
+    location = Column(String(200))  # within radius_km of where it geocodes
+    latitude = Column(Float)
+    longitude = Column(Float)
+    radius_km = Column(Float)
+
+    # instant: a notification per matching job, digest: batched per user
+    frequency = Column(
+        Enum("instant", "digest", name="alert_frequency"),
+        nullable=False,
+        server_default="instant",
+    )
+    created_at = Column(DateTime, server_default=func.now())
+
+    user = relationship("User", backref="saved_searches")
+    category = relationship("Category")
+
+    __table_args__ = (Index("ix_saved_searches_user_id", "user_id"),)
+
+
+# Inverted index of the saved searches: a new job looks up its terms here
+# instead of being run through every search (services/saved_searches.py)
+saved_search_terms = Table(
+    "saved_search_terms",
+    Base.metadata,
+    Column("term", String(64), primary_key=True),
+    Column(
+        "saved_search_id",
+        Integer,
+        ForeignKey("saved_searches.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Index("ix_saved_search_terms_saved_search_id", "saved_search_id"),
+)
+
+
+class SavedSearchMatch(Base):
+    __tablename__ = "saved_search_matches"
+
+    id = Column(Integer, primary_key=True)
+    saved_search_id = Column(
+        Integer, ForeignKey("saved_searches.id", ondelete="CASCADE"), nullable=False
+    )
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
+    matched_at = Column(DateTime, server_default=func.now())
+    # Set once the match went out, alone or in a digest
+    notified_at = Column(DateTime)
+
+    __table_args__ = (
+        Index(
+            "uq_saved_search_matches_search_job",
+            "saved_search_id",
+            "job_id",
+            unique=True,
+        ),
+        Index("ix_saved_search_matches_job_id", "job_id"),
+        # What the next digest picks up
+        Index(
+            "ix_saved_search_matches_pending",
+            "saved_search_id",
+            postgresql_where=notified_at.is_(None),
+        ),
+    )
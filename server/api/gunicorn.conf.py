@@ -0,0 +1,103 @@
+"""
+Production server settings.
+
+    cd server/api && gunicorn -c gunicorn.conf.py wsgi:app
+
+Graceful restart of the workers: kill -HUP <master pid>. The app is
+preloaded in the master, so a HUP doesn't pick up new code: for a deploy send
+USR2 (starts a new master next to the old one), then QUIT to the old master.
+"""
+
+import multiprocessing
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# gthread is the default: the app is mostly blocking DB work. "gevent" needs
+# gevent and psycogreen installed.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 100))
+
+# Import the app once in the master; workers share its memory copy-on-write
+preload_app = True
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+# Keep above the load balancer's idle timeout, or it will reuse closed sockets
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+# Recycle workers now and then, staggered so they don't all restart together
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 200))
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+
+# ============================================================
+# DB pool sizing
+# ============================================================
+# Postgres max_connections, minus what psql, migrations and cron jobs need
+PG_MAX_CONNECTIONS = int(os.getenv("PG_MAX_CONNECTIONS", 100))
+DB_RESERVED_CONNECTIONS = int(os.getenv("DB_RESERVED_CONNECTIONS", 10))
+
+
+def _pool_settings():
+    concurrency = worker_connections if worker_class == "gevent" else threads
+    budget = (PG_MAX_CONNECTIONS - DB_RESERVED_CONNECTIONS) // workers
+    if budget < 1:
+        raise RuntimeError(
+            f"{workers} workers can't share {PG_MAX_CONNECTIONS} connections, "
+            "lower WEB_CONCURRENCY or raise PG_MAX_CONNECTIONS"
+        )
+    pool_size = min(concurrency, budget)
+    return pool_size, budget - pool_size
+
+
+# config.db reads these when the app is imported, right after this file
+_pool_size, _max_overflow = _pool_settings()
+os.environ.setdefault("DB_POOL_SIZE", str(_pool_size))
+os.environ.setdefault("DB_MAX_OVERFLOW", str(_max_overflow))
+
+
+def on_starting(server):
+    used = workers * (
+        int(os.environ["DB_POOL_SIZE"]) + int(os.environ["DB_MAX_OVERFLOW"])
+    )
+    server.log.info(
+        f"{workers} {worker_class} workers, DB pool {os.environ['DB_POOL_SIZE']}"
+        f"+{os.environ['DB_MAX_OVERFLOW']} per worker, up to {used} of "
+        f"{PG_MAX_CONNECTIONS} connections"
+    )
+    if used > PG_MAX_CONNECTIONS - DB_RESERVED_CONNECTIONS:
+        server.log.warning("DB_POOL_SIZE / DB_MAX_OVERFLOW exceed max_connections")
+
+    # Samples left over from a previous run would be added to the new ones
+    multiproc_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        os.makedirs(multiproc_dir, exist_ok=True)
+        for name in os.listdir(multiproc_dir):
+            if name.endswith(".db"):
+                os.remove(os.path.join(multiproc_dir, name))
+
+
+def post_fork(server, worker):
+    if worker_class == "gevent":
+        from psycogreen.gevent import patch_psycopg
+
+        patch_psycopg()
+
+    # Should the master have opened connections, they must not be shared
+    from config.db import dispose_engine
+
+    dispose_engine(close=False)
+
+
+def child_exit(server, worker):
+    from services.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
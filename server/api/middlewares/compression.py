@@ -0,0 +1,89 @@
+import gzip
+import os
+
+from dotenv import load_dotenv
+from flask import request
+
+load_dotenv()
+
+try:
+    import brotli
+except ImportError:  # optional, gzip only without it
+    brotli = None
+
+COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "true").lower() == "true"
+# Below this many bytes the headers and the CPU cost more than they save
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 1024))
+COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", 5))
+# Brotli's higher qualities are meant for static assets, 4 suits dynamic bodies
+COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", 4))
+
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+def _compressible(mimetype: str) -> bool:
+    return mimetype in COMPRESSIBLE_TYPES or mimetype.startswith("text/")
+
+
+def available_encodings() -> list:
+    """Supported codings, preferred first"""
+    return (["br"] if brotli else []) + ["gzip"]
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESS_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=COMPRESS_GZIP_LEVEL, mtime=0)
+
+
+def negotiate(accept_encodings) -> str:
+    """Best coding the client accepts (q > 0), or None for identity"""
+    best, best_quality = None, 0
+    for encoding in available_encodings():
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _compress_response(response):
+    if (
+        response.direct_passthrough  # files, sent by send_file / the proxy
+        or response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or "Content-Encoding" in response.headers
+        or not _compressible(response.mimetype or "")
+    ):
+        return response
+
+    # Whatever we decide, caches must keep one copy per Accept-Encoding
+    response.vary.add("Accept-Encoding")
+    if request.method == "HEAD":
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    encoding = negotiate(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    response.set_data(compress(body, encoding))
+    response.headers["Content-Encoding"] = encoding
+    # The bytes differ from the identity representation
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app):
+    """gzip / brotli for JSON and text responses, negotiated per request"""
+    if COMPRESS_ENABLED:
+        app.after_request(_compress_response)
@@ -0,0 +1,151 @@
+import json
+import os
+import re
+import time
+from collections import Counter
+
+from dotenv import load_dotenv
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+load_dotenv()
+
+# "slow" logs slow / N+1 requests only, "all" every request (for debugging,
+# like SQL_ECHO), "off" nothing
+REQUEST_LOG = os.getenv("REQUEST_LOG", "slow").lower()
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", 500))
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 100))
+# The same statement this many times in one request is reported as N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", 5))
+SLOWEST_KEPT = 3
+STATEMENT_LOG_CHARS = 300
+
+_SPACE_RE = re.compile(r"\s+")
+# Expanded IN lists differ in length from call to call: (%(id_1_1)s, %(id_1_2)s)
+_IN_LIST_RE = re.compile(r"\((?:%\([^)]+\)s(?:, )?)+\)")
+_PARAM_RE = re.compile(r"%\([^)]+\)s")
+
+_listening = False
+
+
+def statement_template(statement: str) -> str:
+    """Statement text with parameters and IN lists collapsed, for grouping"""
+    template = _SPACE_RE.sub(" ", statement).strip()
+    template = _IN_LIST_RE.sub("(?)", template)
+    return _PARAM_RE.sub("?", template)
+
+
+class RequestStats:
+    """What the database did for one request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.slowest = []  # (seconds, statement), longest first
+        self.templates = Counter()
+
+    def record(self, statement: str, seconds: float):
+        self.queries += 1
+        self.db_seconds += seconds
+        self.templates[statement_template(statement)] += 1
+
+        if len(self.slowest) < SLOWEST_KEPT or seconds > self.slowest[-1][0]:
+            self.slowest.append((seconds, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_KEPT:]
+
+    def repeated(self) -> list:
+        return [
+            {"count": count, "statement": template[:STATEMENT_LOG_CHARS]}
+            for template, count in self.templates.most_common()
+            if count >= N_PLUS_ONE_THRESHOLD
+        ]
+
+
+def current_stats():
+    """RequestStats of the request being handled, or None outside of one"""
+    if not has_request_context():
+        return None
+    return g.get("db_stats")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    stats = current_stats()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute never fires for a failed statement
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def _before_request():
+    g.db_stats = RequestStats()
+
+
+def _after_request(response):
+    stats = g.pop("db_stats", None)
+    if stats is None:
+        return response
+
+    total_ms = (time.perf_counter() - stats.started) * 1000
+    db_ms = stats.db_seconds * 1000
+    response.headers.add(
+        "Server-Timing",
+        f'db;dur={db_ms:.2f};desc="{stats.queries} queries", app;dur={total_ms:.2f}',
+    )
+
+    repeated = stats.repeated()
+    slow_queries = [s for s in stats.slowest if s[0] * 1000 >= SLOW_QUERY_MS]
+    if REQUEST_LOG == "off":
+        return response
+    if REQUEST_LOG == "slow" and not (
+        total_ms >= SLOW_REQUEST_MS or repeated or slow_queries
+    ):
+        return response
+
+    line = {
+        "event": "request",
+        "method": request.method,
+        "path": request.path,
+        "endpoint": request.endpoint,
+        "status": response.status_code,
+        "duration_ms": round(total_ms, 2),
+        "db_ms": round(db_ms, 2),
+        "queries": stats.queries,
+        "slowest": [
+            {
+                "ms": round(seconds * 1000, 2),
+                "statement": _SPACE_RE.sub(" ", statement)[:STATEMENT_LOG_CHARS],
+            }
+            for seconds, statement in stats.slowest
+        ],
+    }
+    if repeated:
+        line["n_plus_one"] = repeated
+    print(json.dumps(line), flush=True)
+    return response
+
+
+def init_instrumentation(app):
+    """Count queries and DB time per request, for Server-Timing and the log"""
+    global _listening
+    if not _listening:
+        # Listening on the Engine class covers every engine the app creates
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+        _listening = True
+
+    app.before_request(_before_request)
+    app.after_request(_after_request)
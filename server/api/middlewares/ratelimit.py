@@ -0,0 +1,210 @@
+import math
+import os
+import time
+from functools import wraps
+from threading import Lock
+
+import jwt
+from cachetools import LRUCache
+from dotenv import load_dotenv
+from flask import jsonify, make_response, request
+
+load_dotenv()
+
+RATELIMIT_ENABLED = os.getenv("RATELIMIT_ENABLED", "true").lower() == "true"
+# "" keeps buckets in process memory (each worker allows the full rate).
+# A redis:// URL shares them between workers, like CACHE_URL.
+RATELIMIT_URL = os.getenv("RATELIMIT_URL", os.getenv("CACHE_URL", ""))
+RATELIMIT_MAX_KEYS = int(os.getenv("RATELIMIT_MAX_KEYS", 100_000))
+RATELIMIT_PREFIX = os.getenv("RATELIMIT_PREFIX", "hireradar:rl:")
+# Reverse proxies in front of the app that append to X-Forwarded-For
+RATELIMIT_TRUSTED_PROXIES = int(os.getenv("RATELIMIT_TRUSTED_PROXIES", 0))
+
+JWT_SECRET = os.getenv("JWT_SECRET", "secret123")
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_rate(rate: str) -> tuple:
+    """e.g. "10/minute" -> (10, 60)"""
+    count, _, period = rate.partition("/")
+    return int(count), _PERIODS[period.strip().rstrip("s")]
+
+
+class LocalBuckets:
+    """
+    Token buckets in process memory. A bucket holds up to `burst` tokens and
+    refills at `rate` tokens per second; buckets idle long enough to be full
+    again are as good as absent, so least recently used ones are evicted.
+    """
+
+    def __init__(self, maxsize: int = RATELIMIT_MAX_KEYS):
+        self._buckets = LRUCache(maxsize=maxsize)  # key -> (tokens, updated_at)
+        self._lock = Lock()
+
+    def take(self, key: str, rate: float, burst: int, cost: int = 1) -> tuple:
+        """
+        (allowed, seconds until `cost` tokens are available). A negative
+        cost gives tokens back.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated_at) * rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+        return allowed, 0.0 if allowed else (cost - tokens) / rate
+
+
+# Same algorithm as LocalBuckets.take, atomic in Redis and on Redis' clock
+_TAKE_SCRIPT = """
+local rate, burst, cost = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1e6
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisBuckets:
+    """Buckets shared by every worker through Redis"""
+
+    def __init__(self, client, prefix: str = RATELIMIT_PREFIX):
+        self._script = client.register_script(_TAKE_SCRIPT)
+        self._prefix = prefix
+
+    def take(self, key: str, rate: float, burst: int, cost: int = 1) -> tuple:
+        allowed, tokens = self._script(
+            keys=[self._prefix + key], args=[rate, burst, cost]
+        )
+        if allowed:
+            return True, 0.0
+        return False, (cost - float(tokens)) / rate
+
+
+def make_buckets(url: str = RATELIMIT_URL):
+    if not url:
+        return LocalBuckets()
+
+    try:
+        import redis
+    except ImportError:
+        raise RuntimeError("RATELIMIT_URL is a Redis URL, pip install redis") from None
+    return RedisBuckets(redis.Redis.from_url(url, socket_timeout=0.5))
+
+
+_buckets = None
+
+
+def get_buckets():
+    # Connecting to Redis waits until the first limited request
+    global _buckets
+    if _buckets is None:
+        _buckets = make_buckets()
+    return _buckets
+
+
+def client_ip() -> str:
+    """
+    The address of the client. Behind N trusted proxies it is the Nth entry
+    of X-Forwarded-For from the right, the one the outermost proxy appended
+    (as ProxyFix(x_for=N) reads it); entries left of it are the client's.
+    """
+    if RATELIMIT_TRUSTED_PROXIES:
+        route = request.access_route
+        if len(route) >= RATELIMIT_TRUSTED_PROXIES:
+            return route[-RATELIMIT_TRUSTED_PROXIES]
+    return request.remote_addr or "-"
+
+
+def by_ip() -> str:
+    return f"ip:{client_ip()}"
+
+
+def by_user() -> str:
+    """The caller's user id, their IP when they aren't logged in"""
+    header = request.headers.get("Authorization", "")
+    if header.startswith("Bearer "):
+        try:
+            payload = jwt.decode(header[7:], JWT_SECRET, algorithms=["HS256"])
+            if payload.get("id") is not None:
+                return f"user:{payload['id']}"
+        except jwt.InvalidTokenError:
+            pass
+    return by_ip()
+
+
+def by_email() -> str:
+    """The account a login / reset is for, whoever asks"""
+    payload = request.get_json(silent=True)
+    email = payload.get("email") if isinstance(payload, dict) else None
+    if not isinstance(email, str) or not email.strip():
+        return None
+    return f"email:{email.strip().lower()}"
+
+
+def rate_limit(
+    name: str, rate: str, burst: int = None, key=by_ip, failures_only: bool = False
+):
+    """
+    Allow `rate` ("5/minute") calls per key with bursts of up to `burst`
+    (defaults to the count). `key` returns the bucket of a request, None to
+    not limit it. Over the limit the view isn't called: 429 + Retry-After.
+    Stack several for e.g. one limit per IP and a looser one per account.
+    With `failures_only` a call is given back its token unless the view
+    answers with a 4xx, so only failed attempts count.
+    """
+    count, seconds = parse_rate(rate)
+    per_second = count / seconds
+    burst = burst or count
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not RATELIMIT_ENABLED or request.method == "OPTIONS":
+                return view(*args, **kwargs)
+
+            bucket = key()
+            if bucket is None:
+                return view(*args, **kwargs)
+
+            try:
+                allowed, retry_after = get_buckets().take(
+                    f"{name}:{bucket}", per_second, burst
+                )
+            except Exception as e:
+                # Fail open: a Redis hiccup shouldn't lock everyone out
+                print(f"Rate limiter unavailable for {name}: {e}")
+                return view(*args, **kwargs)
+
+            if allowed and not failures_only:
+                return view(*args, **kwargs)
+            if allowed:
+                response = make_response(view(*args, **kwargs))
+                if not 400 <= response.status_code < 500:
+                    try:
+                        get_buckets().take(f"{name}:{bucket}", per_second, burst, -1)
+                    except Exception as e:
+                        print(f"Rate limiter unavailable for {name}: {e}")
+                return response
+
+            response = jsonify({"error": "Too many requests, please slow down"})
+            response.status_code = 429
+            response.headers["Retry-After"] = str(math.ceil(retry_after))
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,101 @@
+from logging.config import fileConfig
+
+from alembic import context
+from alembic.operations import ops
+from sqlalchemy import create_engine, pool
+
+from config.db import DATABASE_URL
+from core.models import Base
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_name(name, type_, parent_names):
+    # Alembic's own bookkeeping table isn't part of the models
+    return not (type_ == "table" and name == "alembic_version")
+
+
+def _fk_key(op_):
+    return (
+        op_.source_table,
+        tuple(op_.local_cols),
+        op_.referent_table,
+        tuple(op_.remote_cols),
+        op_.kw.get("ondelete"),
+    )
+
+
+def drop_default_schema_fk_noise(context, revision, directives):
+    """
+    The models name schema="public" explicitly, but foreign keys pointing
+    into the default schema are reflected without it, so autogenerate wants
+    to drop and re-create every one of them. Drop those no-op pairs.
+    """
+    for script in directives:
+        for table_ops in script.upgrade_ops.ops:
+            if not isinstance(table_ops, ops.ModifyTableOps):
+                continue
+            created = {
+                _fk_key(op_): op_
+                for op_ in table_ops.ops
+                if isinstance(op_, ops.CreateForeignKeyOp)
+            }
+            noise = []
+            for op_ in table_ops.ops:
+                if (
+                    isinstance(op_, ops.DropConstraintOp)
+                    and op_.constraint_type == "foreignkey"
+                    and op_._reverse is not None
+                    and _fk_key(op_._reverse) in created
+                ):
+                    noise += [op_, created.pop(_fk_key(op_._reverse))]
+            table_ops.ops = [op_ for op_ in table_ops.ops if op_ not in noise]
+
+        script.upgrade_ops.ops = [
+            op_
+            for op_ in script.upgrade_ops.ops
+            if not (isinstance(op_, ops.ModifyTableOps) and not op_.ops)
+        ]
+
+
+def run_migrations_offline() -> None:
+    """Emit the SQL instead of running it: alembic upgrade head --sql"""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        include_schemas=True,
+        version_table_schema="public",
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connectable = create_engine(DATABASE_URL, poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_schemas=True,
+            include_name=include_name,
+            process_revision_directives=drop_default_schema_fk_noise,
+            version_table_schema="public",
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,472 @@
+"""baseline schema
+
+Every table as of the switch to Alembic. Databases created earlier by
+Base.metadata.create_all already have them: only what is missing is created,
+so `alembic upgrade head` is safe on those too.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-19 11:55:21.021476
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_baseline"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _missing(table: str) -> bool:
+    return not sa.inspect(op.get_bind()).has_table(table, schema="public")
+
+
+def upgrade() -> None:
+    if _missing("categories"):
+        op.create_table(
+            "categories",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=255), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("name"),
+            schema="public",
+        )
+    if _missing("skills"):
+        op.create_table(
+            "skills",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=150), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("name"),
+            schema="public",
+        )
+    # Older databases may hold case-insensitive duplicates that break this
+    # index: run scripts/add_skill_name_lower_index.py first, it merges them
+    op.create_index(
+        "uq_skills_name_lower",
+        "skills",
+        [sa.literal_column("lower(name)")],
+        unique=True,
+        schema="public",
+        if_not_exists=True,
+    )
+    if _missing("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("full_name", sa.String(length=100), nullable=False),
+            sa.Column("email", sa.String(length=150), nullable=False),
+            sa.Column("password", sa.Text(), nullable=True),
+            sa.Column(
+                "role",
+                sa.Enum("employer", "admin", "candidate", name="user_roles"),
+                nullable=False,
+            ),
+            sa.Column("image", sa.Text(), nullable=True),
+            sa.Column("phone", sa.String(length=150), nullable=True),
+            sa.Column("location", sa.String(length=200), nullable=True),
+            sa.Column("bio", sa.Text(), nullable=True),
+            sa.Column("headLine", sa.String(length=200), nullable=True),
+            sa.Column("companyName", sa.Text(), nullable=True),
+            sa.Column("webSite", sa.String(length=150), nullable=True),
+            sa.Column("resume_url", sa.Text(), nullable=True),
+            sa.Column("github_url", sa.String(length=100), nullable=True),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("email"),
+            schema="public",
+        )
+    if _missing("connection_requests"):
+        op.create_table(
+            "connection_requests",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("sender_id", sa.Integer(), nullable=False),
+            sa.Column("receiver_id", sa.Integer(), nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum("pending", "accepted", "rejected", name="connection_status"),
+                server_default="pending",
+                nullable=True,
+            ),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.ForeignKeyConstraint(
+                ["receiver_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(
+                ["sender_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    if _missing("delete_requests"):
+        op.create_table(
+            "delete_requests",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("reason", sa.Text(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    if _missing("educations"):
+        op.create_table(
+            "educations",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("school_name", sa.String(length=150), nullable=True),
+            sa.Column("degree", sa.String(length=150), nullable=True),
+            sa.Column("field_of_study", sa.String(length=150), nullable=True),
+            sa.Column("start_date", sa.Date(), nullable=True),
+            sa.Column("end_date", sa.Date(), nullable=True),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    if _missing("experiences"):
+        op.create_table(
+            "experiences",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("job_title", sa.String(length=150), nullable=False),
+            sa.Column("company", sa.String(length=150), nullable=True),
+            sa.Column("start_date", sa.Date(), nullable=True),
+            sa.Column("end_date", sa.Date(), nullable=True),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    if _missing("jobs"):
+        op.create_table(
+            "jobs",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("employer_id", sa.Integer(), nullable=False),
+            sa.Column("category_id", sa.Integer(), nullable=True),
+            sa.Column("title", sa.String(length=255), nullable=False),
+            sa.Column("company", sa.String(length=255), nullable=False),
+            sa.Column("location", sa.String(length=255), nullable=False),
+            sa.Column("salary_range", sa.String(length=100), nullable=True),
+            sa.Column("emp_type", sa.String(length=50), nullable=True),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("responsibilities", sa.ARRAY(sa.String()), nullable=True),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.ForeignKeyConstraint(
+                ["category_id"],
+                ["public.categories.id"],
+            ),
+            sa.ForeignKeyConstraint(
+                ["employer_id"],
+                ["public.users.id"],
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    if _missing("notifications"):
+        op.create_table(
+            "notifications",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("sender_id", sa.Integer(), nullable=True),
+            sa.Column("receiver_id", sa.Integer(), nullable=False),
+            sa.Column(
+                "type",
+                sa.Enum(
+                    "connection_request",
+                    "connection_accepted",
+                    "job_application",
+                    "application_status",
+                    "job_posted",
+                    name="notification_type",
+                ),
+                nullable=False,
+            ),
+            sa.Column("title", sa.String(length=255), nullable=False),
+            sa.Column("message", sa.Text(), nullable=False),
+            sa.Column("is_read", sa.Integer(), server_default="0", nullable=True),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.ForeignKeyConstraint(
+                ["receiver_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(
+                ["sender_id"], ["public.users.id"], ondelete="SET NULL"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    if _missing("password_reset_tokens"):
+        op.create_table(
+            "password_reset_tokens",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("token", sa.String(length=255), nullable=False),
+            sa.Column("expires_at", sa.DateTime(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.Column("used", sa.Integer(), server_default="0", nullable=True),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("token"),
+            schema="public",
+        )
+    if _missing("user_skills"):
+        op.create_table(
+            "user_skills",
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("skill_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["skill_id"], ["public.skills.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("user_id", "skill_id"),
+            schema="public",
+        )
+    if _missing("applications"):
+        op.create_table(
+            "applications",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("job_id", sa.Integer(), nullable=True),
+            sa.Column("user_id", sa.Integer(), nullable=True),
+            sa.Column("resume_url", sa.Text(), nullable=True),
+            sa.Column("cover_letter", sa.Text(), nullable=True),
+            sa.Column(
+                "status",
+                sa.Enum(
+                    "pending",
+                    "reviewed",
+                    "accepted",
+                    "rejected",
+                    name="application_status",
+                ),
+                server_default="pending",
+                nullable=True,
+            ),
+            sa.Column(
+                "applied_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.ForeignKeyConstraint(["job_id"], ["public.jobs.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    if _missing("job_applicants"):
+        op.create_table(
+            "job_applicants",
+            sa.Column("job_id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(["job_id"], ["public.jobs.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("job_id", "user_id"),
+            schema="public",
+        )
+    if _missing("job_skills"):
+        op.create_table(
+            "job_skills",
+            sa.Column("job_id", sa.Integer(), nullable=False),
+            sa.Column("skill_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(["job_id"], ["public.jobs.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(
+                ["skill_id"], ["public.skills.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("job_id", "skill_id"),
+            schema="public",
+        )
+    if _missing("reports"):
+        op.create_table(
+            "reports",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("job_id", sa.Integer(), nullable=False),
+            sa.Column("reason", sa.Text(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.ForeignKeyConstraint(["job_id"], ["public.jobs.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    if _missing("saved_jobs"):
+        op.create_table(
+            "saved_jobs",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=True),
+            sa.Column("job_id", sa.Integer(), nullable=True),
+            sa.Column(
+                "saved_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.ForeignKeyConstraint(["job_id"], ["public.jobs.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    if _missing("resume_documents"):
+        op.create_table(
+            "resume_documents",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("application_id", sa.Integer(), nullable=True),
+            sa.Column("file_url", sa.Text(), nullable=False),
+            sa.Column("content", sa.Text(), nullable=True),
+            sa.Column("skill_tokens", sa.ARRAY(sa.String()), nullable=True),
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(
+                    "to_tsvector('english', coalesce(content, ''))", persisted=True
+                ),
+                nullable=True,
+            ),
+            sa.Column(
+                "extracted_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.ForeignKeyConstraint(
+                ["application_id"], ["public.applications.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("file_url"),
+            schema="public",
+        )
+    op.create_index(
+        "ix_resume_documents_search_vector",
+        "resume_documents",
+        ["search_vector"],
+        unique=False,
+        schema="public",
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_resume_documents_skill_tokens",
+        "resume_documents",
+        ["skill_tokens"],
+        unique=False,
+        schema="public",
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_resume_documents_user_id",
+        "resume_documents",
+        ["user_id"],
+        unique=False,
+        schema="public",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_resume_documents_user_id", table_name="resume_documents", schema="public"
+    )
+    op.drop_index(
+        "ix_resume_documents_skill_tokens",
+        table_name="resume_documents",
+        schema="public",
+        postgresql_using="gin",
+    )
+    op.drop_index(
+        "ix_resume_documents_search_vector",
+        table_name="resume_documents",
+        schema="public",
+        postgresql_using="gin",
+    )
+    op.drop_table("resume_documents", schema="public")
+    op.drop_table("saved_jobs", schema="public")
+    op.drop_table("reports", schema="public")
+    op.drop_table("job_skills", schema="public")
+    op.drop_table("job_applicants", schema="public")
+    op.drop_table("applications", schema="public")
+    op.drop_table("user_skills", schema="public")
+    op.drop_table("password_reset_tokens", schema="public")
+    op.drop_table("notifications", schema="public")
+    op.drop_table("jobs", schema="public")
+    op.drop_table("experiences", schema="public")
+    op.drop_table("educations", schema="public")
+    op.drop_table("delete_requests", schema="public")
+    op.drop_table("connection_requests", schema="public")
+    op.drop_table("users", schema="public")
+    op.drop_index("uq_skills_name_lower", table_name="skills", schema="public")
+    op.drop_table("skills", schema="public")
+    op.drop_table("categories", schema="public")
+    for enum_name in (
+        "application_status",
+        "connection_status",
+        "notification_type",
+        "user_roles",
+    ):
+        sa.Enum(name=enum_name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,59 @@
+"""users.updated_at and indexes for conditional GETs
+
+users.updated_at is the last change to a user's public profile, existing rows
+start at their created_at. The indexes keep the ETag / Last-Modified queries
+of job pages and an employer's job list off sequential scans.
+
+Revision ID: 0002_conditional_get
+Revises: 0001_baseline
+Create Date: 2026-10-19 15:02:40.118305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_conditional_get"
+down_revision: Union[str, Sequence[str], None] = "0001_baseline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = sa.inspect(op.get_bind()).get_columns("users", schema="public")
+    if not any(c["name"] == "updated_at" for c in columns):
+        op.add_column(
+            "users",
+            sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+            schema="public",
+        )
+        op.execute(
+            "UPDATE public.users SET updated_at = created_at "
+            "WHERE created_at IS NOT NULL"
+        )
+
+    op.create_index(
+        "ix_applications_job_id_applied_at",
+        "applications",
+        ["job_id", "applied_at"],
+        schema="public",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_jobs_employer_id_updated_at",
+        "jobs",
+        ["employer_id", "updated_at"],
+        schema="public",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_employer_id_updated_at", table_name="jobs", schema="public")
+    op.drop_index(
+        "ix_applications_job_id_applied_at", table_name="applications", schema="public"
+    )
+    op.drop_column("users", "updated_at", schema="public")
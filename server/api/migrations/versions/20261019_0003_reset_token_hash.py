@@ -0,0 +1,91 @@
+"""Store password reset tokens hashed
+
+password_reset_tokens.token held the plaintext from the reset link; it is
+replaced by token_hash, its sha256. Outstanding links keep working as the
+existing tokens are hashed in place. Downgrading can't restore plaintexts:
+links sent before the downgrade stop working.
+
+Revision ID: 0003_reset_token_hash
+Revises: 0002_conditional_get
+Create Date: 2026-10-19 17:41:09.502114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_reset_token_hash"
+down_revision: Union[str, Sequence[str], None] = "0002_conditional_get"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = sa.inspect(op.get_bind()).get_columns(
+        "password_reset_tokens", schema="public"
+    )
+    if not any(c["name"] == "token_hash" for c in columns):
+        op.add_column(
+            "password_reset_tokens",
+            sa.Column("token_hash", sa.String(length=64), nullable=True),
+            schema="public",
+        )
+        op.execute(
+            "UPDATE public.password_reset_tokens "
+            "SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')"
+        )
+        op.alter_column(
+            "password_reset_tokens", "token_hash", nullable=False, schema="public"
+        )
+        op.create_unique_constraint(
+            "password_reset_tokens_token_hash_key",
+            "password_reset_tokens",
+            ["token_hash"],
+            schema="public",
+        )
+        op.drop_column("password_reset_tokens", "token", schema="public")
+
+    op.create_index(
+        "ix_password_reset_tokens_user_id",
+        "password_reset_tokens",
+        ["user_id"],
+        schema="public",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_password_reset_tokens_expires_at",
+        "password_reset_tokens",
+        ["expires_at"],
+        schema="public",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_password_reset_tokens_expires_at",
+        table_name="password_reset_tokens",
+        schema="public",
+    )
+    op.drop_index(
+        "ix_password_reset_tokens_user_id",
+        table_name="password_reset_tokens",
+        schema="public",
+    )
+    op.add_column(
+        "password_reset_tokens",
+        sa.Column("token", sa.String(length=255), nullable=True),
+        schema="public",
+    )
+    op.execute("UPDATE public.password_reset_tokens SET token = token_hash")
+    op.alter_column("password_reset_tokens", "token", nullable=False, schema="public")
+    op.create_unique_constraint(
+        "password_reset_tokens_token_key",
+        "password_reset_tokens",
+        ["token"],
+        schema="public",
+    )
+    op.drop_column("password_reset_tokens", "token_hash", schema="public")
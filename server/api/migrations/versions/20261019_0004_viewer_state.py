@@ -0,0 +1,38 @@
+"""Indexes for per-user job flags and the saved jobs list
+
+Job lists look up which of their jobs the viewer saved, applied to or
+reported with `user_id = ? AND job_id IN (...)`; the saved jobs page lists a
+user's saves newest first.
+
+Revision ID: 0004_viewer_state
+Revises: 0003_reset_token_hash
+Create Date: 2026-10-19 19:12:47.330871
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_viewer_state"
+down_revision: Union[str, Sequence[str], None] = "0003_reset_token_hash"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_saved_jobs_user_id_saved_at", "saved_jobs", ["user_id", "saved_at"]),
+    ("ix_saved_jobs_user_id_job_id", "saved_jobs", ["user_id", "job_id"]),
+    ("ix_applications_user_id_job_id", "applications", ["user_id", "job_id"]),
+    ("ix_reports_user_id_job_id", "reports", ["user_id", "job_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, schema="public", if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, schema="public")
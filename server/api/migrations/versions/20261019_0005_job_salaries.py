@@ -0,0 +1,65 @@
+"""Structured job salaries and filter indexes
+
+jobs.salary_min / salary_max / salary_currency hold what salary_range says
+in numbers; fill them for existing rows with scripts/backfill_salaries.py.
+Salary filters are int4range overlaps on a GiST index, employment type and
+category filters use btree indexes that also serve the newest-first order.
+
+Revision ID: 0005_job_salaries
+Revises: 0004_viewer_state
+Create Date: 2026-10-19 20:05:31.774210
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_job_salaries"
+down_revision: Union[str, Sequence[str], None] = "0004_viewer_state"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    ("salary_min", sa.Integer()),
+    ("salary_max", sa.Integer()),
+    ("salary_currency", sa.String(length=3)),
+]
+
+INDEXES = [
+    ("ix_jobs_created_at", ["created_at"]),
+    ("ix_jobs_emp_type_created_at", ["emp_type", "created_at"]),
+    ("ix_jobs_category_id_created_at", ["category_id", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    existing = {
+        c["name"]
+        for c in sa.inspect(op.get_bind()).get_columns("jobs", schema="public")
+    }
+    for name, type_ in COLUMNS:
+        if name not in existing:
+            op.add_column("jobs", sa.Column(name, type_), schema="public")
+
+    for name, columns in INDEXES:
+        op.create_index(name, "jobs", columns, schema="public", if_not_exists=True)
+    op.create_index(
+        "ix_jobs_salary_span",
+        "jobs",
+        [sa.literal_column("int4range(salary_min, salary_max, '[]')")],
+        schema="public",
+        postgresql_using="gist",
+        postgresql_where=sa.text("salary_currency IS NOT NULL"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_salary_span", table_name="jobs", schema="public")
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="jobs", schema="public")
+    for name, _ in reversed(COLUMNS):
+        op.drop_column("jobs", name, schema="public")
@@ -0,0 +1,56 @@
+"""Geocoded job and user locations
+
+jobs / users .latitude, .longitude and .geohash are what the bundled
+gazetteer makes of location; fill them for existing rows with
+scripts/backfill_geo.py. Radius searches are geohash prefix LIKEs, hence
+the text_pattern_ops index.
+
+Revision ID: 0006_geo
+Revises: 0005_job_salaries
+Create Date: 2026-10-19 21:12:08.402517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_geo"
+down_revision: Union[str, Sequence[str], None] = "0005_job_salaries"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["jobs", "users"]
+
+COLUMNS = [
+    ("latitude", sa.Float()),
+    ("longitude", sa.Float()),
+    ("geohash", sa.String(length=12)),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in TABLES:
+        existing = {c["name"] for c in inspector.get_columns(table, schema="public")}
+        for name, type_ in COLUMNS:
+            if name not in existing:
+                op.add_column(table, sa.Column(name, type_), schema="public")
+
+    op.create_index(
+        "ix_jobs_geohash",
+        "jobs",
+        ["geohash"],
+        schema="public",
+        postgresql_ops={"geohash": "text_pattern_ops"},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_geohash", table_name="jobs", schema="public")
+    for table in reversed(TABLES):
+        for name, _ in reversed(COLUMNS):
+            op.drop_column(table, name, schema="public")
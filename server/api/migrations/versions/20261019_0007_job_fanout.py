@@ -0,0 +1,40 @@
+"""Indexes for job alert fan-out
+
+user_skills by skill finds the candidates matching a new job's skills;
+notifications by receiver and date serves both the notification list and
+the per-user cap on job alerts.
+
+Revision ID: 0007_job_fanout
+Revises: 0006_geo
+Create Date: 2026-10-19 21:48:40.119354
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_job_fanout"
+down_revision: Union[str, Sequence[str], None] = "0006_geo"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_user_skills_skill_id_user_id", "user_skills", ["skill_id", "user_id"]),
+    (
+        "ix_notifications_receiver_id_created_at",
+        "notifications",
+        ["receiver_id", "created_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, schema="public", if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, schema="public")
@@ -0,0 +1,145 @@
+"""Saved searches and job alerts
+
+saved_searches holds a candidate's filters, saved_search_terms is the
+inverted index new jobs are matched through, saved_search_matches records
+each match and whether it has been notified (instantly or in a digest).
+
+Revision ID: 0008_saved_searches
+Revises: 0007_job_fanout
+Create Date: 2026-10-19 22:31:57.604183
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_saved_searches"
+down_revision: Union[str, Sequence[str], None] = "0007_job_fanout"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _missing(table: str) -> bool:
+    return not sa.inspect(op.get_bind()).has_table(table, schema="public")
+
+
+def upgrade() -> None:
+    if _missing("saved_searches"):
+        op.create_table(
+            "saved_searches",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("keyword", sa.String(length=200), nullable=True),
+            sa.Column("skill_ids", postgresql.ARRAY(sa.Integer()), nullable=True),
+            sa.Column("category_id", sa.Integer(), nullable=True),
+            sa.Column("location", sa.String(length=200), nullable=True),
+            sa.Column("latitude", sa.Float(), nullable=True),
+            sa.Column("longitude", sa.Float(), nullable=True),
+            sa.Column("radius_km", sa.Float(), nullable=True),
+            sa.Column(
+                "frequency",
+                sa.Enum("instant", "digest", name="alert_frequency"),
+                server_default="instant",
+                nullable=False,
+            ),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.ForeignKeyConstraint(
+                ["category_id"], ["public.categories.id"], ondelete="SET NULL"
+            ),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["public.users.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    op.create_index(
+        "ix_saved_searches_user_id",
+        "saved_searches",
+        ["user_id"],
+        schema="public",
+        if_not_exists=True,
+    )
+
+    if _missing("saved_search_terms"):
+        op.create_table(
+            "saved_search_terms",
+            sa.Column("term", sa.String(length=64), nullable=False),
+            sa.Column("saved_search_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["saved_search_id"],
+                ["public.saved_searches.id"],
+                ondelete="CASCADE",
+            ),
+            sa.PrimaryKeyConstraint("term", "saved_search_id"),
+            schema="public",
+        )
+    op.create_index(
+        "ix_saved_search_terms_saved_search_id",
+        "saved_search_terms",
+        ["saved_search_id"],
+        schema="public",
+        if_not_exists=True,
+    )
+
+    if _missing("saved_search_matches"):
+        op.create_table(
+            "saved_search_matches",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("saved_search_id", sa.Integer(), nullable=False),
+            sa.Column("job_id", sa.Integer(), nullable=False),
+            sa.Column(
+                "matched_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=True,
+            ),
+            sa.Column("notified_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["job_id"], ["public.jobs.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(
+                ["saved_search_id"],
+                ["public.saved_searches.id"],
+                ondelete="CASCADE",
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            schema="public",
+        )
+    op.create_index(
+        "uq_saved_search_matches_search_job",
+        "saved_search_matches",
+        ["saved_search_id", "job_id"],
+        unique=True,
+        schema="public",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_saved_search_matches_job_id",
+        "saved_search_matches",
+        ["job_id"],
+        schema="public",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_saved_search_matches_pending",
+        "saved_search_matches",
+        ["saved_search_id"],
+        schema="public",
+        postgresql_where=sa.text("notified_at IS NULL"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("saved_search_matches", schema="public")
+    op.drop_table("saved_search_terms", schema="public")
+    op.drop_table("saved_searches", schema="public")
+    sa.Enum(name="alert_frequency").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,62 @@
+"""Reindex saved searches whose keyword only had one letter words
+
+Searches such as "C" or "R" were indexed under the catch-all term and
+matched every new job, one letter words being dropped. Their terms are
+rewritten with the current search_terms(); other searches are untouched.
+
+Revision ID: 0009_reindex_short_keywords
+Revises: 0008_saved_searches
+Create Date: 2026-10-19 23:12:40.118306
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from services.saved_searches import search_terms
+
+# revision identifiers, used by Alembic.
+revision: str = "0009_reindex_short_keywords"
+down_revision: Union[str, Sequence[str], None] = "0008_saved_searches"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    searches = bind.execute(
+        sa.text(
+            """
+            SELECT id, keyword, latitude, longitude, radius_km, skill_ids,
+                   category_id
+            FROM public.saved_searches
+            WHERE keyword IS NOT NULL
+              AND id IN (
+                  SELECT saved_search_id FROM public.saved_search_terms
+                  WHERE term = '*:'
+              )
+            """
+        )
+    ).all()
+
+    for search in searches:
+        bind.execute(
+            sa.text(
+                "DELETE FROM public.saved_search_terms WHERE saved_search_id = :id"
+            ),
+            {"id": search.id},
+        )
+        bind.execute(
+            sa.text(
+                "INSERT INTO public.saved_search_terms (term, saved_search_id) "
+                "VALUES (:term, :id)"
+            ),
+            [{"term": term, "id": search.id} for term in search_terms(search)],
+        )
+
+
+def downgrade() -> None:
+    # The old terms matched every job, nothing worth restoring
+    pass
@@ -17,6 +17,12 @@ from controllers.candidates import (
     get_public_user,
     get_random_candidates,
 )
+from controllers.saved_searches import (
+    create_saved_search,
+    delete_saved_search,
+    get_saved_search_jobs,
+    get_saved_searches,
+)
 
 
 candidates = Blueprint("candidates", __name__)
@@ -86,4 +92,24 @@ candidates.add_url_rule(
 )
 candidates.add_url_rule(
     "/skills/<int:skill_id>", "delete_skill", delete_skill, methods=["DELETE"]
-)
\ No newline at end of file
+)
+
+# SAVED SEARCH ROUTES (job alerts)
+candidates.add_url_rule(
+    "/saved-searches", "get_saved_searches", get_saved_searches, methods=["GET"]
+)
+candidates.add_url_rule(
+    "/saved-searches", "create_saved_search", create_saved_search, methods=["POST"]
+)
+candidates.add_url_rule(
+    "/saved-searches/<int:search_id>",
+    "delete_saved_search",
+    delete_saved_search,
+    methods=["DELETE"],
+)
+candidates.add_url_rule(
+    "/saved-searches/<int:search_id>/jobs",
+    "get_saved_search_jobs",
+    get_saved_search_jobs,
+    methods=["GET"],
+)
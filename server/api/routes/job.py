@@ -11,7 +11,9 @@ from controllers.job import (
     get_employer_jobs,
     get_skills,
     create_or_get_skill,
-    get_jobs_for_user
+    get_jobs_for_user,
+    create_jobs_bulk,
+    report_job,
 )
 
 job = Blueprint("job", __name__)
@@ -34,6 +36,11 @@ def create_job_route():
     return create_job()
 
 
+@job.route("/bulk", methods=["POST"])
+def create_jobs_bulk_route():
+    return create_jobs_bulk()
+
+
 @job.route("/<int:job_id>", methods=["PUT"])
 def update_job_route(job_id: int):
     return update_job(job_id)
@@ -0,0 +1,634 @@
+"""
+Bulk seeding for load-test sized datasets.
+
+    python seed/bulk.py --scale 2 --seed 42 --workers 8 --truncate
+
+--scale 1 is roughly 5M rows. Rows are generated in worker processes,
+written as CSV and loaded with COPY. Every chunk draws from its own RNG
+seeded with (seed, table, chunk), so the same arguments always produce the
+same dataset (password salt aside), whatever the number of workers.
+"""
+
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from multiprocessing import Pool
+
+import psycopg2
+from dotenv import load_dotenv
+from faker import Faker
+from werkzeug.security import generate_password_hash
+
+load_dotenv()
+
+DB_USER = os.getenv("DB_USERNAME")
+DB_PASSWORD = os.getenv("DB_PASSWORD")
+DB_HOST = os.getenv("DB_HOST")
+DB_PORT = os.getenv("DB_PORT")
+DB_NAME = os.getenv("DB_NAME")
+
+DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+# Every seeded account logs in with this password
+SEED_PASSWORD = "12341234"
+
+# Lookup tables don't grow with --scale
+SKILLS = 2_000
+CATEGORIES = 60
+# Row counts at --scale 1 (link tables are sized per owner, see the generators)
+BASE_COUNTS = {
+    "users": 200_000,
+    "jobs": 100_000,
+    "notifications": 1_000_000,
+}
+CHUNK_SIZE = 20_000
+POOL_SIZE = 2_000  # faker values drawn up front and recombined per row
+HISTORY_DAYS = 90
+
+ROLES_EVERY = {"employer": 5, "admin": 500}
+EMP_TYPES = ["full-time", "part-time", "contract", "internship"]
+DEGREES = ["Bachelor's", "Master's", "PhD", "Associate", "Certificate"]
+APPLICATION_STATUSES = ["pending", "reviewed", "accepted", "rejected"]
+CONNECTION_STATUSES = ["pending", "accepted", "rejected"]
+NOTIFICATION_TYPES = [
+    "connection_request",
+    "connection_accepted",
+    "job_application",
+    "application_status",
+    "job_posted",
+]
+
+COLUMNS = {
+    "users": (
+        "id",
+        "full_name",
+        "email",
+        "password",
+        "role",
+        "image",
+        "phone",
+        "location",
+        "bio",
+        "headLine",
+        "companyName",
+        "webSite",
+        "resume_url",
+        "github_url",
+        "created_at",
+    ),
+    "user_skills": ("user_id", "skill_id"),
+    "educations": (
+        "user_id",
+        "school_name",
+        "degree",
+        "field_of_study",
+        "start_date",
+        "end_date",
+        "description",
+    ),
+    "experiences": (
+        "user_id",
+        "job_title",
+        "company",
+        "start_date",
+        "end_date",
+        "description",
+    ),
+    "connection_requests": ("sender_id", "receiver_id", "status", "created_at"),
+    "delete_requests": ("user_id", "reason", "created_at"),
+    "notifications": (
+        "sender_id",
+        "receiver_id",
+        "type",
+        "title",
+        "message",
+        "is_read",
+        "created_at",
+    ),
+    "jobs": (
+        "id",
+        "employer_id",
+        "category_id",
+        "title",
+        "company",
+        "location",
+        "salary_range",
+        "emp_type",
+        "description",
+        "responsibilities",
+        "created_at",
+        "updated_at",
+    ),
+    "job_skills": ("job_id", "skill_id"),
+    "applications": (
+        "job_id",
+        "user_id",
+        "resume_url",
+        "cover_letter",
+        "status",
+        "applied_at",
+    ),
+    "job_applicants": ("job_id", "user_id"),
+    "saved_jobs": ("user_id", "job_id", "saved_at"),
+    "reports": ("user_id", "job_id", "reason", "created_at"),
+}
+
+# Each stage only references rows loaded by the previous ones
+STAGES = [
+    ["users"],
+    ["user_rows", "jobs", "notifications"],
+    ["job_rows", "job_activity"],
+]
+# Generator name -> the table whose id range it is chunked over
+CHUNKED_OVER = {
+    "users": "users",
+    "user_rows": "users",
+    "notifications": "notifications",
+    "jobs": "jobs",
+    "job_rows": "jobs",
+    "job_activity": "users",
+}
+
+
+# ============================================================
+# Helpers
+# ============================================================
+def role_for(index: int) -> str:
+    """Role of the index-th seeded user, derivable without a lookup"""
+    if index % ROLES_EVERY["admin"] == 1:
+        return "admin"
+    return "employer" if index % ROLES_EVERY["employer"] == 0 else "candidate"
+
+
+def pg_array(items) -> str:
+    """PostgreSQL array literal for a list of strings"""
+    quoted = (
+        '"' + item.replace("\\", "\\\\").replace('"', '\\"') + '"' for item in items
+    )
+    return "{" + ",".join(quoted) + "}"
+
+
+def build_pools(seed: int) -> dict:
+    """Faker is far too slow per row at this scale, draw value pools once"""
+    faker = Faker()
+    faker.seed_instance(seed)
+    return {
+        "first_names": [faker.first_name() for _ in range(POOL_SIZE)],
+        "last_names": [faker.last_name() for _ in range(POOL_SIZE)],
+        "companies": [faker.company() for _ in range(POOL_SIZE)],
+        "cities": [faker.city() for _ in range(POOL_SIZE)],
+        "jobs": [faker.job() for _ in range(POOL_SIZE)],
+        "sentences": [faker.sentence() for _ in range(POOL_SIZE)],
+        "texts": [faker.text(max_nb_chars=300) for _ in range(POOL_SIZE)],
+        "phones": [faker.phone_number()[:20] for _ in range(POOL_SIZE)],
+        "words": [faker.word() for _ in range(POOL_SIZE)],
+    }
+
+
+def unique_names(pool: list, count: int) -> list:
+    """`count` distinct names from the pool, numbered once it runs out"""
+    names = []
+    seen = set()
+    for i in range(count * 4):
+        name = pool[i % len(pool)][:140]
+        if i >= len(pool):
+            name = f"{name} {i // len(pool) + 1}"
+        key = name.lower()
+        if key not in seen:
+            seen.add(key)
+            names.append(name)
+            if len(names) == count:
+                break
+    return names
+
+
+# ============================================================
+# Worker side
+# ============================================================
+_worker = {}
+
+
+def _init_worker(database_url: str, pools: dict, ctx: dict):
+    conn = psycopg2.connect(database_url)
+    with conn.cursor() as cur:
+        cur.execute("SET synchronous_commit = off")
+    conn.commit()
+    _worker.update(conn=conn, pools=pools, ctx=ctx)
+
+
+class _Chunk:
+    """Per-chunk RNG plus the shortcuts generators need"""
+
+    def __init__(self, seed: int, name: str, number: int, pools: dict, ctx: dict):
+        self.rng = random.Random(f"{seed}:{name}:{number}")
+        self.pools = pools
+        self.ctx = ctx
+
+    def pick(self, pool: str):
+        return self.rng.choice(self.pools[pool])
+
+    def timestamp(self) -> str:
+        offset = self.rng.randrange(HISTORY_DAYS * 86_400)
+        return (self.ctx["anchor"] - timedelta(seconds=offset)).isoformat(" ")
+
+    def dates(self):
+        start = date(2005, 1, 1) + timedelta(days=self.rng.randrange(6_500))
+        end = start + timedelta(days=self.rng.randrange(30, 2_000))
+        return start.isoformat(), min(end, self.ctx["anchor"].date()).isoformat()
+
+    def user_id(self) -> int:
+        return self.ctx["user_base"] + 1 + self.rng.randrange(self.ctx["users"])
+
+    def employer_id(self) -> int:
+        employers = (self.ctx["users"] + ROLES_EVERY["employer"] - 1) // ROLES_EVERY[
+            "employer"
+        ]
+        return (
+            self.ctx["user_base"]
+            + 1
+            + ROLES_EVERY["employer"] * self.rng.randrange(employers)
+        )
+
+    def sample_ids(self, base: int, count: int, k: int, exclude: int = None) -> list:
+        """k distinct ids in base+1..base+count, never `exclude`"""
+        k = min(k, count - (exclude is not None))
+        picked = set()
+        while len(picked) < k:
+            candidate = base + 1 + self.rng.randrange(count)
+            if candidate != exclude:
+                picked.add(candidate)
+        return sorted(picked)
+
+
+def gen_users(c: _Chunk, start: int, stop: int) -> dict:
+    ctx = c.ctx
+    rows = []
+    for index in range(start, stop):
+        user_id = ctx["user_base"] + 1 + index
+        first, last = c.pick("first_names"), c.pick("last_names")
+        role = role_for(index)
+        slug = f"{first}.{last}".lower().replace(" ", "").replace("'", "")
+        rows.append(
+            (
+                user_id,
+                f"{first} {last}"[:100],
+                f"{slug}.{user_id}@seed.example.com",
+                ctx["password_hash"],
+                role,
+                None,
+                c.pick("phones"),
+                c.pick("cities")[:200],
+                c.pick("texts")[:200],
+                c.pick("jobs")[:200],
+                c.pick("companies") if role == "employer" else None,
+                f"https://{slug[:40]}.example.com",
+                None,
+                f"https://github.com/{slug[:60]}",
+                c.timestamp(),
+            )
+        )
+    return {"users": rows}
+
+
+def gen_user_rows(c: _Chunk, start: int, stop: int) -> dict:
+    """Skills, education, experience, connections and delete requests"""
+    ctx = c.ctx
+    out = {
+        "user_skills": [],
+        "educations": [],
+        "experiences": [],
+        "connection_requests": [],
+        "delete_requests": [],
+    }
+    skill_ids = ctx["skill_ids"]
+    for index in range(start, stop):
+        user_id = ctx["user_base"] + 1 + index
+
+        for skill_id in c.rng.sample(
+            skill_ids, k=min(c.rng.randint(1, 5), len(skill_ids))
+        ):
+            out["user_skills"].append((user_id, skill_id))
+
+        for _ in range(c.rng.randint(0, 2)):
+            start_date, end_date = c.dates()
+            out["educations"].append(
+                (
+                    user_id,
+                    c.pick("companies")[:150],
+                    c.rng.choice(DEGREES),
+                    c.pick("jobs")[:150],
+                    start_date,
+                    end_date,
+                    c.pick("texts")[:200],
+                )
+            )
+
+        for _ in range(c.rng.randint(0, 3)):
+            start_date, end_date = c.dates()
+            out["experiences"].append(
+                (
+                    user_id,
+                    c.pick("jobs")[:150],
+                    c.pick("companies")[:150],
+                    start_date,
+                    end_date,
+                    c.pick("texts")[:200],
+                )
+            )
+
+        # A pair belongs to its lower id, so chunks can never produce the same pair
+        higher = ctx["users"] - index - 1
+        if higher > 0:
+            for other in c.sample_ids(user_id, higher, c.rng.randint(0, 5)):
+                sender, receiver = (
+                    (user_id, other) if c.rng.random() < 0.5 else (other, user_id)
+                )
+                out["connection_requests"].append(
+                    (sender, receiver, c.rng.choice(CONNECTION_STATUSES), c.timestamp())
+                )
+
+        if c.rng.random() < 0.01:
+            out["delete_requests"].append(
+                (user_id, c.pick("texts")[:200], c.timestamp())
+            )
+    return out
+
+
+def gen_notifications(c: _Chunk, start: int, stop: int) -> dict:
+    rows = []
+    for _ in range(start, stop):
+        receiver = c.user_id()
+        sender = c.user_id()
+        while sender == receiver and c.ctx["users"] > 1:
+            sender = c.user_id()
+        rows.append(
+            (
+                sender,
+                receiver,
+                c.rng.choice(NOTIFICATION_TYPES),
+                c.pick("sentences")[:255],
+                c.pick("texts"),
+                c.rng.randint(0, 1),
+                c.timestamp(),
+            )
+        )
+    return {"notifications": rows}
+
+
+def gen_jobs(c: _Chunk, start: int, stop: int) -> dict:
+    ctx = c.ctx
+    rows = []
+    for index in range(start, stop):
+        created_at = c.timestamp()
+        low = c.rng.randint(30, 80)
+        rows.append(
+            (
+                ctx["job_base"] + 1 + index,
+                c.employer_id(),
+                c.rng.choice(ctx["category_ids"]),
+                c.pick("jobs")[:255],
+                c.pick("companies")[:255],
+                c.pick("cities")[:255],
+                f"${low}k-${c.rng.randint(low + 10, 200)}k",
+                c.rng.choice(EMP_TYPES),
+                c.pick("texts"),
+                pg_array(c.pick("sentences") for _ in range(c.rng.randint(2, 5))),
+                created_at,
+                created_at,
+            )
+        )
+    return {"jobs": rows}
+
+
+def gen_job_rows(c: _Chunk, start: int, stop: int) -> dict:
+    ctx = c.ctx
+    skill_ids = ctx["skill_ids"]
+    rows = []
+    for index in range(start, stop):
+        job_id = ctx["job_base"] + 1 + index
+        for skill_id in c.rng.sample(
+            skill_ids, k=min(c.rng.randint(2, 7), len(skill_ids))
+        ):
+            rows.append((job_id, skill_id))
+    return {"job_skills": rows}
+
+
+def gen_job_activity(c: _Chunk, start: int, stop: int) -> dict:
+    """Applications, saved jobs and reports, chunked over the users that own them"""
+    ctx = c.ctx
+    out = {
+        "applications": [],
+        "job_applicants": [],
+        "saved_jobs": [],
+        "reports": [],
+    }
+    for index in range(start, stop):
+        user_id = ctx["user_base"] + 1 + index
+
+        if role_for(index) == "candidate":
+            for job_id in c.sample_ids(
+                ctx["job_base"], ctx["jobs"], c.rng.randint(0, 10)
+            ):
+                out["applications"].append(
+                    (
+                        job_id,
+                        user_id,
+                        f"/uploads/cv/cv_{user_id}.pdf",
+                        c.pick("texts"),
+                        c.rng.choice(APPLICATION_STATUSES),
+                        c.timestamp(),
+                    )
+                )
+                out["job_applicants"].append((job_id, user_id))
+
+        for job_id in c.sample_ids(ctx["job_base"], ctx["jobs"], c.rng.randint(0, 6)):
+            out["saved_jobs"].append((user_id, job_id, c.timestamp()))
+
+        if c.rng.random() < 0.005:
+            job_id = ctx["job_base"] + 1 + c.rng.randrange(ctx["jobs"])
+            out["reports"].append(
+                (user_id, job_id, c.pick("texts")[:200], c.timestamp())
+            )
+    return out
+
+
+GENERATORS = {
+    "users": gen_users,
+    "user_rows": gen_user_rows,
+    "notifications": gen_notifications,
+    "jobs": gen_jobs,
+    "job_rows": gen_job_rows,
+    "job_activity": gen_job_activity,
+}
+
+
+def copy_rows(cur, table: str, rows: list):
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
+    columns = ", ".join(f'"{c}"' for c in COLUMNS[table])
+    cur.copy_expert(
+        f"COPY public.{table} ({columns}) FROM STDIN WITH (FORMAT csv)", buf
+    )
+
+
+def _run_chunk(task) -> dict:
+    name, number, start, stop = task
+    ctx = _worker["ctx"]
+    chunk = _Chunk(ctx["seed"], name, number, _worker["pools"], ctx)
+    generated = GENERATORS[name](chunk, start, stop)
+
+    conn = _worker["conn"]
+    try:
+        with conn.cursor() as cur:
+            for table, rows in generated.items():
+                if rows:
+                    copy_rows(cur, table, rows)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return {table: len(rows) for table, rows in generated.items()}
+
+
+# ============================================================
+# Coordinator
+# ============================================================
+def seed_lookup_table(cur, table: str, names: list) -> list:
+    """Insert names that are missing and return every id of the table"""
+    cur.execute(
+        f"INSERT INTO public.{table} (name) SELECT unnest(%s::text[]) "
+        "ON CONFLICT DO NOTHING",
+        (names,),
+    )
+    cur.execute(f"SELECT id FROM public.{table} ORDER BY id")
+    return [row[0] for row in cur.fetchall()]
+
+
+def seed(scale: float, seed_value: int, workers: int, truncate: bool):
+    counts = {k: max(1, int(v * scale)) for k, v in BASE_COUNTS.items()}
+    pools = build_pools(seed_value)
+    started = time.monotonic()
+
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        with conn.cursor() as cur:
+            if truncate:
+                print("Truncating seeded tables...")
+                cur.execute(
+                    "TRUNCATE public.users, public.skills, public.categories "
+                    "RESTART IDENTITY CASCADE"
+                )
+
+            skill_ids = seed_lookup_table(
+                cur, "skills", unique_names(pools["jobs"], SKILLS)
+            )
+            category_ids = seed_lookup_table(
+                cur,
+                "categories",
+                unique_names([w.capitalize() for w in pools["words"]], CATEGORIES),
+            )
+
+            # New rows get ids after whatever is already there
+            cur.execute("SELECT coalesce(max(id), 0) FROM public.users")
+            user_base = cur.fetchone()[0]
+            cur.execute("SELECT coalesce(max(id), 0) FROM public.jobs")
+            job_base = cur.fetchone()[0]
+        conn.commit()
+    finally:
+        conn.close()
+
+    print(f"✓ {len(skill_ids)} skills, {len(category_ids)} categories")
+
+    ctx = {
+        "seed": seed_value,
+        "users": counts["users"],
+        "jobs": counts["jobs"],
+        "user_base": user_base,
+        "job_base": job_base,
+        "skill_ids": skill_ids,
+        "category_ids": category_ids,
+        # Hashing is deliberately slow, every user shares one hash
+        "password_hash": generate_password_hash(SEED_PASSWORD),
+        "anchor": datetime.combine(date.today(), datetime.min.time()),
+    }
+    totals = {}
+
+    with Pool(
+        workers, initializer=_init_worker, initargs=(DATABASE_URL, pools, ctx)
+    ) as pool:
+        for stage in STAGES:
+            tasks = []
+            for name in stage:
+                total = counts[CHUNKED_OVER[name]]
+                for number, start in enumerate(range(0, total, CHUNK_SIZE)):
+                    tasks.append((name, number, start, min(start + CHUNK_SIZE, total)))
+
+            for loaded in pool.imap_unordered(_run_chunk, tasks):
+                for table, rows in loaded.items():
+                    totals[table] = totals.get(table, 0) + rows
+            print(f"✓ Loaded {', '.join(stage)}")
+
+    conn = psycopg2.connect(DATABASE_URL)
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            # ids were written explicitly, move the sequences past them
+            for table in ("users", "jobs"):
+                cur.execute(
+                    f"SELECT setval(pg_get_serial_sequence('public.{table}', 'id'), "
+                    f"(SELECT coalesce(max(id), 1) FROM public.{table}))"
+                )
+            print("Analyzing...")
+            for table in ["skills", "categories", *COLUMNS]:
+                cur.execute(f"ANALYZE public.{table}")
+    finally:
+        conn.close()
+
+    elapsed = time.monotonic() - started
+    rows = sum(totals.values())
+    print("\n" + "=" * 50)
+    print(f"✓ Seeded {rows:,} rows in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s)")
+    print("=" * 50)
+    for table, count in sorted(totals.items()):
+        print(f"  - {table}: {count:,}")
+    print(f"All users log in with password {SEED_PASSWORD!r}")
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed a load-test sized dataset")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="1.0 is roughly 5M rows"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="worker processes"
+    )
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="empty users, skills, categories and everything referencing them first",
+    )
+    args = parser.parse_args(argv)
+
+    # Make sure the schema exists before COPY-ing into it (like seed.py does)
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    from sqlalchemy import create_engine
+
+    from core.models import Base
+
+    engine = create_engine(DATABASE_URL)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    seed(args.scale, args.seed, max(1, args.workers), args.truncate)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,7 @@ from core.models import (
     job_skills,
     user_skills,
     job_applicants,
-    ReportedJob
+    Report
 )
 from werkzeug.security import generate_password_hash
 from dotenv import load_dotenv
@@ -42,6 +42,7 @@ DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NA
 engine = create_engine(DATABASE_URL, echo=False)
 session = Session(engine)
 faker = Faker()
+Base.metadata.create_all(engine)
 
 print("Starting seeding process...")
 
@@ -153,12 +154,14 @@ print("✓ Assigned skills to jobs")
 print("Seeding applications...")
 candidates = [u for u in users_list if u.role == "candidate"]
 applications_list = []
+applied_combinations = set()
 
 for _ in range(min(100, len(candidates) * 5)):
     job = random.choice(jobs_list)
     candidate = random.choice(candidates)
     combo = (job.id, candidate.id)
-    if combo not in [(app.job_id, app.user_id) for app in applications_list]:
+    if combo not in applied_combinations:
+        applied_combinations.add(combo)
         app = Application(
             job_id=job.id,
             user_id=candidate.id,
@@ -175,10 +178,12 @@ print(f"✓ Seeded {len(applications_list)} applications")
 # ================== SEED SAVED JOBS ==================
 print("Seeding saved jobs...")
 saved_jobs_list = []
+saved_combinations = set()
 for _ in range(100):
     job = random.choice(jobs_list)
     user = random.choice(users_list)
-    if (job.id, user.id) not in [(s.job_id, s.user_id) for s in saved_jobs_list]:
+    if (job.id, user.id) not in saved_combinations:
+        saved_combinations.add((job.id, user.id))
         saved_jobs_list.append(SavedJob(
             job_id=job.id,
             user_id=user.id,
@@ -232,8 +237,7 @@ print("Seeding notifications...")
 notifications_list = []
 notif_types = ["connection_request", "connection_accepted", "job_application", "application_status", "job_posted"]
 for _ in range(100):
-    sender = random.choice(users_list)
-    receiver = random.choice([u for u in users_list if u.id != sender.id])
+    sender, receiver = random.sample(users_list, 2)
     notifications_list.append(Notification(
         sender_id=sender.id,
         receiver_id=receiver.id,
@@ -250,11 +254,12 @@ print(f"✓ Seeded {len(notifications_list)} notifications")
 # ================== SEED CONNECTION REQUESTS ==================
 print("Seeding connection requests...")
 connections_list = []
+connection_combinations = set()
 for _ in range(100):
-    sender = random.choice(users_list)
-    receiver = random.choice([u for u in users_list if u.id != sender.id])
+    sender, receiver = random.sample(users_list, 2)
     combo = tuple(sorted([sender.id, receiver.id]))
-    if combo not in [tuple(sorted([c.sender_id, c.receiver_id])) for c in connections_list]:
+    if combo not in connection_combinations:
+        connection_combinations.add(combo)
         connections_list.append(ConnectionRequest(
             sender_id=sender.id,
             receiver_id=receiver.id,
@@ -268,9 +273,11 @@ print(f"✓ Seeded {len(connections_list)} connection requests")
 # ================== SEED DELETE REQUESTS ==================
 print("Seeding delete requests...")
 delete_requests_list = []
+delete_request_users = set()
 for _ in range(20):
     user = random.choice(users_list)
-    if user.id not in [dr.user_id for dr in delete_requests_list]:
+    if user.id not in delete_request_users:
+        delete_request_users.add(user.id)
         delete_requests_list.append(DeleteRequest(
             user_id=user.id,
             reason=faker.text(max_nb_chars=200),
@@ -283,11 +290,13 @@ print(f"✓ Seeded {len(delete_requests_list)} delete requests")
 # ================== SEED REPORTED JOBS ==================
 print("Seeding reported jobs...")
 reported_jobs_list = []
+reported_combinations = set()
 for _ in range(20):
     user = random.choice(users_list)
     job = random.choice(jobs_list)
-    if (user.id, job.id) not in [(r.user_id, r.job_id) for r in reported_jobs_list]:
-        reported_jobs_list.append(ReportedJob(
+    if (user.id, job.id) not in reported_combinations:
+        reported_combinations.add((user.id, job.id))
+        reported_jobs_list.append(Report(
             user_id=user.id,
             job_id=job.id,
             reason=faker.text(max_nb_chars=200),
@@ -301,12 +310,14 @@ print(f"✓ Seeded {len(reported_jobs_list)} reported jobs")
 # ================== SEED JOB APPLICANTS (M2M) ==================
 print("Seeding job applicants (many-to-many)...")
 applications_list = []
+applied_combinations = set()
 
 for _ in range(min(100, len(candidates) * 5)):
     job = random.choice(jobs_list)
     candidate = random.choice(candidates)
     combo = (job.id, candidate.id)
-    if combo not in [(app.job_id, app.user_id) for app in applications_list]:
+    if combo not in applied_combinations:
+        applied_combinations.add(combo)
         app = Application(
             job_id=job.id,
             user_id=candidate.id,
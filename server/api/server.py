@@ -1,15 +1,8 @@
 from dotenv import load_dotenv
 
 
-from flask import Flask, jsonify, send_from_directory, redirect, request
+from flask import Flask, jsonify, redirect
 from flask_cors import CORS
-from config.db import Base, engine
-from routes.auth import auth
-from routes.job import job  # Fixed this line
-from routes.admin import admin_bp  # Fixed this line
-from routes.candidates import candidates
-from routes.employers import employers
-from routes.applications import applications
 import os
 from pathlib import Path
 
@@ -20,61 +13,79 @@ load_dotenv()
 PROJECT_ROOT = Path(__file__).parent.parent
 UPLOADS_DIR = PROJECT_ROOT / "uploads"
 
-app = Flask(__name__)
-app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
-
-
-def init_db():
-    """Initialize database tables. Call this after the app starts."""
-    try:
-        Base.metadata.create_all(bind=engine)
-        print("Database tables created successfully!")
-    except Exception as e:
-        print(f"Warning: Could not create database tables: {e}")
-        print("Make sure PostgreSQL is running and the database is accessible.")
-
-
-print(UPLOADS_DIR)
-
-print(UPLOADS_DIR)
-
-CORS(
-    app,
-    supports_credentials=True,
-    origins=["http://localhost:3000"],
-    allow_headers=["Content-Type", "Authorization"],
-)
-
-app.register_blueprint(auth, url_prefix="/api/auth")
-app.register_blueprint(job, url_prefix="/api/jobs")
-app.register_blueprint(admin_bp, url_prefix="/api/admin")
-app.register_blueprint(candidates, url_prefix="/api/candidates")
-app.register_blueprint(employers, url_prefix="/api/employers")
-app.register_blueprint(applications, url_prefix="/api/applications")
-
-from routes.connections import connections
-from routes.notifications import notifications
-from routes.search import search
-
-app.register_blueprint(connections, url_prefix="/api/connections")
-app.register_blueprint(notifications, url_prefix="/api/notifications")
-app.register_blueprint(search, url_prefix="/api/search")
-
-
-
-@app.route("/")
-def home():
-    return jsonify({"message": "Server is running", "status": "ok"})
-
-
-# Serve uploaded files
-@app.route("/uploads/<path:filename>")
-def serve_upload(filename):
-    return send_from_directory(str(UPLOADS_DIR), filename)
 
+def create_app():
+    """
+    Build the Flask app. Nothing here talks to the database: the engine is
+    created by the first request that needs it, and the schema is managed
+    with Alembic (see _docs/alembic.md).
+    """
+    from config.db import get_engine
+    from middlewares.compression import init_compression
+    from middlewares.instrumentation import init_instrumentation
+    from routes.admin import admin_bp
+    from routes.applications import applications
+    from routes.auth import auth
+    from routes.candidates import candidates
+    from routes.connections import connections
+    from routes.employers import employers
+    from routes.job import job
+    from routes.notifications import notifications
+    from routes.search import search
+    from services.images import original_for_thumbnail, schedule_thumbnails
+    from services.cache import response_cache
+    from services.metrics import init_metrics, register_cache, register_pool
+    from services.serialization import init_json
+    from services.skill_registry import skill_registry
+    from services.uploads import send_upload, UPLOADS_SENDFILE
+
+    app = Flask(__name__)
+    app.config["SECRET_KEY"] = os.getenv("SECRET_KEY")
+    app.use_x_sendfile = UPLOADS_SENDFILE == "x-sendfile"
+    init_json(app)
+    # after_request hooks run last-registered first: compress the final body
+    init_compression(app)
+    init_instrumentation(app)
+    init_metrics(app)
+    register_pool("db", get_engine)
+    register_cache("skills", lambda: (skill_registry.hits, skill_registry.misses))
+    register_cache("responses", lambda: (response_cache.hits, response_cache.misses))
+
+    CORS(
+        app,
+        supports_credentials=True,
+        origins=["http://localhost:3000"],
+        allow_headers=["Content-Type", "Authorization"],
+    )
+
+    app.register_blueprint(auth, url_prefix="/api/auth")
+    app.register_blueprint(job, url_prefix="/api/jobs")
+    app.register_blueprint(admin_bp, url_prefix="/api/admin")
+    app.register_blueprint(candidates, url_prefix="/api/candidates")
+    app.register_blueprint(employers, url_prefix="/api/employers")
+    app.register_blueprint(applications, url_prefix="/api/applications")
+    app.register_blueprint(connections, url_prefix="/api/connections")
+    app.register_blueprint(notifications, url_prefix="/api/notifications")
+    app.register_blueprint(search, url_prefix="/api/search")
+
+    @app.route("/")
+    def home():
+        return jsonify({"message": "Server is running", "status": "ok"})
+
+    # Serve uploaded files
+    @app.route("/uploads/<path:filename>")
+    def serve_upload(filename):
+        # Thumbnails are generated in the background, point at the original meanwhile
+        original = original_for_thumbnail(str(UPLOADS_DIR), filename)
+        if original and not (UPLOADS_DIR / filename).is_file():
+            schedule_thumbnails(str(UPLOADS_DIR / original))
+            return redirect(f"/uploads/{original}")
+
+        return send_upload(str(UPLOADS_DIR), filename)
+
+    return app
 
 
 if __name__ == "__main__":
-    # Initialize database tables when running directly
-    init_db()
-    app.run(debug=True)
+    # Run `alembic upgrade head` first on a fresh database
+    create_app().run(debug=True)
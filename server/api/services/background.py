@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+
+# Named executors so slow work (image resizing, document parsing, ...) runs
+# off the request thread. Pools are created lazily, after a worker fork.
+_executors = {}
+_pending = {}
+_lock = Lock()
+
+
+def get_executor(name: str, max_workers: int = None, processes: bool = False):
+    with _lock:
+        executor = _executors.get(name)
+        if executor is None:
+            if processes:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix=f"bg-{name}"
+                )
+            _executors[name] = executor
+            _pending[name] = 0
+        return executor
+
+
+def submit(name: str, fn, *args, max_workers: int = None, processes: bool = False):
+    """
+    Run fn(*args) on the named pool and return its Future.
+    Failures are logged, the caller never has to wait on the result.
+    """
+    executor = get_executor(name, max_workers=max_workers, processes=processes)
+
+    with _lock:
+        _pending[name] += 1
+
+    future = executor.submit(fn, *args)
+    future.add_done_callback(lambda f: _task_done(name, f))
+    return future
+
+
+def _task_done(name: str, future):
+    with _lock:
+        if name in _pending:
+            _pending[name] -= 1
+
+    if not future.cancelled() and future.exception() is not None:
+        print(f"Background task on '{name}' failed: {future.exception()}")
+
+
+def queue_depths() -> dict:
+    """Number of submitted but unfinished tasks per pool"""
+    with _lock:
+        return dict(_pending)
+
+
+def shutdown(wait: bool = True):
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+        _pending.clear()
+
+    for executor in executors:
+        executor.shutdown(wait=wait)
@@ -0,0 +1,286 @@
+import hashlib
+import json
+import os
+import time
+import uuid
+from functools import wraps
+from threading import Lock
+
+import jwt
+from cachetools import LRUCache
+from dotenv import load_dotenv
+from flask import Response, current_app, g, request
+
+load_dotenv()
+
+# "" keeps responses in process memory (one cache per worker, invalidations
+# only reach that worker). A redis:// URL shares one cache between all
+# workers and needs the `redis` package.
+CACHE_URL = os.getenv("CACHE_URL", "")
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", 300))
+# Cap on TTLs in process memory: the other workers miss an invalidation and
+# serve what they have until it expires. Raise it for a single process.
+CACHE_LOCAL_TTL = int(os.getenv("CACHE_LOCAL_TTL", 5))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 10_000))
+CACHE_PREFIX = os.getenv("CACHE_PREFIX", "hireradar:")
+
+JWT_SECRET = os.getenv("JWT_SECRET", "secret123")
+
+
+class LocalBackend:
+    """
+    In-process stand-in for the subset of the redis-py client used here:
+    get / mget / set(ex=, nx=) / delete. Least recently used keys are evicted
+    past `maxsize`, expired ones are dropped when read.
+    """
+
+    def __init__(self, maxsize: int = CACHE_MAX_ENTRIES):
+        self._data = LRUCache(maxsize=maxsize)  # key -> (expires_at, value)
+        self._lock = Lock()
+
+    def _get(self, key):
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def get(self, key):
+        with self._lock:
+            return self._get(key)
+
+    def mget(self, keys):
+        with self._lock:
+            return [self._get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False):
+        with self._lock:
+            if nx and self._get(key) is not None:
+                return None
+            expires_at = time.monotonic() + ex if ex else None
+            self._data[key] = (expires_at, value)
+            return True
+
+    def delete(self, *keys):
+        with self._lock:
+            return sum(self._data.pop(key, None) is not None for key in keys)
+
+
+def make_backend(url: str = CACHE_URL):
+    if not url:
+        return LocalBackend()
+
+    try:
+        import redis
+    except ImportError:
+        raise RuntimeError("CACHE_URL is a Redis URL, pip install redis") from None
+    return redis.Redis.from_url(url, socket_timeout=0.5)
+
+
+class ResponseCache:
+    """
+    Caches whole JSON responses under tags. An entry remembers the version
+    of each of its tags when it was computed; invalidate() gives a tag a new
+    version, which turns every entry carrying it into a miss. Versions are
+    random tokens, so a tag evicted from the backend can't bring old entries
+    back to life.
+    """
+
+    def __init__(self, backend=None, prefix: str = CACHE_PREFIX):
+        self._backend = backend
+        self._prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        # Connecting to Redis waits until the first request
+        if self._backend is None:
+            self._backend = make_backend()
+        return self._backend
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._prefix}tag:{tag}"
+
+    def tag_versions(self, tags) -> dict:
+        tags = sorted(set(tags))
+        if not tags:
+            return {}
+        keys = [self._tag_key(tag) for tag in tags]
+        versions = self.backend.mget(keys)
+        for i, version in enumerate(versions):
+            if version is None:
+                # First use of the tag (or evicted): whoever sets it first wins
+                self.backend.set(keys[i], uuid.uuid4().hex, nx=True)
+                versions[i] = self.backend.get(keys[i])
+        return {tag: _text(v) for tag, v in zip(tags, versions)}
+
+    def get(self, key: str):
+        raw = self.backend.get(self._prefix + key)
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        stored = entry["tags"]
+        if stored and self.tag_versions(stored) != stored:
+            return None
+        return entry
+
+    def set(self, key: str, entry: dict, ttl: int):
+        if isinstance(self.backend, LocalBackend):
+            ttl = min(ttl, CACHE_LOCAL_TTL)
+        self.backend.set(self._prefix + key, json.dumps(entry), ex=ttl)
+
+    def invalidate(self, *tags):
+        for tag in set(tags):
+            self.backend.set(self._tag_key(tag), uuid.uuid4().hex)
+
+
+def _text(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+response_cache = ResponseCache()
+
+
+def invalidate(*tags):
+    """
+    Drop cached responses carrying any of these tags. Call after the commit:
+    a request still computing from the old rows stores its entry under the
+    old version, which is already stale.
+    """
+    if not CACHE_ENABLED or not tags:
+        return
+    try:
+        response_cache.invalidate(*tags)
+    except Exception as e:
+        print(f"Cache invalidation failed for {tags}: {e}")
+
+
+def add_tags(*tags):
+    """Tag the cached response being computed with tags only known mid-view"""
+    pending = g.get("cache_tags")
+    if pending is not None:
+        pending.update(tags)
+
+
+def cached_value(key: str, compute, tags=(), ttl: int = None):
+    """
+    compute() once per `ttl` for the key, for values that aren't whole
+    responses (counts, aggregates). Must return something JSON can store.
+    Same tags / invalidation as cached_response.
+    """
+    if not CACHE_ENABLED:
+        return compute()
+
+    key = "val:" + hashlib.sha1(key.encode()).hexdigest()
+    try:
+        entry = response_cache.get(key)
+        if entry is None:
+            versions = response_cache.tag_versions(tags)
+    except Exception as e:
+        print(f"Cache unavailable, computing {key}: {e}")
+        return compute()
+
+    if entry is not None:
+        response_cache.hits += 1
+        return entry["value"]
+
+    response_cache.misses += 1
+    value = compute()
+    try:
+        response_cache.set(
+            key, {"tags": versions, "value": value}, ttl or CACHE_DEFAULT_TTL
+        )
+    except Exception as e:
+        print(f"Could not cache {key}: {e}")
+    return value
+
+
+def _viewer() -> str:
+    header = request.headers.get("Authorization", "")
+    if not header.startswith("Bearer "):
+        return "anon"
+    try:
+        payload = jwt.decode(header[7:], JWT_SECRET, algorithms=["HS256"])
+        return str(payload.get("id"))
+    except jwt.InvalidTokenError:
+        return "anon"
+
+
+def _cache_key(vary_on_auth: bool) -> str:
+    parts = [
+        request.endpoint or "",
+        json.dumps(request.view_args or {}, sort_keys=True, default=str),
+        json.dumps(sorted(request.args.items(multi=True))),
+        _viewer() if vary_on_auth else "",
+    ]
+    return "resp:" + hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+def cached_response(tags=(), ttl: int = None, vary_on_auth: bool = False):
+    """
+    Cache successful GET responses of a view. `tags` may use the URL
+    arguments, e.g. "job:{job_id}"; views can add more with add_tags().
+    Query arguments are always part of the key, the caller only when
+    `vary_on_auth` is set (put auth decorators outside this one).
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not CACHE_ENABLED or request.method != "GET":
+                return view(*args, **kwargs)
+
+            view_args = request.view_args or {}
+            key = _cache_key(vary_on_auth)
+            try:
+                entry = response_cache.get(key)
+                if entry is None:
+                    # Read before the view runs, see invalidate()
+                    versions = response_cache.tag_versions(
+                        tag.format(**view_args) for tag in tags
+                    )
+            except Exception as e:
+                print(f"Cache unavailable, serving uncached: {e}")
+                return view(*args, **kwargs)
+
+            if entry is not None:
+                response_cache.hits += 1
+                response = Response(
+                    entry["body"], status=entry["status"], mimetype=entry["mimetype"]
+                )
+                response.headers["X-Cache"] = "HIT"
+                return response
+
+            response_cache.misses += 1
+            g.cache_tags = set()
+            try:
+                response = current_app.make_response(view(*args, **kwargs))
+                late_tags = g.cache_tags - set(versions)
+            finally:
+                g.pop("cache_tags", None)
+
+            response.headers["X-Cache"] = "MISS"
+            if response.status_code != 200 or response.direct_passthrough:
+                return response
+
+            try:
+                versions.update(response_cache.tag_versions(late_tags))
+                entry = {
+                    "tags": versions,
+                    "status": response.status_code,
+                    "mimetype": response.mimetype,
+                    "body": response.get_data(as_text=True),
+                }
+                response_cache.set(key, entry, ttl or CACHE_DEFAULT_TTL)
+            except Exception as e:
+                print(f"Could not cache {request.path}: {e}")
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,75 @@
+import hashlib
+from datetime import timezone
+from functools import wraps
+
+from flask import Response, current_app, request
+from werkzeug.http import unquote_etag
+
+
+def make_etag(*parts) -> str:
+    """Weak validator: the body may be re-encoded (compression, key order)"""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def _http_datetime(value):
+    # Columns hold naive UTC timestamps; HTTP dates have whole seconds
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def _is_fresh(etag: str, last_modified) -> bool:
+    # If-None-Match wins over If-Modified-Since when both are sent
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(unquote_etag(etag)[0])
+    if request.if_modified_since and last_modified is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def conditional(validators, private: bool = False):
+    """
+    Answer If-None-Match / If-Modified-Since without running the view.
+
+    `validators(**view_args)` runs a cheap query and returns
+    (etag_parts, last_modified), or None to let the view answer (not found,
+    not authorized, ...). Put this outside cached_response so a 304 never
+    touches the cache.
+    """
+    cache_control = "private, no-cache" if private else "public, no-cache"
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(*args, **kwargs)
+
+            found = validators(**(request.view_args or {}))
+            if found is None:
+                return view(*args, **kwargs)
+
+            parts, last_modified = found
+            etag = make_etag(*parts)
+            last_modified = _http_datetime(last_modified)
+
+            if _is_fresh(etag, last_modified):
+                response = Response(status=304)
+            else:
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.headers["ETag"] = etag
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.headers["Cache-Control"] = cache_control
+            if private:
+                response.vary.add("Authorization")
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,134 @@
+import os
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+from sqlalchemy import func, insert, select
+
+from config.db import SessionLocal
+from core.models import Job, Notification, User, job_skills, user_skills
+from services import background
+from services.saved_searches import match_job
+
+load_dotenv()
+
+# Notifications per multi-row INSERT / transaction
+JOB_FANOUT_BATCH = int(os.getenv("JOB_FANOUT_BATCH", 1000))
+# Skills a candidate must share with the job to hear about it
+JOB_FANOUT_MIN_SKILLS = int(os.getenv("JOB_FANOUT_MIN_SKILLS", 1))
+# A candidate gets at most this many job_posted notifications per window
+JOB_FANOUT_USER_CAP = int(os.getenv("JOB_FANOUT_USER_CAP", 5))
+JOB_FANOUT_CAP_WINDOW = int(os.getenv("JOB_FANOUT_CAP_WINDOW", 24 * 3600))
+
+
+def matching_candidates(job_id: int, employer_id: int):
+    """
+    Candidates sharing at least JOB_FANOUT_MIN_SKILLS skills with the job,
+    by user id. Walks user_skills from the job's skills through
+    ix_user_skills_skill_id_user_id.
+    """
+    wanted = select(job_skills.c.skill_id).where(job_skills.c.job_id == job_id)
+    return (
+        select(user_skills.c.user_id)
+        .join(User, User.id == user_skills.c.user_id)
+        .where(
+            user_skills.c.skill_id.in_(wanted),
+            User.role == "candidate",
+            User.id != employer_id,
+        )
+        .group_by(user_skills.c.user_id)
+        .having(func.count() >= JOB_FANOUT_MIN_SKILLS)
+        .order_by(user_skills.c.user_id)
+    )
+
+
+def _capped(session, user_ids: list) -> set:
+    """The users among user_ids that already got their share of job alerts"""
+    since = datetime.utcnow() - timedelta(seconds=JOB_FANOUT_CAP_WINDOW)
+    return set(
+        session.execute(
+            select(Notification.receiver_id)
+            .where(
+                Notification.receiver_id.in_(user_ids),
+                Notification.type == "job_posted",
+                Notification.created_at > since,
+            )
+            .group_by(Notification.receiver_id)
+            .having(func.count() >= JOB_FANOUT_USER_CAP)
+        ).scalars()
+    )
+
+
+def fan_out_job(job_id: int, skip=()) -> int:
+    """
+    Notify the candidates whose skills match a newly posted job. The
+    matches are streamed from one query, the notifications written
+    JOB_FANOUT_BATCH rows per INSERT and commit, leaving out the users in
+    `skip`. Returns how many were sent.
+    """
+    reader = SessionLocal()
+    writer = SessionLocal()
+    sent = capped = 0
+    try:
+        job = reader.execute(
+            select(Job.id, Job.title, Job.company, Job.employer_id).where(
+                Job.id == job_id
+            )
+        ).first()
+        if job is None:
+            return 0
+
+        title = f"New job matching your skills: {job.title}"[:255]
+        message = f'{job.company} posted "{job.title}"'
+        matches = reader.execute(
+            matching_candidates(job.id, job.employer_id).execution_options(
+                yield_per=JOB_FANOUT_BATCH
+            )
+        )
+        for rows in matches.partitions():
+            user_ids = [row.user_id for row in rows]
+            skipped = _capped(writer, user_ids)
+            values = [
+                {
+                    "sender_id": job.employer_id,
+                    "receiver_id": user_id,
+                    "type": "job_posted",
+                    "title": title,
+                    "message": message,
+                }
+                for user_id in user_ids
+                if user_id not in skipped and user_id not in skip
+            ]
+            if values:
+                writer.execute(insert(Notification), values)
+                writer.commit()
+            sent += len(values)
+            capped += len(skipped)
+    except Exception:
+        writer.rollback()
+        raise
+    finally:
+        reader.close()
+        writer.close()
+
+    print(f"Job {job_id}: notified {sent} candidates, {capped} over their cap")
+    return sent
+
+
+def _fan_out_jobs(job_ids: list) -> int:
+    sent = 0
+    for job_id in job_ids:
+        # Saved searches first: their owners don't hear about the job twice
+        notified = match_job(job_id)
+        sent += len(notified) + fan_out_job(job_id, skip=notified)
+    return sent
+
+
+def schedule_job_fanout(job_ids: list):
+    """
+    Notify matching saved searches and candidates of new jobs from the
+    background pool, once they are committed. One worker, so a big import
+    doesn't take over the database.
+    """
+    if not job_ids:
+        return None
+    return background.submit("fanout", _fan_out_jobs, list(job_ids), max_workers=1)
@@ -0,0 +1,221 @@
+import csv
+import math
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import func, or_
+
+load_dotenv()
+
+# Bundled city list, no network calls. A bigger extract (GeoNames cities15000,
+# ...) with the same columns can be pointed at instead.
+GAZETTEER_PATH = os.getenv(
+    "GAZETTEER_PATH", str(Path(__file__).parent.parent / "data" / "gazetteer.csv")
+)
+COUNTRIES_PATH = os.getenv(
+    "COUNTRIES_PATH", str(Path(__file__).parent.parent / "data" / "countries.csv")
+)
+# ~5m cells; radius queries only ever look at a prefix of it
+GEOHASH_PRECISION = int(os.getenv("GEOHASH_PRECISION", 9))
+# A radius query ORs at most this many geohash prefixes together
+GEOHASH_MAX_CELLS = int(os.getenv("GEOHASH_MAX_CELLS", 16))
+DEFAULT_RADIUS_KM = float(os.getenv("DEFAULT_RADIUS_KM", 50))
+MAX_RADIUS_KM = float(os.getenv("MAX_RADIUS_KM", 500))
+
+EARTH_RADIUS_KM = 6371.0088
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+_NOISE = re.compile(r"\b(hybrid|on-?site|remote|area|metro|greater)\b")
+
+
+class GeoError(ValueError):
+    """A place or radius in the query string that can't be searched around"""
+
+
+def _key(text: str) -> str:
+    # "Zürich " -> "zurich", "St. Louis" -> "st louis"
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+
+@lru_cache(maxsize=1)
+def _gazetteer() -> tuple:
+    """(cities by name key, country codes by name key), loaded once"""
+    countries = {}
+    with open(COUNTRIES_PATH, encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            names = [row["code"], row["name"], *filter(None, row["aliases"].split("|"))]
+            for name in names:
+                countries[_key(name)] = row["code"]
+
+    cities = {}
+    with open(GAZETTEER_PATH, encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            city = (
+                float(row["latitude"]),
+                float(row["longitude"]),
+                row["country"],
+                _key(row["admin"] or ""),
+                int(row["population"] or 0),
+            )
+            names = [row["name"], *filter(None, (row["aliases"] or "").split("|"))]
+            for name in names:
+                cities.setdefault(_key(name), []).append(city)
+    return cities, countries
+
+
+@lru_cache(maxsize=4096)
+def geocode(text: str):
+    """
+    (latitude, longitude) of a free text location such as "Berlin",
+    "Portland, OR", "Paris, France" or "Remote (London)", None when no
+    city of the gazetteer is named. Qualifiers after the city (state,
+    country) pick between homonyms, otherwise the most populous wins.
+    """
+    if not text:
+        return None
+    cities, countries = _gazetteer()
+    parts = [_key(_NOISE.sub(" ", p.lower())) for p in re.split(r"[,()/]", text)]
+    parts = [p for p in parts if p]
+
+    for i, part in enumerate(parts):
+        found = cities.get(part)
+        if not found:
+            continue
+        qualifiers = parts[i + 1 :]
+
+        def score(city):
+            latitude, longitude, country, admin, population = city
+            matched = sum(q == admin or countries.get(q) == country for q in qualifiers)
+            return matched, population
+
+        best = max(found, key=score)
+        return best[0], best[1]
+    return None
+
+
+def geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION):
+    """Geohash of a point: nearby points share a prefix, so a btree finds them"""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit, even = [], 0, 0, True
+    while len(chars) < precision:
+        span, value = (lon_range, longitude) if even else (lat_range, latitude)
+        middle = (span[0] + span[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            span[0] = middle
+        else:
+            span[1] = middle
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(_BASE32[bits])
+            bits, bit = 0, 0
+    return "".join(chars)
+
+
+def _cell_size(precision: int) -> tuple:
+    """(latitude, longitude) degrees covered by one cell of that precision"""
+    lon_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / 2**lat_bits, 360.0 / 2**lon_bits
+
+
+def covering_cells(latitude: float, longitude: float, radius_km: float) -> list:
+    """
+    Geohash prefixes whose cells together cover the circle, as long as
+    possible while staying within GEOHASH_MAX_CELLS.
+    """
+    dlat = radius_km / _KM_PER_DEGREE
+    cos_lat = math.cos(math.radians(latitude))
+    dlon = 180.0 if cos_lat < 1e-6 else min(180.0, dlat / cos_lat)
+    south, north = max(-90.0, latitude - dlat), min(90.0, latitude + dlat)
+    west, east = longitude - dlon, longitude + dlon
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        cell_lat, cell_lon = _cell_size(precision)
+        rows = math.floor(north / cell_lat) - math.floor(south / cell_lat) + 1
+        columns = math.floor(east / cell_lon) - math.floor(west / cell_lon) + 1
+        if rows * columns <= GEOHASH_MAX_CELLS or precision == 1:
+            break
+
+    # One point in every row / column of cells the box spans, and its far edges
+    lats = [min(south + i * cell_lat, north) for i in range(rows)] + [north]
+    lons = [min(west + i * cell_lon, east) for i in range(columns)] + [east]
+    # Longitudes past the antimeridian wrap around
+    return sorted(
+        {
+            geohash(lat, (lon + 180.0) % 360.0 - 180.0, precision)
+            for lat in lats
+            for lon in lons
+        }
+    )
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = math.sin((phi2 - phi1) / 2)
+    dlambda = math.sin(math.radians(lon2 - lon1) / 2)
+    a = dphi * dphi + math.cos(phi1) * math.cos(phi2) * dlambda * dlambda
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def distance_km(model, latitude: float, longitude: float):
+    """SQL great-circle distance from the point to the model's coordinates"""
+    phi1 = math.radians(latitude)
+    phi2 = func.radians(model.latitude)
+    dphi = func.sin((phi2 - phi1) / 2)
+    dlambda = func.sin(func.radians(model.longitude - longitude) / 2)
+    a = dphi * dphi + math.cos(phi1) * func.cos(phi2) * dlambda * dlambda
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+def within(model, latitude: float, longitude: float, radius_km: float) -> list:
+    """
+    WHERE criteria for rows of the model (Job, User) within radius_km of
+    the point: geohash prefix ranges the index can use, then the exact
+    distance on what they leave.
+    """
+    cells = covering_cells(latitude, longitude, radius_km)
+    return [
+        or_(*[model.geohash.like(cell + "%") for cell in cells]),
+        distance_km(model, latitude, longitude) <= radius_km,
+    ]
+
+
+def geo_columns(text: str) -> dict:
+    """Coordinates of a location text, set next to it on writes"""
+    point = geocode(text)
+    if point is None:
+        return {"latitude": None, "longitude": None, "geohash": None}
+    return {"latitude": point[0], "longitude": point[1], "geohash": geohash(*point)}
+
+
+def search_point(args):
+    """
+    (latitude, longitude, radius_km) asked for by ?near=Berlin or
+    ?lat=52.5&lon=13.4, with ?radius=<km>; None when neither is given.
+    """
+    near = args.get("near", "").strip()
+    latitude = args.get("lat", type=float)
+    longitude = args.get("lon", type=float)
+    radius = args.get("radius", DEFAULT_RADIUS_KM, type=float)
+
+    if near:
+        point = geocode(near)
+        if point is None:
+            raise GeoError(f"Unknown location: {near}")
+        latitude, longitude = point
+    elif latitude is None or longitude is None:
+        return None
+    elif not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise GeoError("lat must be within [-90, 90] and lon within [-180, 180]")
+
+    if not 0 < radius <= MAX_RADIUS_KM:
+        raise GeoError(f"radius must be between 0 and {MAX_RADIUS_KM:g} km")
+    return latitude, longitude, radius
@@ -0,0 +1,58 @@
+import os
+from threading import Lock
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Seconds to connect / to wait for each read from the other side
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 3))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", 5))
+# Keep-alive connections kept per host
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 10))
+
+_session = None
+_lock = Lock()
+
+
+class _TimeoutSession:
+    """Wraps requests.Session so no call goes out without a timeout"""
+
+    def __init__(self, session):
+        self._session = session
+
+    def request(self, method: str, url: str, **kwargs):
+        kwargs.setdefault("timeout", (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+        return self._session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+def get_session():
+    """
+    The process-wide HTTP client for outgoing calls (OAuth providers, ...).
+    Connections are pooled and reused, connect errors retried once. Created
+    on first use, so after a worker fork and without importing requests at
+    startup.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=Retry(total=1, connect=1, read=0, status=0),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = _TimeoutSession(session)
+        return _session
@@ -0,0 +1,148 @@
+import glob
+import os
+from threading import Lock
+
+from cachetools import LRUCache
+from dotenv import load_dotenv
+
+from services import background
+
+load_dotenv()
+
+THUMBNAIL_SIZES = (64, 128, 256)
+# Size used for avatars in lists (search, connections, notifications, ...)
+LIST_THUMBNAIL_SIZE = 128
+THUMBNAIL_QUALITY = int(os.getenv("THUMBNAIL_QUALITY", 80))
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", 2))
+
+PROFILE_URL_PREFIX = "/uploads/profile/"
+THUMBS_SUBDIR = "thumbs"
+
+# Sources being thumbnailed, and ones Pillow couldn't decode: requests for
+# their thumbnails don't queue them again. Uploads are stored under their
+# content hash, so bytes that didn't decode never will; other failures
+# (full disk, pool shut down, ...) are retried on the next request.
+_in_flight = set()
+_failed = LRUCache(maxsize=int(os.getenv("THUMBNAIL_FAILED_CACHE_SIZE", 10_000)))
+_lock = Lock()
+
+
+def _thumbnail_name(image_name: str, size: int) -> str:
+    stem = os.path.splitext(image_name)[0]
+    return f"{THUMBS_SUBDIR}/{size}/{stem}.webp"
+
+
+def thumbnail_url(image_url: str, size: int = LIST_THUMBNAIL_SIZE):
+    """
+    URL of a square WebP thumbnail for an uploaded profile image.
+    External images (Google avatars, ...) are returned unchanged.
+    """
+    if not image_url or not image_url.startswith(PROFILE_URL_PREFIX):
+        return image_url
+
+    image_name = image_url[len(PROFILE_URL_PREFIX) :]
+    return PROFILE_URL_PREFIX + _thumbnail_name(image_name, size)
+
+
+def thumbnail_urls(image_url: str) -> dict:
+    """All thumbnail sizes for an image, keyed by pixel size"""
+    if not image_url:
+        return {}
+    return {str(size): thumbnail_url(image_url, size) for size in THUMBNAIL_SIZES}
+
+
+def generate_thumbnails(source_path: str) -> list:
+    """Write every thumbnail size for source_path, skipping existing ones"""
+    # Pillow is only needed by the worker, keep it out of the import path
+    from PIL import Image, ImageOps
+
+    upload_dir, image_name = os.path.split(source_path)
+    written = []
+
+    with Image.open(source_path) as img:
+        img = ImageOps.exif_transpose(img)
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+
+        for size in THUMBNAIL_SIZES:
+            target = os.path.join(upload_dir, _thumbnail_name(image_name, size))
+            if os.path.exists(target):
+                continue
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            thumb = ImageOps.fit(img, (size, size), Image.Resampling.LANCZOS)
+
+            tmp_target = f"{target}.part"
+            thumb.save(tmp_target, "WEBP", quality=THUMBNAIL_QUALITY, method=4)
+            os.replace(tmp_target, target)
+            written.append(target)
+
+    return written
+
+
+def schedule_thumbnails(source_path: str):
+    """
+    Generate thumbnails in the background image pool. Returns the Future,
+    None when the source is already queued or failed before.
+    """
+    with _lock:
+        if source_path in _in_flight or source_path in _failed:
+            return None
+        _in_flight.add(source_path)
+
+    try:
+        future = background.submit(
+            "images", generate_thumbnails, source_path, max_workers=IMAGE_WORKERS
+        )
+    except Exception:
+        with _lock:
+            _in_flight.discard(source_path)
+        raise
+    future.add_done_callback(lambda f: _thumbnails_done(source_path, f))
+    return future
+
+
+def _thumbnails_done(source_path: str, future):
+    with _lock:
+        _in_flight.discard(source_path)
+        if not future.cancelled() and _undecodable(future.exception()):
+            _failed[source_path] = True
+
+
+def _undecodable(error) -> bool:
+    """Whether a thumbnail failure comes from the image bytes themselves"""
+    if error is None:
+        return False
+    from PIL import Image, UnidentifiedImageError
+
+    if isinstance(error, (UnidentifiedImageError, Image.DecompressionBombError)):
+        return True
+    # Truncated / corrupt data; OS level errors (ENOSPC, ENOENT, ...) carry errno
+    return isinstance(error, (OSError, SyntaxError)) and not getattr(
+        error, "errno", None
+    )
+
+
+def original_for_thumbnail(uploads_dir: str, filename: str):
+    """
+    Map "profile/thumbs/<size>/<stem>.webp" back to the original upload,
+    used while a thumbnail has not been generated yet.
+    Returns the original file name relative to uploads_dir, or None.
+    """
+    parts = filename.split("/")
+    if (
+        len(parts) != 4
+        or parts[0] != "profile"
+        or parts[1] != THUMBS_SUBDIR
+        or not parts[2].isdigit()
+    ):
+        return None
+
+    stem = os.path.splitext(parts[3])[0]
+    profile_dir = os.path.join(uploads_dir, "profile")
+    matches = glob.glob(
+        os.path.join(glob.escape(profile_dir), glob.escape(stem) + ".*")
+    )
+    if not matches:
+        return None
+
+    return f"profile/{os.path.basename(matches[0])}"
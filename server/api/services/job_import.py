@@ -0,0 +1,248 @@
+import csv
+import io
+import json
+import os
+from datetime import datetime
+
+from dotenv import load_dotenv
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from core.models import Category, Job, Skill, job_skills
+from services.geo import geo_columns
+from services.salary import salary_columns
+from services.skill_registry import normalize, skill_registry
+
+load_dotenv()
+
+MAX_IMPORT_ROWS = int(os.getenv("MAX_IMPORT_ROWS", 5000))
+REQUIRED_FIELDS = ("title", "description", "location")
+# Text fields of a row and the length of the column they go to
+TEXT_FIELDS = {
+    "title": Job.title.type.length,
+    "description": None,
+    "location": Job.location.type.length,
+    "company": Job.company.type.length,
+    "salary_range": Job.salary_range.type.length,
+    "emp_type": Job.emp_type.type.length,
+    "employment_type": Job.emp_type.type.length,
+}
+SKILL_NAME_LENGTH = Skill.name.type.length
+# Largest value of an Integer primary key
+MAX_ID = 2**31 - 1
+# CSV cells holding lists use this separator ("python|sql|docker")
+CSV_LIST_SEPARATOR = "|"
+
+
+def parse_rows(body: bytes, mimetype: str) -> list:
+    """
+    Turn an NDJSON or CSV payload into a list of (line_number, dict | error).
+    """
+    text = body.decode("utf-8-sig")
+
+    if mimetype in ("text/csv", "application/csv"):
+        rows = []
+        reader = csv.DictReader(io.StringIO(text))
+        for line_number, record in enumerate(reader, start=2):
+            row = {k.strip(): (v or "").strip() for k, v in record.items() if k}
+            for key in ("skill_names", "skill_ids", "responsibilities"):
+                if row.get(key):
+                    row[key] = [
+                        item.strip()
+                        for item in row[key].split(CSV_LIST_SEPARATOR)
+                        if item.strip()
+                    ]
+                else:
+                    row.pop(key, None)
+            rows.append((line_number, row))
+        return rows
+
+    rows = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            rows.append((line_number, f"Invalid JSON: {e}"))
+            continue
+        if not isinstance(record, dict):
+            rows.append((line_number, "Each line must be a JSON object"))
+            continue
+        rows.append((line_number, record))
+    return rows
+
+
+def validate_row(row: dict):
+    """
+    Return an error message for the row, or None when it can be imported.
+    Text fields are checked against their column's type and length, so a
+    bad row is reported instead of failing the whole import at flush.
+    """
+    for field, max_length in TEXT_FIELDS.items():
+        value = row.get(field)
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            return f"Invalid {field} format. Expected a string"
+        value = value.strip()
+        if max_length and len(value) > max_length:
+            return f"{field} is too long (at most {max_length} characters)"
+        row[field] = value
+
+    for field in REQUIRED_FIELDS:
+        if not row.get(field):
+            return f"Missing required field: {field}"
+
+    category = row.get("category")
+    if category is not None and (
+        isinstance(category, bool) or not isinstance(category, (str, int))
+    ):
+        return "Invalid category format. Expected a category name"
+
+    skill_ids = row.get("skill_ids") or []
+    try:
+        if not isinstance(skill_ids, list):
+            raise TypeError
+        row["skill_ids"] = [int(i) for i in skill_ids if not isinstance(i, bool)]
+    except (ValueError, TypeError):
+        return "Invalid skill_ids format. Expected array of integers"
+    if len(row["skill_ids"]) != len(skill_ids) or not all(
+        0 < i <= MAX_ID for i in row["skill_ids"]
+    ):
+        return "Invalid skill_ids format. Expected array of integers"
+
+    skill_names = row.get("skill_names") or []
+    if not isinstance(skill_names, list) or not all(
+        isinstance(n, str) for n in skill_names
+    ):
+        return "Invalid skill_names format. Expected array of strings"
+    row["skill_names"] = [n.strip() for n in skill_names if n.strip()]
+    if any(len(n) > SKILL_NAME_LENGTH for n in row["skill_names"]):
+        return f"Skill names are at most {SKILL_NAME_LENGTH} characters"
+
+    responsibilities = row.get("responsibilities")
+    if responsibilities is not None and (
+        not isinstance(responsibilities, list)
+        or not all(isinstance(r, str) for r in responsibilities)
+    ):
+        return "Invalid responsibilities format. Expected array of strings"
+
+    return None
+
+
+def import_jobs(db: Session, employer, rows: list) -> dict:
+    """
+    Insert every valid row as a job of `employer` in the current transaction.
+    Jobs and job_skills go in as multi-row INSERTs, invalid rows are reported
+    by line number and skipped. The caller commits.
+    """
+    errors = []
+    valid = []
+
+    if len(rows) > MAX_IMPORT_ROWS:
+        raise ValueError(f"Too many rows, the limit is {MAX_IMPORT_ROWS}")
+
+    for line_number, row in rows:
+        error = row if isinstance(row, str) else validate_row(row)
+        if error:
+            errors.append({"line": line_number, "error": error})
+        else:
+            valid.append((line_number, row))
+
+    # Everything the rows reference is resolved up front, once
+    skill_ids = {i for _, row in valid for i in row["skill_ids"]}
+    existing_skill_ids = set()
+    if skill_ids:
+        existing_skill_ids = {
+            i for (i,) in db.query(Skill.id).filter(Skill.id.in_(skill_ids)).all()
+        }
+
+    category_names = {
+        str(row["category"]).strip().lower() for _, row in valid if row.get("category")
+    }
+    categories = {}
+    if category_names:
+        categories = dict(
+            db.query(func.lower(Category.name), Category.id)
+            .filter(func.lower(Category.name).in_(category_names))
+            .all()
+        )
+
+    importable = []
+    for line_number, row in valid:
+        missing_ids = set(row["skill_ids"]) - existing_skill_ids
+        if missing_ids:
+            errors.append(
+                {
+                    "line": line_number,
+                    "error": "Some skill IDs don't exist in the database",
+                    "missing_skill_ids": sorted(missing_ids),
+                }
+            )
+            continue
+
+        category = str(row.get("category") or "").strip().lower()
+        if category and category not in categories:
+            errors.append(
+                {"line": line_number, "error": f"Unknown category: {row['category']}"}
+            )
+            continue
+
+        importable.append((line_number, row))
+
+    # One registry lookup for every skill name in the payload
+    skill_names = {
+        normalize(skill.name): skill.id
+        for skill in skill_registry.get_or_create(
+            db, [name for _, row in importable for name in row["skill_names"]]
+        )
+    }
+
+    now = datetime.utcnow()
+    job_values = [
+        {
+            "employer_id": employer.id,
+            "category_id": categories.get(
+                str(row.get("category") or "").strip().lower()
+            ),
+            "title": row["title"],
+            "description": row["description"],
+            "company": row.get("company") or employer.companyName or "",
+            "location": row["location"],
+            **geo_columns(row["location"]),
+            "salary_range": row.get("salary_range") or None,
+            **salary_columns(row.get("salary_range")),
+            "emp_type": row.get("employment_type") or row.get("emp_type") or None,
+            "responsibilities": row.get("responsibilities") or None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for _, row in importable
+    ]
+
+    job_ids = []
+    if job_values:
+        job_ids = list(
+            db.execute(
+                insert(Job).returning(Job.id, sort_by_parameter_order=True),
+                job_values,
+            ).scalars()
+        )
+
+    link_values = []
+    for job_id, (_, row) in zip(job_ids, importable):
+        ids = set(row["skill_ids"])
+        ids.update(skill_names[normalize(name)] for name in row["skill_names"])
+        link_values.extend({"job_id": job_id, "skill_id": i} for i in sorted(ids))
+
+    if link_values:
+        db.execute(insert(job_skills), link_values)
+
+    errors.sort(key=lambda e: e["line"])
+    return {
+        "created": len(job_ids),
+        "job_ids": job_ids,
+        "failed": len(errors),
+        "errors": errors,
+    }
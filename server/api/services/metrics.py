@@ -0,0 +1,194 @@
+import os
+import time
+from threading import Lock
+
+from dotenv import load_dotenv
+from flask import Response, g, jsonify, request
+
+# prometheus_client picks its multiprocess mode from the environment on import
+load_dotenv()
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from services import background
+
+# Set to a writable, per-deployment directory when running several worker
+# processes: every process then writes its samples to mmap'ed files there
+# and /metrics aggregates them. It has to be emptied before the server starts.
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+# When set, /metrics wants "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+# Pool / cache / queue gauges are refreshed at most this often per process
+GAUGE_REFRESH_SECONDS = float(os.getenv("METRICS_GAUGE_REFRESH", 1))
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency",
+    ["blueprint", "endpoint", "method"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS = Counter(
+    "http_requests_total",
+    "Requests by response status",
+    ["blueprint", "endpoint", "method", "status"],
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements per request",
+    ["blueprint", "endpoint"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+)
+
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections in use",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+CACHE_HITS = Gauge(
+    "cache_hits",
+    "Cache hits since the process started",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+CACHE_MISSES = Gauge(
+    "cache_misses",
+    "Cache misses since the process started",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+CACHE_HIT_RATIO = Gauge(
+    "cache_hit_ratio",
+    "hits / (hits + misses) of this process",
+    ["cache"],
+    multiprocess_mode="liveall",
+)
+QUEUE_DEPTH = Gauge(
+    "background_queue_depth",
+    "Submitted but unfinished background tasks",
+    ["queue"],
+    multiprocess_mode="livesum",
+)
+
+_pools = {}
+_caches = {}
+_refresh_lock = Lock()
+_last_refresh = 0.0
+
+
+def register_pool(name: str, get_engine):
+    """Report checked-out / overflow connections of get_engine()'s pool"""
+    _pools[name] = get_engine
+
+
+def register_cache(name: str, stats):
+    """`stats` returns (hits, misses) for the cache"""
+    _caches[name] = stats
+
+
+def refresh_gauges(force: bool = False):
+    global _last_refresh
+    now = time.monotonic()
+    if not force and now - _last_refresh < GAUGE_REFRESH_SECONDS:
+        return
+    if not _refresh_lock.acquire(blocking=False):
+        return
+    try:
+        _last_refresh = now
+        for name, get_engine in _pools.items():
+            pool = get_engine().pool
+            # NullPool / StaticPool don't keep these numbers
+            if hasattr(pool, "checkedout"):
+                POOL_CHECKED_OUT.labels(name).set(pool.checkedout())
+                POOL_OVERFLOW.labels(name).set(max(pool.overflow(), 0))
+                POOL_SIZE.labels(name).set(pool.size())
+
+        for name, stats in _caches.items():
+            hits, misses = stats()
+            CACHE_HITS.labels(name).set(hits)
+            CACHE_MISSES.labels(name).set(misses)
+            if hits + misses:
+                CACHE_HIT_RATIO.labels(name).set(hits / (hits + misses))
+
+        for name, depth in background.queue_depths().items():
+            QUEUE_DEPTH.labels(name).set(depth)
+    finally:
+        _refresh_lock.release()
+
+
+def mark_process_dead(pid: int):
+    """Drop a dead worker's live gauges (call from the server's child_exit hook)"""
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid)
+
+
+def _labels():
+    # Unmatched URLs all share one label, keeps the series count bounded
+    return request.blueprint or "", request.endpoint or "unmatched"
+
+
+def _before_request():
+    g.metrics_started = time.perf_counter()
+
+
+def _after_request(response):
+    started = g.pop("metrics_started", None)
+    if started is None or request.endpoint == "metrics":
+        return response
+
+    blueprint, endpoint = _labels()
+    REQUEST_LATENCY.labels(blueprint, endpoint, request.method).observe(
+        time.perf_counter() - started
+    )
+    REQUESTS.labels(blueprint, endpoint, request.method, response.status_code).inc()
+
+    # Filled in by middlewares/instrumentation.py when it is installed
+    db_stats = g.get("db_stats")
+    if db_stats is not None:
+        REQUEST_QUERIES.labels(blueprint, endpoint).observe(db_stats.queries)
+
+    refresh_gauges()
+    return response
+
+
+def metrics():
+    if METRICS_TOKEN and request.headers.get("Authorization") != (
+        f"Bearer {METRICS_TOKEN}"
+    ):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    refresh_gauges(force=True)
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        payload = generate_latest(registry)
+    else:
+        payload = generate_latest()
+    return Response(payload, content_type=CONTENT_TYPE_LATEST)
+
+
+def init_metrics(app):
+    """Record request metrics and serve them on /metrics"""
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.add_url_rule("/metrics", "metrics", metrics, methods=["GET"])
@@ -0,0 +1,135 @@
+import os
+import re
+import time
+from threading import Lock
+
+import jwt
+from dotenv import load_dotenv
+
+from services.http import get_session
+
+load_dotenv()
+
+# Overridable to point the flow at a fake provider, see scripts/fake_oauth.py
+GOOGLE_AUTH_URL = os.getenv(
+    "GOOGLE_AUTH_URL", "https://accounts.google.com/o/oauth2/auth"
+)
+GOOGLE_TOKEN_URL = os.getenv("GOOGLE_TOKEN_URL", "https://oauth2.googleapis.com/token")
+GOOGLE_JWKS_URL = os.getenv(
+    "GOOGLE_JWKS_URL", "https://www.googleapis.com/oauth2/v3/certs"
+)
+GOOGLE_ISSUERS = os.getenv(
+    "GOOGLE_ISSUERS", "https://accounts.google.com,accounts.google.com"
+).split(",")
+
+# Used when the JWKS response has no max-age
+JWKS_DEFAULT_TTL = int(os.getenv("JWKS_DEFAULT_TTL", 3600))
+# An unknown kid refetches the keys (rotation), at most this often
+JWKS_MIN_REFRESH = int(os.getenv("JWKS_MIN_REFRESH", 60))
+# Clock skew allowed on exp / iat
+ID_TOKEN_LEEWAY = int(os.getenv("ID_TOKEN_LEEWAY", 60))
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class OAuthError(Exception):
+    """The provider refused the exchange, or its ID token doesn't verify"""
+
+    def __init__(self, message: str, details=None):
+        super().__init__(message)
+        self.details = details
+
+
+class JWKSCache:
+    """
+    Signing keys of a provider, fetched once and kept for as long as its
+    Cache-Control says. Verifying an ID token is then local: no request
+    per login.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self._keys = {}
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._lock = Lock()
+
+    def _fetch(self):
+        response = get_session().get(self.url)
+        response.raise_for_status()
+        keys = {}
+        for data in response.json().get("keys", []):
+            try:
+                keys[data.get("kid")] = jwt.PyJWK(data)
+            except jwt.PyJWKError:
+                continue  # algorithm we don't support
+        match = _MAX_AGE.search(response.headers.get("Cache-Control", ""))
+        ttl = int(match.group(1)) if match else JWKS_DEFAULT_TTL
+
+        now = time.monotonic()
+        self._keys = keys
+        self._fetched_at = now
+        self._expires_at = now + ttl
+
+    def get_key(self, kid: str):
+        with self._lock:
+            now = time.monotonic()
+            stale = now >= self._expires_at
+            rotated = (
+                kid not in self._keys and now - self._fetched_at >= JWKS_MIN_REFRESH
+            )
+            if stale or rotated:
+                self._fetch()
+            key = self._keys.get(kid)
+        if key is None:
+            raise OAuthError(f"No signing key {kid!r} at {self.url}")
+        return key
+
+
+google_keys = JWKSCache(GOOGLE_JWKS_URL)
+
+
+def exchange_code(code: str, client_id: str, client_secret: str, redirect_uri: str):
+    """Trade the authorization code for the provider's tokens"""
+    response = get_session().post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "code": code,
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "redirect_uri": redirect_uri,
+            "grant_type": "authorization_code",
+        },
+    )
+    try:
+        tokens = response.json()
+    except ValueError:
+        tokens = {"status": response.status_code}
+    if response.status_code != 200 or not tokens.get("id_token"):
+        raise OAuthError("Token exchange failed", tokens)
+    return tokens
+
+
+def verify_id_token(id_token: str, client_id: str, keys: JWKSCache = google_keys):
+    """
+    Claims of an OpenID Connect ID token (email, name, picture, ...) once its
+    signature, audience, issuer and expiry check out.
+    """
+    try:
+        header = jwt.get_unverified_header(id_token)
+        key = keys.get_key(header.get("kid"))
+        claims = jwt.decode(
+            id_token,
+            key.key,
+            algorithms=[key.algorithm_name],
+            audience=client_id,
+            issuer=GOOGLE_ISSUERS,
+            leeway=ID_TOKEN_LEEWAY,
+            options={"require": ["exp", "iat", "iss", "aud", "sub"]},
+        )
+    except jwt.InvalidTokenError as e:
+        raise OAuthError(f"Invalid ID token: {e}") from None
+
+    if not claims.get("email_verified"):
+        raise OAuthError("Google account email is not verified")
+    return claims
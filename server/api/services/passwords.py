@@ -0,0 +1,71 @@
+import os
+import threading
+from functools import lru_cache
+
+from dotenv import load_dotenv
+from flask import jsonify
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from services import background
+
+load_dotenv()
+
+# Any Werkzeug method with its cost, e.g. "scrypt:32768:8:1" or
+# "pbkdf2:sha256:600000". Changing it rehashes passwords as users log in.
+PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+# hashlib's scrypt / pbkdf2 release the GIL, so threads hash in parallel
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+# Hashes running or queued at once; past that requests wait up to
+# PASSWORD_HASH_WAIT seconds for a slot, then get a 503
+PASSWORD_HASH_MAX_PENDING = int(
+    os.getenv("PASSWORD_HASH_MAX_PENDING", PASSWORD_HASH_WORKERS * 4)
+)
+PASSWORD_HASH_WAIT = float(os.getenv("PASSWORD_HASH_WAIT", 2))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", 1))
+
+_slots = threading.BoundedSemaphore(PASSWORD_HASH_MAX_PENDING)
+
+
+class HasherBusy(RuntimeError):
+    """No hashing slot freed up within PASSWORD_HASH_WAIT"""
+
+
+def _run(fn, *args):
+    if not _slots.acquire(timeout=PASSWORD_HASH_WAIT):
+        raise HasherBusy("Too many password checks in progress")
+    try:
+        future = background.submit(
+            "passwords", fn, *args, max_workers=PASSWORD_HASH_WORKERS
+        )
+        return future.result()
+    finally:
+        _slots.release()
+
+
+def hash_password(password: str, method: str = None) -> str:
+    return _run(generate_password_hash, password, method or PASSWORD_HASH_METHOD)
+
+
+def verify_password(stored: str, password: str) -> bool:
+    if not stored or not password:
+        return False
+    return _run(check_password_hash, stored, password)
+
+
+@lru_cache(maxsize=None)
+def _stored_method(method: str) -> str:
+    # How Werkzeug writes `method` in front of the hash, defaults filled in
+    # ("scrypt" -> "scrypt:32768:8:1"). Cheapest way: hash once and look.
+    return generate_password_hash("", method=method).split("$", 1)[0]
+
+
+def needs_rehash(stored: str) -> bool:
+    """Hashed with other parameters than PASSWORD_HASH_METHOD"""
+    return stored.split("$", 1)[0] != _stored_method(PASSWORD_HASH_METHOD)
+
+
+def busy_response():
+    response = jsonify({"error": "Server busy, please retry shortly"})
+    response.status_code = 503
+    response.headers["Retry-After"] = str(PASSWORD_HASH_RETRY_AFTER)
+    return response
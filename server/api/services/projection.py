@@ -0,0 +1,61 @@
+from sqlalchemy.orm import load_only
+
+
+class ProjectionError(ValueError):
+    """Unknown names in ?fields="""
+
+
+class Field:
+    """
+    One output field: the entity columns it reads, the loader options that
+    fetch what it needs from other tables, and how to render it.
+    """
+
+    def __init__(self, get, columns=(), loads=()):
+        self.get = get
+        self.columns = tuple(columns)
+        self.loads = tuple(loads)
+
+
+def column(attr) -> Field:
+    """Field that is a plain column, rendered as it is"""
+    return Field(lambda obj: getattr(obj, attr.key), columns=(attr,))
+
+
+class Projection:
+    """
+    Maps the public field names of a resource to what has to be loaded for
+    them, so ?fields=id,title both trims the payload and makes the query
+    fetch only those columns (load_only) and relationships.
+    """
+
+    def __init__(self, fields: dict, default=None, always=()):
+        self.fields = fields
+        self.default = tuple(default or fields)
+        # Loaded whatever is asked for, e.g. the primary key
+        self.always = tuple(always)
+
+    def parse(self, raw: str = None) -> tuple:
+        """Names from a "fields" argument, or the defaults when it's absent"""
+        if raw is None or not raw.strip():
+            return self.default
+        names = tuple(dict.fromkeys(n.strip() for n in raw.split(",") if n.strip()))
+        unknown = [n for n in names if n not in self.fields]
+        if unknown:
+            raise ProjectionError(
+                f"Unknown fields: {', '.join(unknown)}. "
+                f"Available: {', '.join(self.fields)}"
+            )
+        return names
+
+    def options(self, names) -> list:
+        """Loader options for query.options(*...)"""
+        columns, loads = {c.key: c for c in self.always}, []
+        for name in names:
+            field = self.fields[name]
+            columns.update((c.key, c) for c in field.columns)
+            loads.extend(field.loads)
+        return [load_only(*columns.values())] + loads
+
+    def dump(self, obj, names) -> dict:
+        return {name: self.fields[name].get(obj) for name in names}
@@ -0,0 +1,122 @@
+import hashlib
+import os
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+from sqlalchemy import delete, or_, select, update
+
+from config.db import SessionLocal
+from core.models import PasswordResetToken
+from services import background
+
+load_dotenv()
+
+RESET_TOKEN_TTL = int(os.getenv("RESET_TOKEN_TTL", 3600))
+# Rows deleted per statement / transaction by the sweeper
+RESET_TOKEN_SWEEP_BATCH = int(os.getenv("RESET_TOKEN_SWEEP_BATCH", 1000))
+# A worker sweeps at most this often, when reset links are being requested
+RESET_TOKEN_SWEEP_INTERVAL = int(os.getenv("RESET_TOKEN_SWEEP_INTERVAL", 600))
+
+_last_sweep = 0.0
+_sweep_lock = threading.Lock()
+
+
+def hash_token(token: str) -> str:
+    # The token is 256 random bits, a fast hash is enough: a leaked table
+    # gives nothing that can be put in a reset link
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def issue(session, user_id: int) -> str:
+    """
+    New reset token for the user, replacing any still unused one. Returns the
+    plaintext for the link; only its hash is stored. Caller commits.
+    """
+    session.execute(
+        update(PasswordResetToken)
+        .where(PasswordResetToken.user_id == user_id, PasswordResetToken.used == 0)
+        .values(used=1)
+    )
+    token = secrets.token_urlsafe(32)
+    session.add(
+        PasswordResetToken(
+            user_id=user_id,
+            token_hash=hash_token(token),
+            expires_at=datetime.utcnow() + timedelta(seconds=RESET_TOKEN_TTL),
+        )
+    )
+    return token
+
+
+def _valid(token: str):
+    return (
+        PasswordResetToken.token_hash == hash_token(token),
+        PasswordResetToken.used == 0,
+        PasswordResetToken.expires_at > datetime.utcnow(),
+    )
+
+
+def is_valid(session, token: str) -> bool:
+    return (
+        session.execute(select(PasswordResetToken.id).where(*_valid(token))).first()
+        is not None
+    )
+
+
+def consume(session, token: str):
+    """
+    Mark the token used and return its user id, None when it isn't valid.
+    One UPDATE, so two requests can't both use it. Caller commits.
+    """
+    return session.execute(
+        update(PasswordResetToken)
+        .where(*_valid(token))
+        .values(used=1)
+        .returning(PasswordResetToken.user_id)
+    ).scalar()
+
+
+def sweep(batch_size: int = RESET_TOKEN_SWEEP_BATCH) -> int:
+    """
+    Delete used and expired tokens, `batch_size` rows per transaction so
+    the table is never locked for long. Safe to run from several workers.
+    """
+    stale = (
+        select(PasswordResetToken.id)
+        .where(
+            or_(
+                PasswordResetToken.used != 0,
+                PasswordResetToken.expires_at <= datetime.utcnow(),
+            )
+        )
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    deleted = 0
+    while True:
+        session = SessionLocal()
+        try:
+            count = session.execute(
+                delete(PasswordResetToken).where(PasswordResetToken.id.in_(stale))
+            ).rowcount
+            session.commit()
+        finally:
+            session.close()
+        deleted += count
+        if count < batch_size:
+            return deleted
+
+
+def schedule_sweep():
+    """Sweep on the background pool if this worker hasn't lately"""
+    global _last_sweep
+    with _sweep_lock:
+        now = time.monotonic()
+        if now - _last_sweep < RESET_TOKEN_SWEEP_INTERVAL:
+            return None
+        _last_sweep = now
+    return background.submit("maintenance", sweep, max_workers=1)
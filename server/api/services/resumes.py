@@ -0,0 +1,188 @@
+import os
+import re
+import sys
+import unicodedata
+
+from dotenv import load_dotenv
+from sqlalchemy import String, any_, bindparam, func
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from config.db import SessionLocal
+from core.models import Application, ResumeDocument, Skill, User
+from services import background
+
+load_dotenv()
+
+RESUME_WORKERS = int(os.getenv("RESUME_WORKERS", 2))
+# Longest skill name we try to spot in a resume, in words ("google cloud platform")
+MAX_SKILL_WORDS = 3
+MAX_CONTENT_CHARS = 200_000
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*")
+_SPACE_RE = re.compile(r"\s+")
+
+
+# ============================================================
+# Extraction (runs in the process pool)
+# ============================================================
+def extract_text(path: str) -> str:
+    """Plain text of a PDF or DOCX file, normalized. Other formats yield ""."""
+    ext = path.rsplit(".", 1)[-1].lower() if "." in path else ""
+
+    if ext == "pdf":
+        from pypdf import PdfReader
+
+        reader = PdfReader(path)
+        raw = "\n".join(page.extract_text() or "" for page in reader.pages)
+    elif ext == "docx":
+        import docx
+
+        document = docx.Document(path)
+        parts = [p.text for p in document.paragraphs]
+        for table in document.tables:
+            for row in table.rows:
+                parts.extend(cell.text for cell in row.cells)
+        raw = "\n".join(parts)
+    else:
+        # Legacy .doc needs an external converter, we only index what we can parse
+        raw = ""
+
+    return normalize_text(raw)
+
+
+def normalize_text(raw: str) -> str:
+    text = unicodedata.normalize("NFKC", raw)
+    text = "".join(ch if ch.isprintable() else " " for ch in text)
+    return _SPACE_RE.sub(" ", text).strip()[:MAX_CONTENT_CHARS]
+
+
+def candidate_phrases(text: str) -> set:
+    """Every 1..MAX_SKILL_WORDS word phrase, lower-cased, to look up as skill names"""
+    words = [w.rstrip(".-") for w in _WORD_RE.findall(text.lower())]
+    phrases = set()
+    for size in range(1, MAX_SKILL_WORDS + 1):
+        for i in range(len(words) - size + 1):
+            phrases.add(" ".join(words[i : i + size]))
+    phrases.discard("")
+    return phrases
+
+
+# ============================================================
+# Indexing (runs on a thread, talks to the database)
+# ============================================================
+def store_resume_text(
+    user_id: int, file_url: str, content: str, application_id: int = None
+):
+    session = SessionLocal()
+    try:
+        phrases = candidate_phrases(content)
+        skill_tokens = []
+        if phrases:
+            # A long CV has tens of thousands of phrases: one array parameter
+            # (= ANY) rather than a bind per phrase, same lower(name) index
+            wanted = bindparam("phrases", sorted(phrases), type_=ARRAY(String))
+            skill_tokens = sorted(
+                name
+                for (name,) in session.query(func.lower(Skill.name))
+                .filter(func.lower(Skill.name) == any_(wanted))
+                .all()
+            )
+
+        document = (
+            session.query(ResumeDocument)
+            .filter(ResumeDocument.file_url == file_url)
+            .first()
+        )
+        if not document:
+            document = ResumeDocument(file_url=file_url)
+            session.add(document)
+
+        document.user_id = user_id
+        document.application_id = application_id
+        document.content = content
+        document.skill_tokens = skill_tokens
+
+        # A profile CV replaces the previous one (the extension may have changed)
+        if application_id is None:
+            session.query(ResumeDocument).filter(
+                ResumeDocument.user_id == user_id,
+                ResumeDocument.application_id.is_(None),
+                ResumeDocument.file_url != file_url,
+            ).delete(synchronize_session=False)
+
+        session.commit()
+        return document.id
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def schedule_resume_indexing(
+    path: str, user_id: int, file_url: str, application_id: int = None
+):
+    """
+    Parse the file in the resume process pool, then store the text and its
+    skill tokens from a thread so the pool only ever does CPU work.
+    """
+    future = background.submit(
+        "resumes", extract_text, path, max_workers=RESUME_WORKERS, processes=True
+    )
+
+    def _on_extracted(f):
+        if f.cancelled() or f.exception() is not None:
+            return
+        background.submit(
+            "resume-index",
+            store_resume_text,
+            user_id,
+            file_url,
+            f.result(),
+            application_id,
+            max_workers=1,
+        )
+
+    future.add_done_callback(_on_extracted)
+    return future
+
+
+def reindex_all(uploads_root: str = "."):
+    """Offline backfill: (re)index every CV referenced in the database"""
+    session = SessionLocal()
+    try:
+        jobs = [
+            (u.id, u.resume_url, None)
+            for u in session.query(User.id, User.resume_url).filter(
+                User.resume_url.like("/uploads/%")
+            )
+        ]
+        jobs += [
+            (a.user_id, a.resume_url, a.id)
+            for a in session.query(
+                Application.id, Application.user_id, Application.resume_url
+            ).filter(Application.resume_url.like("/uploads/%"))
+        ]
+    finally:
+        session.close()
+
+    jobs = [
+        (user_id, file_url, application_id, path)
+        for user_id, file_url, application_id in jobs
+        for path in [os.path.join(uploads_root, file_url.lstrip("/"))]
+        if os.path.isfile(path)
+    ]
+
+    pool = background.get_executor(
+        "resumes", max_workers=RESUME_WORKERS, processes=True
+    )
+    texts = pool.map(extract_text, [job[3] for job in jobs], chunksize=16)
+    for (user_id, file_url, application_id, _), content in zip(jobs, texts):
+        store_resume_text(user_id, file_url, content, application_id)
+
+    print(f"Indexed {len(jobs)} resumes")
+    return len(jobs)
+
+
+if __name__ == "__main__":
+    reindex_all(sys.argv[1] if len(sys.argv) > 1 else ".")
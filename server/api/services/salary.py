@@ -0,0 +1,127 @@
+import os
+import re
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Currency of salaries written without one ("40k-60k")
+DEFAULT_SALARY_CURRENCY = os.getenv("DEFAULT_SALARY_CURRENCY", "USD")
+
+_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY", "₹": "INR"}
+# ISO 4217 codes salaries are posted in; any other 3 letter word ("PER",
+# "EXP") isn't a currency
+_CURRENCIES = {
+    "AED", "ARS", "AUD", "BGN", "BRL", "CAD", "CHF", "CLP", "CNY", "COP",
+    "CZK", "DKK", "EGP", "EUR", "GBP", "HKD", "HUF", "IDR", "ILS", "INR",
+    "JPY", "KES", "KRW", "MAD", "MXN", "MYR", "NGN", "NOK", "NZD", "PEN",
+    "PHP", "PKR", "PLN", "QAR", "RON", "RSD", "SAR", "SEK", "SGD", "THB",
+    "TRY", "TWD", "UAH", "USD", "VND", "ZAR",
+}  # fmt: skip
+_CODE = re.compile(r"\b([A-Z]{3})\b")
+# 40k, $40,000, 1.5m, 85 000, €45.000, 45,5k; "m" of "months" isn't a suffix
+_AMOUNT = re.compile(
+    r"([$€£¥₹])?\s*(\d+(?:[.,\s]\d{3})*(?:[.,]\d+)?)\s*(?:([kKmM])(?![a-zA-Z]))?"
+)
+_CODE_BEFORE = re.compile(r"\b([A-Z]{3})\s*$")
+_CODE_AFTER = re.compile(r"^\s*([A-Z]{3})\b")
+# Between the two ends of a range: "40-60k", "$40k to $60k"
+_RANGE_GAP = re.compile(r"^\s*(-|–|—|to)\s*$")
+# A bare number below this is a count ("3-5 years"), not a salary; smaller
+# ones need a currency or a k / m ("$25/hour", "40k")
+MIN_PLAIN_AMOUNT = int(os.getenv("MIN_PLAIN_SALARY", 1000))
+# What fits the Integer salary_min / salary_max columns
+MAX_SALARY = 2**31 - 1
+_OPEN_ENDED = re.compile(r"\+|\b(from|min(imum)?|at least)\b", re.I)
+_UP_TO = re.compile(r"\b(up to|max(imum)?|under)\b", re.I)
+
+
+def _amount(number: str, suffix: str):
+    """
+    The amount of a number as written, None when it doesn't fit a column.
+    The last "." or "," is the decimal mark unless 3 digits follow it and
+    it either repeats ("1.250.000") or no k / m follows ("45.000").
+    """
+    number = re.sub(r"\s", "", number)
+    marks = re.findall(r"[.,]", number)
+    whole, decimals = number, ""
+    if marks:
+        head, _, tail = number.rpartition(marks[-1])
+        grouping = len(tail) == 3 and (marks.count(marks[-1]) > 1 or not suffix)
+        if not grouping:
+            whole, decimals = head, tail
+    value = float(f"{re.sub(r'[.,]', '', whole)}.{decimals or 0}")
+    if suffix:
+        value *= 1_000 if suffix.lower() == "k" else 1_000_000
+    value = int(round(value))
+    return value if value <= MAX_SALARY else None
+
+
+def _amounts(text: str) -> list:
+    """
+    The salary amounts of a text, in order. A number counts when a currency
+    symbol or ISO code is next to it, a k / m follows it or it is at least
+    MIN_PLAIN_AMOUNT; both ends of a range share those ("40-60k" is 40k to
+    60k). Amounts too large for the columns are left out.
+    """
+    found = []  # [number, suffix, marked]
+    previous_end = None
+    for match in _AMOUNT.finditer(text):
+        symbol, number, suffix = match.groups()
+        code = _CODE_BEFORE.search(text[: match.start()]) or _CODE_AFTER.search(
+            text[match.end() :]
+        )
+        marked = bool(symbol or (code and code.group(1) in _CURRENCIES))
+        entry = [number, suffix, marked]
+        if found and _RANGE_GAP.match(text[previous_end : match.start()]):
+            low = found[-1]
+            low[1] = low[1] or suffix
+            entry[1] = suffix or low[1]
+            low[2] = entry[2] = low[2] or marked
+        found.append(entry)
+        previous_end = match.end()
+
+    amounts = []
+    for number, suffix, marked in found:
+        value = _amount(number, suffix)
+        if value is None:
+            continue
+        if marked or suffix or value >= MIN_PLAIN_AMOUNT:
+            amounts.append(value)
+    return amounts
+
+
+def parse_salary_range(text: str) -> tuple:
+    """
+    (min, max, currency) of a free text salary such as "$40k-$120k",
+    "40,000 - 55,000 EUR", "€45.000 - €60.000", "£30k+" or "up to $90k";
+    an open end is None. (None, None, None) when no amount can be found;
+    counts such as "3-5 years" aren't amounts, see _amounts().
+    """
+    if not text:
+        return None, None, None
+
+    amounts = _amounts(text)
+    if not amounts:
+        return None, None, None
+
+    currency = next((c for s, c in _SYMBOLS.items() if s in text), None)
+    if currency is None:
+        codes = [c for c in _CODE.findall(text) if c in _CURRENCIES]
+        currency = codes[0] if codes else DEFAULT_SALARY_CURRENCY
+
+    if len(amounts) == 1:
+        if _UP_TO.search(text):
+            return None, amounts[0], currency
+        if _OPEN_ENDED.search(text):
+            return amounts[0], None, currency
+        return amounts[0], amounts[0], currency
+
+    low, high = min(amounts[:2]), max(amounts[:2])
+    return low, high, currency
+
+
+def salary_columns(text: str) -> dict:
+    """Job column values for a salary_range text, set next to it on writes"""
+    low, high, currency = parse_salary_range(text)
+    return {"salary_min": low, "salary_max": high, "salary_currency": currency}
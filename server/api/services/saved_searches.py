@@ -0,0 +1,312 @@
+import os
+import re
+from datetime import datetime
+
+from dotenv import load_dotenv
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from config.db import SessionLocal
+from core.models import (
+    Job,
+    Notification,
+    SavedSearch,
+    SavedSearchMatch,
+    job_skills,
+    saved_search_terms,
+)
+from services.geo import covering_cells, haversine_km
+
+load_dotenv()
+
+MAX_SAVED_SEARCHES = int(os.getenv("MAX_SAVED_SEARCHES", 20))
+# Saved searches loaded and checked at a time against a new job
+SAVED_SEARCH_BATCH = int(os.getenv("SAVED_SEARCH_BATCH", 1000))
+# Users per digest transaction, and jobs named in one digest notification
+DIGEST_BATCH = int(os.getenv("DIGEST_BATCH", 500))
+DIGEST_MAX_JOBS = int(os.getenv("DIGEST_MAX_JOBS", 5))
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+# Fields a match is checked on, read by row attribute
+_SEARCH_COLUMNS = (
+    SavedSearch.id,
+    SavedSearch.user_id,
+    SavedSearch.name,
+    SavedSearch.keyword,
+    SavedSearch.skill_ids,
+    SavedSearch.category_id,
+    SavedSearch.latitude,
+    SavedSearch.longitude,
+    SavedSearch.radius_km,
+    SavedSearch.frequency,
+)
+
+
+def words(text: str) -> set:
+    # One letter words count: "C" and "R" are languages people search for
+    return set(_WORD.findall((text or "").lower()))
+
+
+def _term(kind: str, value) -> str:
+    return f"{kind}:{value}"[:64]
+
+
+def search_terms(search) -> list:
+    """
+    Terms a saved search is indexed under. They come from one filter every
+    match has to pass, so a matching job always shares one of them; the
+    filter likely to be the most selective is used.
+    """
+    keyword = words(search.keyword)
+    if keyword:
+        # All words are required, the longest is probably the rarest
+        return [_term("w", max(sorted(keyword), key=len))]
+    if search.latitude is not None:
+        cells = covering_cells(search.latitude, search.longitude, search.radius_km)
+        return [_term("g", cell) for cell in cells]
+    if search.skill_ids:
+        return [_term("s", skill_id) for skill_id in sorted(set(search.skill_ids))]
+    if search.category_id:
+        return [_term("c", search.category_id)]
+    return [_term("*", "")]
+
+
+def job_terms(job, skill_ids: set, job_words: set) -> list:
+    """Every term a saved search matching the job can be indexed under"""
+    terms = {_term("*", "")}
+    terms.update(_term("w", word) for word in job_words)
+    terms.update(_term("s", skill_id) for skill_id in skill_ids)
+    if job.category_id:
+        terms.add(_term("c", job.category_id))
+    if job.geohash:
+        # Searches index cells of varying size: any prefix of the job's
+        terms.update(
+            _term("g", job.geohash[:n]) for n in range(1, len(job.geohash) + 1)
+        )
+    return sorted(terms)
+
+
+def matches(search, job, skill_ids: set, job_words: set) -> bool:
+    if search.keyword and not words(search.keyword) <= job_words:
+        return False
+    if search.skill_ids and not skill_ids.intersection(search.skill_ids):
+        return False
+    if search.category_id and search.category_id != job.category_id:
+        return False
+    if search.latitude is not None:
+        if job.latitude is None:
+            return False
+        distance = haversine_km(
+            search.latitude, search.longitude, job.latitude, job.longitude
+        )
+        if distance > search.radius_km:
+            return False
+    return True
+
+
+def index_search(session, search):
+    """(Re)write the terms of a saved search. Caller flushed it and commits."""
+    session.execute(
+        delete(saved_search_terms).where(
+            saved_search_terms.c.saved_search_id == search.id
+        )
+    )
+    session.execute(
+        insert(saved_search_terms),
+        [{"term": term, "saved_search_id": search.id} for term in search_terms(search)],
+    )
+
+
+def match_job(job_id: int) -> set:
+    """
+    Record the saved searches a new job matches and notify the owners of
+    instant ones. Only the searches sharing a term with the job are loaded
+    and checked, SAVED_SEARCH_BATCH at a time. Returns the ids of the users
+    notified; rerunning it notifies nobody twice.
+    """
+    reader = SessionLocal()
+    writer = SessionLocal()
+    notified = set()
+    try:
+        job = reader.execute(
+            select(
+                Job.id,
+                Job.employer_id,
+                Job.title,
+                Job.company,
+                Job.description,
+                Job.category_id,
+                Job.latitude,
+                Job.longitude,
+                Job.geohash,
+            ).where(Job.id == job_id)
+        ).first()
+        if job is None:
+            return notified
+        skill_ids = set(
+            reader.execute(
+                select(job_skills.c.skill_id).where(job_skills.c.job_id == job_id)
+            ).scalars()
+        )
+        job_words = words(
+            " ".join(filter(None, (job.title, job.company, job.description)))
+        )
+
+        candidates = reader.execute(
+            select(saved_search_terms.c.saved_search_id)
+            .where(saved_search_terms.c.term.in_(job_terms(job, skill_ids, job_words)))
+            .distinct()
+            .execution_options(yield_per=SAVED_SEARCH_BATCH)
+        )
+        for rows in candidates.partitions():
+            searches = writer.execute(
+                select(*_SEARCH_COLUMNS).where(
+                    SavedSearch.id.in_([row.saved_search_id for row in rows])
+                )
+            ).all()
+            matched = [s for s in searches if matches(s, job, skill_ids, job_words)]
+            if not matched:
+                continue
+
+            now = datetime.utcnow()
+            new = set(
+                writer.execute(
+                    pg_insert(SavedSearchMatch.__table__)
+                    .on_conflict_do_nothing(
+                        index_elements=["saved_search_id", "job_id"]
+                    )
+                    .returning(SavedSearchMatch.saved_search_id),
+                    [
+                        {
+                            "saved_search_id": s.id,
+                            "job_id": job.id,
+                            "notified_at": now if s.frequency == "instant" else None,
+                        }
+                        for s in matched
+                    ],
+                ).scalars()
+            )
+
+            # One notification per user, however many of their searches match
+            instant = {}
+            for s in matched:
+                if (
+                    s.id in new
+                    and s.frequency == "instant"
+                    and s.user_id not in notified
+                ):
+                    instant.setdefault(s.user_id, s)
+            if instant:
+                writer.execute(
+                    insert(Notification),
+                    [
+                        {
+                            "sender_id": job.employer_id,
+                            "receiver_id": user_id,
+                            "type": "job_posted",
+                            "title": f'New job for "{s.name}": {job.title}'[:255],
+                            "message": f'{job.company} posted "{job.title}"',
+                        }
+                        for user_id, s in instant.items()
+                    ],
+                )
+            writer.commit()
+            notified.update(instant)
+    except Exception:
+        writer.rollback()
+        raise
+    finally:
+        reader.close()
+        writer.close()
+
+    return notified
+
+
+def _digest(matches: list) -> dict:
+    """Title and message of a digest notification for (title, company) rows"""
+    count = len(matches)
+    listed = "; ".join(
+        f"{title} at {company}" for title, company in matches[:DIGEST_MAX_JOBS]
+    )
+    if count > DIGEST_MAX_JOBS:
+        listed += f" and {count - DIGEST_MAX_JOBS} more"
+    plural = "job" if count == 1 else "jobs"
+    return {"title": f"{count} new {plural} for your saved searches", "message": listed}
+
+
+def send_digests(batch_size: int = DIGEST_BATCH) -> int:
+    """
+    One notification per user listing the jobs their digest searches
+    matched since the last one, `batch_size` users per transaction. For
+    cron, see scripts/send_search_digests.py. Returns the digests sent.
+    """
+    pending = (
+        SavedSearchMatch.notified_at.is_(None),
+        SavedSearch.frequency == "digest",
+    )
+    sent = 0
+    last_user_id = 0
+    while True:
+        session = SessionLocal()
+        try:
+            user_ids = (
+                session.execute(
+                    select(SavedSearch.user_id)
+                    .join(
+                        SavedSearchMatch,
+                        SavedSearchMatch.saved_search_id == SavedSearch.id,
+                    )
+                    .where(*pending, SavedSearch.user_id > last_user_id)
+                    .group_by(SavedSearch.user_id)
+                    .order_by(SavedSearch.user_id)
+                    .limit(batch_size)
+                )
+                .scalars()
+                .all()
+            )
+            if not user_ids:
+                return sent
+
+            rows = session.execute(
+                select(
+                    SavedSearchMatch.id,
+                    SavedSearch.user_id,
+                    Job.id.label("job_id"),
+                    Job.title,
+                    Job.company,
+                )
+                .join(SavedSearch, SavedSearch.id == SavedSearchMatch.saved_search_id)
+                .join(Job, Job.id == SavedSearchMatch.job_id)
+                .where(*pending, SavedSearch.user_id.in_(user_ids))
+                .order_by(SavedSearch.user_id, SavedSearchMatch.matched_at.desc())
+            ).all()
+
+            # A job matched by two searches of the user is listed once
+            jobs = {}
+            for row in rows:
+                jobs.setdefault(row.user_id, {}).setdefault(
+                    row.job_id, (row.title, row.company)
+                )
+            session.execute(
+                insert(Notification),
+                [
+                    {
+                        "receiver_id": user_id,
+                        "type": "job_posted",
+                        **_digest(list(found.values())),
+                    }
+                    for user_id, found in jobs.items()
+                ],
+            )
+            session.execute(
+                update(SavedSearchMatch)
+                .where(SavedSearchMatch.id.in_([row.id for row in rows]))
+                .values(notified_at=datetime.utcnow())
+            )
+            session.commit()
+        finally:
+            session.close()
+
+        sent += len(jobs)
+        last_user_id = user_ids[-1]
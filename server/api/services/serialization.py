@@ -0,0 +1,82 @@
+import decimal
+import os
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+from flask.json.provider import DefaultJSONProvider
+
+load_dotenv()
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+# "orjson" (when installed) or "std"
+JSON_ENCODER = os.getenv("JSON_ENCODER", "orjson" if orjson else "std").lower()
+
+
+def _default(value):
+    # What orjson doesn't know natively (datetime, date, UUID and dataclasses it does)
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    jsonify() through orjson. Datetimes come out as ISO 8601 in UTC
+    ("2026-10-19T12:00:00Z"; Flask's default provider writes an HTTP date),
+    so views can hand them over as they are; naive ones are the UTC the
+    database stores. Keys are sorted unless sort_keys is off.
+    """
+
+    def _options(self) -> int:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(
+            obj,
+            default=_default,
+            option=self._options() | orjson.OPT_APPEND_NEWLINE,
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+class StdJSONProvider(DefaultJSONProvider):
+    """The stdlib encoder, with the same ISO datetimes as OrjsonProvider"""
+
+    @staticmethod
+    def default(value):
+        if isinstance(value, datetime):
+            if value.utcoffset() is None:
+                return value.isoformat() + "Z"
+            if value.utcoffset() == timedelta(0):
+                return value.replace(tzinfo=None).isoformat() + "Z"
+            return value.isoformat()
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return DefaultJSONProvider.default(value)
+
+
+def init_json(app, encoder: str = JSON_ENCODER):
+    if encoder == "orjson":
+        if orjson is None:
+            raise RuntimeError("JSON_ENCODER=orjson needs the orjson package")
+        app.json = OrjsonProvider(app)
+    else:
+        app.json = StdJSONProvider(app)
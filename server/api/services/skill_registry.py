@@ -0,0 +1,143 @@
+import os
+from threading import Lock
+
+from cachetools import TTLCache
+from dotenv import load_dotenv
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from core.models import Skill
+
+load_dotenv()
+
+SKILL_CACHE_SIZE = int(os.getenv("SKILL_CACHE_SIZE", 50_000))
+# Other workers' deletes/renames are only seen once an entry expires
+SKILL_CACHE_TTL = int(os.getenv("SKILL_CACHE_TTL", 300))
+
+# Session.info key listing skill ids inserted by the still-open transaction
+_CREATED_KEY = "skill_registry_created_ids"
+
+
+def normalize(name: str) -> str:
+    """Lookup key for a skill name, matching the lower(name) unique index"""
+    return " ".join(name.split()).lower()
+
+
+class SkillRegistry:
+    """
+    In-process cache of lower(name) -> skill id in front of the skills table.
+    resolve() answers from memory when it can, and otherwise costs one SELECT
+    plus (when creating) one INSERT ... ON CONFLICT DO NOTHING for the batch.
+    """
+
+    def __init__(self, maxsize: int = SKILL_CACHE_SIZE, ttl: int = SKILL_CACHE_TTL):
+        self._ids = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, db: Session, names, create: bool = True) -> dict:
+        """
+        Map each name's normalized form to a skill id. Unknown names are created
+        when `create` is set, otherwise left out. The caller owns the commit.
+        """
+        wanted = {}
+        for name in names:
+            if name and name.strip():
+                wanted.setdefault(normalize(name), " ".join(name.split()))
+
+        resolved = {}
+        with self._lock:
+            for key in wanted:
+                skill_id = self._ids.get(key)
+                if skill_id is not None:
+                    resolved[key] = skill_id
+            self.hits += len(resolved)
+            self.misses += len(wanted) - len(resolved)
+
+        missing = [key for key in wanted if key not in resolved]
+        if not missing:
+            return resolved
+
+        found = dict(
+            db.query(func.lower(Skill.name), Skill.id)
+            .filter(func.lower(Skill.name).in_(missing))
+            .all()
+        )
+        resolved.update(found)
+
+        to_create = [wanted[key] for key in missing if key not in found]
+        if create and to_create:
+            created = db.execute(
+                pg_insert(Skill)
+                .values([{"name": name} for name in to_create])
+                .on_conflict_do_nothing()
+                .returning(Skill.id, Skill.name)
+            ).all()
+            created_ids = {normalize(name): skill_id for skill_id, name in created}
+            resolved.update(created_ids)
+            db.info.setdefault(_CREATED_KEY, set()).update(created_ids.values())
+
+            # Lost a race with a concurrent insert: the row is committed by now
+            raced = [key for key in missing if key not in resolved]
+            if raced:
+                raced_ids = dict(
+                    db.query(func.lower(Skill.name), Skill.id)
+                    .filter(func.lower(Skill.name).in_(raced))
+                    .all()
+                )
+                resolved.update(raced_ids)
+                found.update(raced_ids)
+
+        # Only committed rows are cached, our own inserts may still roll back
+        uncommitted = db.info.get(_CREATED_KEY, set())
+        with self._lock:
+            for key, skill_id in found.items():
+                if skill_id not in uncommitted:
+                    self._ids[key] = skill_id
+
+        return resolved
+
+    def get_or_create(self, db: Session, names) -> list:
+        """
+        Skill rows for the given names (created if needed), in input order.
+        On top of resolve() it always loads the rows by id, which also
+        catches cached ids of skills deleted elsewhere: one query when every
+        name is cached, usually three for new names. Callers that only need
+        ids and can live with a stale one should call resolve().
+        """
+        keys = list(dict.fromkeys(normalize(n) for n in names if n and n.strip()))
+        if not keys:
+            return []
+
+        ids = self.resolve(db, names)
+        skills = {s.id: s for s in db.query(Skill).filter(Skill.id.in_(ids.values()))}
+
+        stale = [key for key in keys if ids.get(key) not in skills]
+        if stale:
+            # Deleted by another worker since we cached it
+            self.forget_ids(ids[key] for key in stale if key in ids)
+            retry = self.resolve(db, [n for n in names if normalize(n) in stale])
+            ids.update(retry)
+            skills.update(
+                (s.id, s) for s in db.query(Skill).filter(Skill.id.in_(retry.values()))
+            )
+
+        return [skills[ids[key]] for key in keys if ids.get(key) in skills]
+
+    def forget_ids(self, skill_ids):
+        """Drop cache entries pointing at these ids (skill deleted or renamed)"""
+        skill_ids = set(skill_ids)
+        if not skill_ids:
+            return
+        with self._lock:
+            for key in [k for k, v in self._ids.items() if v in skill_ids]:
+                self._ids.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._ids.clear()
+
+
+skill_registry = SkillRegistry()
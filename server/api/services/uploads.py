@@ -0,0 +1,141 @@
+import hashlib
+import mimetypes
+import os
+import re
+import tempfile
+from threading import Lock
+
+from cachetools import LRUCache
+from dotenv import load_dotenv
+from flask import Response, abort, request, send_file
+from werkzeug.security import safe_join
+
+load_dotenv()
+
+# How uploads leave the server:
+#   ""           -> streamed by the app worker (send_file, range + conditional aware)
+#   "x-accel"    -> empty response with X-Accel-Redirect, nginx streams the bytes
+#   "x-sendfile" -> X-Sendfile header for Apache/lighttpd style proxies
+UPLOADS_SENDFILE = os.getenv("UPLOADS_SENDFILE", "").lower()
+UPLOADS_ACCEL_PREFIX = os.getenv("UPLOADS_ACCEL_PREFIX", "/_protected_uploads/")
+UPLOADS_MAX_AGE = int(os.getenv("UPLOADS_MAX_AGE", 3600))
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+HASH_CHUNK_SIZE = 64 * 1024
+DIGEST_LENGTH = 32
+
+# Files saved through save_content_addressed() end with "_<hex digest>.<ext>"
+CONTENT_ADDRESSED_RE = re.compile(r"_([0-9a-f]{%d})\.[A-Za-z0-9]+$" % DIGEST_LENGTH)
+
+# path -> (mtime_ns, size, etag), so repeated hits never re-read the file
+_etag_cache = LRUCache(maxsize=int(os.getenv("UPLOADS_ETAG_CACHE_SIZE", 4096)))
+_etag_lock = Lock()
+
+# mkstemp creates files as 0600; saved uploads get the mode a plain open()
+# would give them, so a front proxy running as another user can read them.
+# Read once at import, os.umask() can only be read by setting it.
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def is_content_addressed(filename: str) -> bool:
+    return CONTENT_ADDRESSED_RE.search(filename) is not None
+
+
+def file_etag(path: str, stat: os.stat_result) -> str:
+    """
+    Strong ETag for a file, derived from its content hash.
+    Content-addressed names already carry the hash, other files are hashed
+    once and remembered until their mtime or size changes.
+    """
+    match = CONTENT_ADDRESSED_RE.search(os.path.basename(path))
+    if match:
+        return match.group(1)
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _etag_lock:
+        cached = _etag_cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    etag = digest.hexdigest()[:DIGEST_LENGTH]
+
+    with _etag_lock:
+        _etag_cache[path] = (key, etag)
+    return etag
+
+
+def save_content_addressed(file, upload_dir: str, prefix: str, ext: str) -> str:
+    """
+    Save an uploaded file as "<prefix>_<sha256>.<ext>" and return the saved name.
+    The name changes whenever the bytes change, which lets us serve it as immutable.
+    """
+    os.makedirs(upload_dir, exist_ok=True)
+
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=upload_dir, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for chunk in iter(lambda: file.stream.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+                out.write(chunk)
+
+        saved_name = f"{prefix}_{digest.hexdigest()[:DIGEST_LENGTH]}.{ext}"
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, os.path.join(upload_dir, saved_name))
+        return saved_name
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def send_upload(directory: str, filename: str):
+    """
+    Serve a file from the uploads directory with strong ETags, conditional GET,
+    range support and long-lived caching for content-addressed names.
+    """
+    path = safe_join(directory, filename)
+    if path is None:
+        abort(404)
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        abort(404)
+    if not os.path.isfile(path):
+        abort(404)
+
+    etag = file_etag(path, stat)
+    immutable = is_content_addressed(filename)
+    max_age = IMMUTABLE_MAX_AGE if immutable else UPLOADS_MAX_AGE
+
+    if UPLOADS_SENDFILE == "x-accel":
+        response = Response(status=200)
+        response.headers["X-Accel-Redirect"] = UPLOADS_ACCEL_PREFIX + filename.lstrip(
+            "/"
+        )
+        response.mimetype = (
+            mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        )
+        response.set_etag(etag)
+        response.last_modified = stat.st_mtime
+        # Answer revalidations here, the proxy only sees real downloads
+        response.make_conditional(request)
+        if response.status_code == 304:
+            del response.headers["X-Accel-Redirect"]
+    else:
+        # send_file honours app.use_x_sendfile for the "x-sendfile" mode and
+        # handles Range / If-None-Match / If-Modified-Since itself
+        response = send_file(path, etag=etag, conditional=True, max_age=max_age)
+
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    if immutable:
+        response.cache_control.immutable = True
+
+    return response
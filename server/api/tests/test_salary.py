@@ -0,0 +1,53 @@
+import pytest
+
+from services.salary import parse_salary_range
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("$40k-$120k", (40_000, 120_000, "USD")),
+        ("40,000 - 55,000 EUR", (40_000, 55_000, "EUR")),
+        ("€45.000 - €60.000", (45_000, 60_000, "EUR")),
+        ("1.250.000 INR", (1_250_000, 1_250_000, "INR")),
+        ("85 000 - 95 000 CHF", (85_000, 95_000, "CHF")),
+        ("$120,000.50", (120_000, 120_000, "USD")),
+        ("40-60k", (40_000, 60_000, "USD")),
+        ("25-30 EUR/hour", (25, 30, "EUR")),
+        ("$25/hour", (25, 25, "USD")),
+        ("1.5m", (1_500_000, 1_500_000, "USD")),
+        ("45,5k", (45_500, 45_500, "USD")),
+        ("£30k+", (30_000, None, "GBP")),
+        ("up to $90k", (None, 90_000, "USD")),
+    ],
+)
+def test_amounts_and_currency(text, expected):
+    assert parse_salary_range(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, currency",
+    [
+        ("100k-150k per year", "USD"),
+        ("60k-80k CAD per annum", "CAD"),
+    ],
+)
+def test_only_iso_codes_are_currencies(text, currency):
+    assert parse_salary_range(text)[2] == currency
+
+
+def test_amounts_too_large_for_the_columns_are_dropped():
+    assert parse_salary_range("$3,000,000,000") == (None, None, None)
+    assert parse_salary_range("$50k - $3,000,000,000") == (50_000, 50_000, "USD")
+
+
+def test_counts_are_not_amounts():
+    assert parse_salary_range("3-5 years, $50k") == (50_000, 50_000, "USD")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [None, "", "Competitive", "DOE", "Negotiable, ~2 years exp", "2 months"],
+)
+def test_no_amount(text):
+    assert parse_salary_range(text) == (None, None, None)
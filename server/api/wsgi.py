@@ -0,0 +1,5 @@
+"""WSGI entry point, see gunicorn.conf.py"""
+
+from server import create_app
+
+app = application = create_app()
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Latency / throughput benchmark for the API.
+
+Replays a weighted mix of requests (suggested jobs, search, notifications,
+connections, admin dashboards) as seeded users and reports p50/p95/p99 and
+queries per request for every endpoint.
+
+    # in-process (Flask test client), counts queries itself
+    python benchmarks/http_load.py --seed-scale 0.1 --requests 2000
+
+    # against a running server, queries come from its Server-Timing header
+    python benchmarks/http_load.py --target http://localhost:5000 --concurrency 16
+
+    # keep the result, and fail later runs that regress
+    python benchmarks/http_load.py --save benchmarks/baselines/main.json
+    python benchmarks/http_load.py --compare benchmarks/baselines/main.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent / "api"
+sys.path.insert(0, str(API_DIR))
+
+# Every user logs in and searches from one address: with the limiter on most
+# of them get a 429 and their endpoints drop out of the plan. Set before the
+# app is imported; a --target server has to be started with it too.
+os.environ["RATELIMIT_ENABLED"] = "false"
+RATE_LIMITED = (
+    "429 Too Many Requests: run the server with RATELIMIT_ENABLED=false, "
+    "rate limited results aren't comparable"
+)
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from seed.bulk import DATABASE_URL, SEED_PASSWORD
+
+# name -> (weight, role allowed to call it, path template)
+TRAFFIC_MIX = {
+    "jobs.suggested": (30, "candidate", "/api/jobs/suggested?page={page}"),
+    "search": (25, None, "/api/search?q={term}"),
+    "notifications": (20, None, "/api/notifications/"),
+    "connections": (15, None, "/api/connections/"),
+    "admin.stats": (3, "admin", "/api/admin/stats"),
+    "admin.dashboard": (3, "admin", "/api/admin/dashboard"),
+    "admin.users": (2, "admin", "/api/admin/users?page={page}"),
+    "admin.app_status_chart": (2, "admin", "/api/admin/app-status-chart"),
+}
+USERS_PER_ROLE = {"candidate": 40, "employer": 10, "admin": 3}
+
+# Regressions beyond these ratios fail --compare
+P95_TOLERANCE = 0.20
+QUERIES_TOLERANCE = 0.10  # per-user data makes N+1 counts vary a little
+
+_SERVER_TIMING_QUERIES = re.compile(r'db;[^,]*desc="(\d+) quer')
+
+
+# ============================================================
+# Clients
+# ============================================================
+class InProcessClient:
+    """Flask test client; SQL statements are counted with engine events"""
+
+    def __init__(self):
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        from config import db
+        from server import create_app
+
+        # Statement logging would dominate the timings
+        db.get_engine().echo = False
+
+        self._app = create_app()
+        self._local = threading.local()
+
+        @event.listens_for(Engine, "after_cursor_execute")
+        def _count(*args, **kwargs):
+            self._local.queries = getattr(self._local, "queries", 0) + 1
+
+    def _client(self):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self._app.test_client()
+        return client
+
+    def request(self, method, path, token=None, json_body=None):
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self._local.queries = 0
+        started = time.perf_counter()
+        response = self._client().open(
+            path, method=method, headers=headers, json=json_body
+        )
+        elapsed = time.perf_counter() - started
+        return (
+            response.status_code,
+            response.get_json(silent=True),
+            elapsed,
+            self._local.queries,
+        )
+
+
+class HttpClient:
+    """Real HTTP against --target, one pooled session per thread"""
+
+    def __init__(self, base_url: str, timeout: float = 30):
+        import requests
+
+        self._requests = requests
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def request(self, method, path, token=None, json_body=None):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._requests.Session()
+
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        started = time.perf_counter()
+        response = session.request(
+            method,
+            self._base_url + path,
+            headers=headers,
+            json=json_body,
+            timeout=self._timeout,
+        )
+        elapsed = time.perf_counter() - started
+
+        match = _SERVER_TIMING_QUERIES.search(response.headers.get("Server-Timing", ""))
+        queries = int(match.group(1)) if match else None
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        return response.status_code, body, elapsed, queries
+
+
+# ============================================================
+# Setup
+# ============================================================
+def load_fixtures(rng: random.Random) -> dict:
+    """Seeded accounts per role, and search terms that actually match rows"""
+    import psycopg2
+
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        with conn.cursor() as cur:
+            users = {}
+            for role, count in USERS_PER_ROLE.items():
+                cur.execute(
+                    "SELECT email FROM public.users "
+                    "WHERE role = %s AND email LIKE %s ORDER BY id LIMIT %s",
+                    (role, "%@seed.example.com", count * 20),
+                )
+                emails = [row[0] for row in cur.fetchall()]
+                users[role] = rng.sample(emails, min(count, len(emails)))
+
+            cur.execute("SELECT name FROM public.skills ORDER BY id LIMIT 500")
+            terms = [row[0] for row in cur.fetchall()]
+            cur.execute("SELECT title FROM public.jobs ORDER BY id LIMIT 500")
+            terms += [row[0].split()[0] for row in cur.fetchall() if row[0]]
+    finally:
+        conn.close()
+
+    if not any(users.values()):
+        raise SystemExit("No seeded users found, run with --seed-scale first")
+    return {"users": users, "terms": terms or ["engineer"]}
+
+
+def login_all(client, users: dict) -> dict:
+    """role -> list of bearer tokens"""
+    tokens = {}
+    for role, emails in users.items():
+        tokens[role] = []
+        for email in emails:
+            status, body, _, _ = client.request(
+                "POST",
+                "/api/auth/login",
+                json_body={"email": email, "password": SEED_PASSWORD},
+            )
+            if status == 429:
+                raise SystemExit(f"Login of {email} failed with {RATE_LIMITED}")
+            if status == 200 and body and body.get("token"):
+                tokens[role].append(body["token"])
+            else:
+                print(f"⚠️  Login failed for {email} ({status})")
+    return tokens
+
+
+def build_plan(rng: random.Random, tokens: dict, terms: list, total: int) -> list:
+    """The exact request sequence, drawn up front so runs are comparable"""
+    names = [n for n, (_, role, _) in TRAFFIC_MIX.items() if tokens.get(role or "any")]
+    weights = [TRAFFIC_MIX[n][0] for n in names]
+    if not names:
+        raise SystemExit("No tokens to send requests with")
+
+    plan = []
+    for name in rng.choices(names, weights=weights, k=total):
+        _, role, template = TRAFFIC_MIX[name]
+        path = template.format(page=rng.randint(1, 5), term=rng.choice(terms))
+        plan.append((name, path, rng.choice(tokens[role or "any"])))
+    return plan
+
+
+# ============================================================
+# Run and report
+# ============================================================
+def percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1)))
+    )
+    return sorted_values[index]
+
+
+def run(client, plan: list, concurrency: int) -> tuple:
+    samples = {}
+    lock = threading.Lock()
+
+    def _one(step):
+        name, path, token = step
+        status, _, elapsed, queries = client.request("GET", path, token=token)
+        with lock:
+            samples.setdefault(name, []).append((elapsed, status, queries))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(_one, plan))
+    return samples, time.perf_counter() - started
+
+
+def summarize(samples: dict, wall_time: float) -> dict:
+    endpoints = {}
+    for name, rows in sorted(samples.items()):
+        latencies = sorted(r[0] * 1000 for r in rows)
+        queries = [r[2] for r in rows if r[2] is not None]
+        endpoints[name] = {
+            "requests": len(rows),
+            "errors": sum(1 for r in rows if r[1] >= 400),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "mean_ms": round(sum(latencies) / len(latencies), 2),
+            "queries_per_request": (
+                round(sum(queries) / len(queries), 2) if queries else None
+            ),
+        }
+
+    total = sum(e["requests"] for e in endpoints.values())
+    return {
+        "requests": total,
+        "wall_time_s": round(wall_time, 2),
+        "throughput_rps": round(total / wall_time, 1) if wall_time else 0,
+        "endpoints": endpoints,
+    }
+
+
+def print_report(summary: dict):
+    header = f"{'endpoint':<24}{'reqs':>7}{'err':>6}{'p50':>9}{'p95':>9}{'p99':>9}{'q/req':>8}"
+    print("\n" + header)
+    print("-" * len(header))
+    for name, e in summary["endpoints"].items():
+        qpr = "-" if e["queries_per_request"] is None else e["queries_per_request"]
+        print(
+            f"{name:<24}{e['requests']:>7}{e['errors']:>6}"
+            f"{e['p50_ms']:>9}{e['p95_ms']:>9}{e['p99_ms']:>9}{qpr:>8}"
+        )
+    print("-" * len(header))
+    print(
+        f"{summary['requests']} requests in {summary['wall_time_s']}s "
+        f"({summary['throughput_rps']} req/s), latencies in ms"
+    )
+
+
+def compare(summary: dict, baseline: dict) -> list:
+    """Human readable regressions of summary against a saved baseline"""
+    regressions = []
+    for name, current in summary["endpoints"].items():
+        before = baseline["endpoints"].get(name)
+        if not before:
+            continue
+        if current["p95_ms"] > before["p95_ms"] * (1 + P95_TOLERANCE):
+            regressions.append(
+                f"{name}: p95 {before['p95_ms']}ms -> {current['p95_ms']}ms"
+            )
+        if (
+            current["queries_per_request"] is not None
+            and before.get("queries_per_request") is not None
+            and current["queries_per_request"]
+            > before["queries_per_request"] * (1 + QUERIES_TOLERANCE)
+        ):
+            regressions.append(
+                f"{name}: queries/request {before['queries_per_request']}"
+                f" -> {current['queries_per_request']}"
+            )
+        if current["errors"] > before["errors"]:
+            regressions.append(
+                f"{name}: errors {before['errors']} -> {current['errors']}"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API latency benchmark")
+    parser.add_argument(
+        "--target", help="base URL of a running server (default: in-process)"
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    parser.add_argument(
+        "--seed-scale",
+        type=float,
+        help="(re)seed the database at this scale first, see seed/bulk.py",
+    )
+    parser.add_argument("--seed-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    args = parser.parse_args(argv)
+
+    if args.seed_scale:
+        from seed.bulk import seed
+
+        seed(args.seed_scale, args.seed, args.seed_workers, truncate=True)
+
+    rng = random.Random(args.seed)
+    fixtures = load_fixtures(rng)
+
+    if args.target:
+        client = HttpClient(args.target)
+    else:
+        # Controllers print freely, keep the report readable
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            client = InProcessClient()
+
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        tokens = login_all(client, fixtures["users"])
+    tokens["any"] = [t for role in ("candidate", "employer") for t in tokens[role]]
+    print(", ".join(f"{len(v)} {k}" for k, v in tokens.items() if k != "any"))
+
+    plan = build_plan(rng, tokens, fixtures["terms"], args.requests + args.warmup)
+    warmup, plan = plan[: args.warmup], plan[args.warmup :]
+
+    quiet = not args.target
+    with (
+        contextlib.redirect_stdout(open(os.devnull, "w"))
+        if quiet
+        else (contextlib.nullcontext())
+    ):
+        run(client, warmup, args.concurrency)
+        samples, wall_time = run(client, plan, args.concurrency)
+
+    limited = sum(1 for rows in samples.values() for r in rows if r[1] == 429)
+    if limited:
+        raise SystemExit(f"{limited} requests got {RATE_LIMITED}")
+
+    summary = summarize(samples, wall_time)
+    summary["meta"] = {
+        "target": args.target or "in-process",
+        "concurrency": args.concurrency,
+        "seed": args.seed,
+        "seed_scale": args.seed_scale,
+        "python": platform.python_version(),
+        "host": platform.node(),
+        "recorded_at": datetime.utcnow().isoformat(timespec="seconds"),
+    }
+    print_report(summary)
+
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"✓ Saved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(summary, json.load(f))
+        if regressions:
+            print("\n❌ Regressions against baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
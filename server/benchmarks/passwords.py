@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Password checks per second (and per core) through services/passwords.py.
+
+Every client thread does what /api/auth/login does with the hash: one
+verify_password() against a stored hash. Concurrency above
+PASSWORD_HASH_MAX_PENDING shows up as rejected (503) logins.
+
+    python benchmarks/passwords.py
+    python benchmarks/passwords.py --method pbkdf2:sha256:600000 --method scrypt:16384:8:1
+    python benchmarks/passwords.py --save benchmarks/baselines/passwords.json
+    python benchmarks/passwords.py --compare benchmarks/baselines/passwords.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent / "api"
+sys.path.insert(0, str(API_DIR))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Regressions beyond this ratio fail --compare
+TOLERANCE = 0.20
+
+
+def run(method: str, clients: int, logins: int) -> dict:
+    from services import passwords
+
+    stored = passwords.hash_password("correct horse battery staple", method)
+
+    def login(_):
+        started = time.perf_counter()
+        try:
+            assert passwords.verify_password(stored, "correct horse battery staple")
+        except passwords.HasherBusy:
+            return None
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        latencies = list(pool.map(login, range(logins)))
+    wall = time.perf_counter() - started
+
+    done = sorted(t for t in latencies if t is not None)
+    cores = min(passwords.PASSWORD_HASH_WORKERS, os.cpu_count() or 1)
+    per_second = len(done) / wall
+    return {
+        "logins_per_s": round(per_second, 1),
+        "per_core": round(per_second / cores, 1),
+        "p95_ms": round(done[int(len(done) * 0.95) - 1] * 1000, 1) if done else None,
+        "rejected": len(latencies) - len(done),
+    }
+
+
+def print_report(results: dict):
+    header = (
+        f"{'method / clients':<34}{'logins/s':>10}{'per core':>10}"
+        f"{'p95 ms':>9}{'503s':>6}"
+    )
+    print("\n" + header)
+    print("-" * len(header))
+    for key, r in results.items():
+        print(
+            f"{key:<34}{r['logins_per_s']:>10}{r['per_core']:>10}"
+            f"{r['p95_ms']:>9}{r['rejected']:>6}"
+        )
+    print("-" * len(header))
+
+
+def compare(results: dict, baseline: dict) -> list:
+    """Human readable regressions of results against a saved baseline"""
+    regressions = []
+    for key, current in results.items():
+        before = baseline["results"].get(key)
+        if not before:
+            continue
+        if current["per_core"] < before["per_core"] * (1 - TOLERANCE):
+            regressions.append(
+                f"{key}: {before['per_core']} -> {current['per_core']} logins/s/core"
+            )
+        if current["rejected"] > before["rejected"]:
+            regressions.append(
+                f"{key}: {before['rejected']} -> {current['rejected']} rejected"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Password hashing throughput")
+    parser.add_argument(
+        "--method",
+        action="append",
+        help="Werkzeug hash method, repeatable (default: PASSWORD_HASH_METHOD)",
+    )
+    parser.add_argument(
+        "--clients",
+        type=int,
+        action="append",
+        help="concurrent logins, repeatable (default: 1, cores, 8 x cores)",
+    )
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    args = parser.parse_args(argv)
+
+    from services import passwords
+
+    cores = os.cpu_count() or 1
+    methods = args.method or [passwords.PASSWORD_HASH_METHOD]
+    clients = args.clients or sorted({1, cores, cores * 8})
+
+    results = {}
+    for method in methods:
+        for n in clients:
+            results[f"{method} / {n}"] = run(method, n, args.logins)
+    print_report(results)
+
+    summary = {
+        "results": results,
+        "meta": {
+            "logins": args.logins,
+            "workers": passwords.PASSWORD_HASH_WORKERS,
+            "max_pending": passwords.PASSWORD_HASH_MAX_PENDING,
+            "cpus": cores,
+            "python": platform.python_version(),
+            "host": platform.node(),
+            "recorded_at": datetime.utcnow().isoformat(timespec="seconds"),
+        },
+    }
+
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"✓ Saved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f))
+        if regressions:
+            print("\n❌ Regressions against baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
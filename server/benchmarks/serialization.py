@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Bytes and CPU per response for each JSON encoder and content coding.
+
+Payloads are built from the seeded database the way the views build them
+(job_to_dict with raw datetimes, the skills list), then encoded through the
+app's JSON provider and compressed like middlewares/compression.py does.
+
+    python benchmarks/serialization.py
+    python benchmarks/serialization.py --save benchmarks/baselines/serialization.json
+    python benchmarks/serialization.py --compare benchmarks/baselines/serialization.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent / "api"
+sys.path.insert(0, str(API_DIR))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Regressions beyond these ratios fail --compare
+CPU_TOLERANCE = 0.25
+BYTES_TOLERANCE = 0.05
+
+
+def load_payloads(page_sizes=(1, 50, 200)) -> dict:
+    from sqlalchemy.orm import selectinload
+
+    from config.db import SessionLocal
+    from controllers.job import job_to_dict
+    from core.models import Job, Skill
+
+    db = SessionLocal()
+    try:
+        jobs = (
+            db.query(Job)
+            .options(
+                selectinload(Job.employer),
+                selectinload(Job.category),
+                selectinload(Job.skills),
+                selectinload(Job.applicants),
+            )
+            .order_by(Job.id)
+            .limit(max(page_sizes))
+            .all()
+        )
+        if not jobs:
+            raise SystemExit("No jobs in the database, run seed/bulk.py first")
+        rows = [job_to_dict(job) for job in jobs]
+        skills = [{"id": s.id, "name": s.name} for s in db.query(Skill).all()]
+    finally:
+        db.close()
+
+    payloads = {"job": rows[0]}
+    for size in page_sizes[1:]:
+        payloads[f"jobs_page_{size}"] = {
+            "jobs": rows[:size],
+            "total": len(rows),
+            "page": 1,
+            "limit": size,
+        }
+    payloads["skills"] = {"skills": skills}
+    return payloads
+
+
+def measure(fn, repeat: int) -> float:
+    """CPU microseconds per call"""
+    started = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - started) / repeat * 1e6
+
+
+def run(payloads: dict, repeat: int) -> dict:
+    from flask import Flask
+
+    from middlewares.compression import available_encodings, compress
+    from services.serialization import init_json, orjson
+
+    app = Flask(__name__)
+    results = {}
+    for encoder in ["std"] + (["orjson"] if orjson else []):
+        init_json(app, encoder)
+        for name, payload in payloads.items():
+
+            def encode():
+                return app.json.response(payload).get_data()
+
+            body = encode()
+            encode_us = measure(encode, repeat)
+            for coding in ["identity"] + available_encodings():
+                key = f"{name}/{encoder}/{coding}"
+                if coding == "identity":
+                    results[key] = {"bytes": len(body), "cpu_us": round(encode_us, 1)}
+                    continue
+                compress_us = measure(lambda: compress(body, coding), repeat)
+                results[key] = {
+                    "bytes": len(compress(body, coding)),
+                    "cpu_us": round(encode_us + compress_us, 1),
+                }
+    return results
+
+
+def print_report(results: dict):
+    header = (
+        f"{'payload / encoder / coding':<36}{'bytes':>10}{'cpu µs':>10}{'vs std':>9}"
+    )
+    print("\n" + header)
+    print("-" * len(header))
+    for key, r in results.items():
+        name, _, coding = key.split("/")
+        before = results[f"{name}/std/identity"]
+        ratio = r["bytes"] / before["bytes"]
+        print(f"{key:<36}{r['bytes']:>10}{r['cpu_us']:>10}{ratio:>8.0%}")
+    print("-" * len(header))
+    print("vs std: size relative to the stdlib encoder without compression")
+
+
+def compare(results: dict, baseline: dict) -> list:
+    """Human readable regressions of results against a saved baseline"""
+    regressions = []
+    for key, current in results.items():
+        before = baseline["results"].get(key)
+        if not before:
+            continue
+        if current["cpu_us"] > before["cpu_us"] * (1 + CPU_TOLERANCE):
+            regressions.append(f"{key}: {before['cpu_us']}µs -> {current['cpu_us']}µs")
+        if current["bytes"] > before["bytes"] * (1 + BYTES_TOLERANCE):
+            regressions.append(f"{key}: {before['bytes']}B -> {current['bytes']}B")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JSON encoding / compression cost")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    args = parser.parse_args(argv)
+
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        payloads = load_payloads()
+    results = run(payloads, args.repeat)
+    print_report(results)
+
+    summary = {
+        "results": results,
+        "meta": {
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "host": platform.node(),
+            "recorded_at": datetime.utcnow().isoformat(timespec="seconds"),
+        },
+    }
+
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"✓ Saved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f))
+        if regressions:
+            print("\n❌ Regressions against baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
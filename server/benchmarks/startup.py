@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: how long a fresh interpreter takes to import the app,
+build it with create_app() and answer its first request.
+
+Every run is a new process, so nothing is cached in sys.modules. The heaviest
+imports come from `python -X importtime`.
+
+    python benchmarks/startup.py --runs 10
+    python benchmarks/startup.py --save benchmarks/baselines/startup.json
+    python benchmarks/startup.py --compare benchmarks/baselines/startup.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parent.parent / "api"
+
+# Regressions beyond this ratio of the baseline median fail --compare
+TOLERANCE = 0.25
+TOP_IMPORTS = 15
+
+# Runs in the child process; prints one JSON line
+_PROBE = """
+import json, time
+started = time.perf_counter()
+import server
+imported = time.perf_counter()
+app = server.create_app()
+created = time.perf_counter()
+from config import db
+engine_created = db._engine is not None
+response = app.test_client().get("/")
+answered = time.perf_counter()
+
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "first_request_ms": (answered - created) * 1000,
+    "total_ms": (answered - started) * 1000,
+    "status": response.status_code,
+    "engine_created": engine_created,
+}))
+"""
+
+_IMPORTTIME_PROBE = "import server; server.create_app()"
+# import time: self [us] | cumulative | imported package
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _run_probe(env: dict) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=API_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Blueprints may print while being imported, the probe's line comes last
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def heaviest_imports(env: dict, limit: int = TOP_IMPORTS) -> list:
+    """Imports made by import server + create_app(), by cumulative time"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORTTIME_PROBE],
+        cwd=API_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        # Deeper indentation means imported by another module in the list
+        if match and len(match.group(3)) <= 2:
+            modules.append(
+                {"module": match.group(4), "ms": round(int(match.group(2)) / 1000, 1)}
+            )
+    modules.sort(key=lambda m: m["ms"], reverse=True)
+    return modules[:limit]
+
+
+def summarize(samples: list) -> dict:
+    summary = {}
+    for key in ("import_ms", "create_app_ms", "first_request_ms", "total_ms"):
+        values = sorted(s[key] for s in samples)
+        summary[key] = {
+            "median": round(statistics.median(values), 1),
+            "min": round(values[0], 1),
+            "max": round(values[-1], 1),
+        }
+    return summary
+
+
+def compare(summary: dict, baseline: dict) -> list:
+    """Human readable regressions of summary against a saved baseline"""
+    regressions = []
+    for key, current in summary["timings"].items():
+        before = baseline["timings"].get(key)
+        if before and current["median"] > before["median"] * (1 + TOLERANCE):
+            regressions.append(f"{key}: {before['median']}ms -> {current['median']}ms")
+    if summary["engine_created"] and not baseline.get("engine_created"):
+        regressions.append("create_app() now creates a database engine")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    # One throwaway run so .pyc files exist, like on a deployed server
+    _run_probe(env)
+    samples = [_run_probe(env) for _ in range(args.runs)]
+
+    summary = {
+        "runs": args.runs,
+        "timings": summarize(samples),
+        "engine_created": any(s["engine_created"] for s in samples),
+        "first_request_status": samples[-1]["status"],
+        "heaviest_imports": heaviest_imports(env),
+        "meta": {
+            "python": platform.python_version(),
+            "host": platform.node(),
+            "recorded_at": datetime.utcnow().isoformat(timespec="seconds"),
+        },
+    }
+
+    print(f"\n{'':<20}{'median':>9}{'min':>9}{'max':>9}")
+    for key, t in summary["timings"].items():
+        print(f"{key:<20}{t['median']:>9}{t['min']:>9}{t['max']:>9}")
+    print(
+        f"{args.runs} cold starts, times in ms, database engine created by "
+        f"create_app(): {'yes' if summary['engine_created'] else 'no'}"
+    )
+    print("\nHeaviest imports (cumulative ms):")
+    for m in summary["heaviest_imports"]:
+        print(f"  {m['ms']:>8}  {m['module']}")
+
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"✓ Saved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(summary, json.load(f))
+        if regressions:
+            print("\n❌ Regressions against baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Migration script to add a unique index on lower(skills.name).
+Case-insensitive duplicates are merged into the lowest id first.
+"""
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+
+# Load environment variables
+env_path = Path(__file__).parent.parent / ".env"
+load_dotenv(dotenv_path=env_path)
+
+DB_USER = os.getenv("DB_USERNAME")
+DB_PASSWORD = os.getenv("DB_PASSWORD")
+DB_HOST = os.getenv("DB_HOST")
+DB_PORT = os.getenv("DB_PORT")
+DB_NAME = os.getenv("DB_NAME")
+
+DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+DUPLICATES_QUERY = """
+    SELECT s.id, keep.id AS keep_id
+    FROM public.skills s
+    JOIN (
+        SELECT lower(name) AS lname, min(id) AS id
+        FROM public.skills
+        GROUP BY lower(name)
+        HAVING count(*) > 1
+    ) keep ON lower(s.name) = keep.lname AND s.id <> keep.id
+"""
+
+
+def merge_duplicate_skills(conn):
+    """Point user_skills / job_skills at the kept skill, then drop the copies"""
+    duplicates = conn.execute(text(DUPLICATES_QUERY)).all()
+    if not duplicates:
+        print("✓ No case-insensitive duplicate skills")
+        return
+
+    print(f"Merging {len(duplicates)} duplicate skills...")
+    for table, owner in (("user_skills", "user_id"), ("job_skills", "job_id")):
+        conn.execute(
+            text(
+                f"""
+                INSERT INTO public.{table} ({owner}, skill_id)
+                SELECT t.{owner}, d.keep_id
+                FROM public.{table} t
+                JOIN ({DUPLICATES_QUERY}) d ON t.skill_id = d.id
+                ON CONFLICT DO NOTHING
+            """
+            )
+        )
+
+    conn.execute(
+        text(
+            f"DELETE FROM public.skills WHERE id IN (SELECT id FROM ({DUPLICATES_QUERY}) d)"
+        )
+    )
+    print("✓ Merged duplicate skills")
+
+
+def add_skill_name_lower_index():
+    """Create uq_skills_name_lower if it doesn't exist"""
+    engine = create_engine(DATABASE_URL)
+
+    try:
+        with engine.begin() as conn:
+            merge_duplicate_skills(conn)
+
+        # CONCURRENTLY can't run inside a transaction block
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            print("Creating uq_skills_name_lower index...")
+            conn.execute(
+                text(
+                    """
+                CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_skills_name_lower
+                ON public.skills (lower(name))
+            """
+                )
+            )
+            print("✓ uq_skills_name_lower index is in place")
+
+        print("\n✅ Migration completed successfully!")
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Error during migration: {e}")
+        return False
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    print("Running database migration to index skill names case-insensitively...\n")
+    success = add_skill_name_lower_index()
+    sys.exit(0 if success else 1)
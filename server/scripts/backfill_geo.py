@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Fill latitude / longitude / geohash of jobs and users from their location
+for rows written before those columns existed (migration 0006), or after
+the gazetteer changed. Runs in batches, one transaction each, and can be
+stopped and rerun. No network: locations are looked up in the bundled
+gazetteer.
+
+    python scripts/backfill_geo.py
+    python scripts/backfill_geo.py --all   # re-geocode every row
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from sqlalchemy import select, update
+
+from config.db import SessionLocal
+from core.models import Job, User
+from services.geo import geo_columns
+
+
+def backfill(model, batch_size: int, regeocode: bool) -> tuple:
+    found = missing = 0
+    last_id = 0
+    while True:
+        session = SessionLocal()
+        try:
+            query = (
+                select(model.id, model.location)
+                .where(model.id > last_id, model.location.isnot(None))
+                .order_by(model.id)
+                .limit(batch_size)
+            )
+            if not regeocode:
+                query = query.where(model.geohash.is_(None))
+            rows = session.execute(query).all()
+            if not rows:
+                return found, missing
+
+            # ORM bulk UPDATE by primary key: one executemany per batch
+            values = [{"id": id_, **geo_columns(text)} for id_, text in rows]
+            session.execute(update(model), values)
+            session.commit()
+        finally:
+            session.close()
+
+        last_id = rows[-1].id
+        located = sum(v["geohash"] is not None for v in values)
+        found += located
+        missing += len(values) - located
+        print(
+            f"  up to {model.__tablename__} {last_id}: "
+            f"{found} located, {missing} not in the gazetteer"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backfill geocoded locations")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--all", action="store_true", help="re-geocode rows that already have one"
+    )
+    args = parser.parse_args(argv)
+
+    for model in (Job, User):
+        found, missing = backfill(model, args.batch_size, args.all)
+        print(f"✓ {model.__tablename__}: {found} located, {missing} left empty")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
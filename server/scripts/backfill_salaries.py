@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Fill jobs.salary_min / salary_max / salary_currency from salary_range for
+rows written before those columns existed (migration 0005). Runs in
+batches, one transaction each, and can be stopped and rerun.
+
+    python scripts/backfill_salaries.py
+    python scripts/backfill_salaries.py --all   # re-parse every job
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from sqlalchemy import select, update
+
+from config.db import SessionLocal
+from core.models import Job
+from services.salary import salary_columns
+
+
+def backfill(batch_size: int, reparse: bool) -> tuple:
+    parsed = unparsed = 0
+    last_id = 0
+    while True:
+        session = SessionLocal()
+        try:
+            query = (
+                select(Job.id, Job.salary_range)
+                .where(Job.id > last_id, Job.salary_range.isnot(None))
+                .order_by(Job.id)
+                .limit(batch_size)
+            )
+            if not reparse:
+                query = query.where(Job.salary_currency.is_(None))
+            rows = session.execute(query).all()
+            if not rows:
+                return parsed, unparsed
+
+            # ORM bulk UPDATE by primary key: one executemany per batch
+            values = [{"id": id_, **salary_columns(text)} for id_, text in rows]
+            session.execute(update(Job), values)
+            session.commit()
+        finally:
+            session.close()
+
+        last_id = rows[-1].id
+        found = sum(v["salary_currency"] is not None for v in values)
+        parsed += found
+        unparsed += len(values) - found
+        print(f"  up to job {last_id}: {parsed} parsed, {unparsed} without an amount")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backfill structured salaries")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--all", action="store_true", help="re-parse jobs that already have one"
+    )
+    args = parser.parse_args(argv)
+
+    parsed, unparsed = backfill(args.batch_size, args.all)
+    print(f"✓ {parsed} salaries parsed, {unparsed} left empty")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for Google's OAuth endpoints, to run the sign in flow
+without Google.
+
+    python scripts/fake_oauth.py --port 9400
+
+then start the API with
+
+    GOOGLE_AUTH_URL=http://localhost:9400/auth
+    GOOGLE_TOKEN_URL=http://localhost:9400/token
+    GOOGLE_JWKS_URL=http://localhost:9400/certs
+    GOOGLE_ISSUERS=http://localhost:9400
+
+/auth redirects straight back with a code (?login_hint=someone@example.com
+picks the account), /token exchanges it for an RS256 ID token and /certs
+serves the key that signed it.
+
+    python scripts/fake_oauth.py --check
+
+runs the API's callback in-process against the fake server and reports
+how many calls to the provider the sign ins took. The fake users
+(fake.user0-2@example.com) are created in the configured database.
+"""
+import argparse
+import base64
+import os
+import secrets
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from flask import Flask, jsonify, redirect, request
+
+KEY_ID = "fake-1"
+
+
+def _b64(number: int) -> str:
+    raw = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def create_fake_provider(issuer: str) -> Flask:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    numbers = private_key.public_key().public_numbers()
+    codes = {}  # code -> (client_id, email)
+
+    app = Flask("fake_oauth")
+    app.calls = {"auth": 0, "token": 0, "certs": 0}
+
+    @app.route("/auth")
+    def auth():
+        app.calls["auth"] += 1
+        code = secrets.token_urlsafe(16)
+        email = request.args.get("login_hint", "fake.user@example.com")
+        codes[code] = (request.args.get("client_id"), email)
+        query = urlencode({"code": code, "state": request.args.get("state", "")})
+        return redirect(f"{request.args['redirect_uri']}?{query}")
+
+    @app.route("/token", methods=["POST"])
+    def token():
+        app.calls["token"] += 1
+        found = codes.pop(request.form.get("code"), None)
+        if found is None or found[0] != request.form.get("client_id"):
+            return jsonify({"error": "invalid_grant"}), 400
+        client_id, email = found
+        now = int(time.time())
+        claims = {
+            "iss": issuer,
+            "aud": client_id,
+            "sub": str(abs(hash(email))),
+            "email": email,
+            "email_verified": True,
+            "name": email.split("@")[0].replace(".", " ").title(),
+            "picture": "",
+            "iat": now,
+            "exp": now + 3600,
+        }
+        id_token = jwt.encode(
+            claims, private_key, algorithm="RS256", headers={"kid": KEY_ID}
+        )
+        return jsonify(
+            {
+                "access_token": secrets.token_urlsafe(24),
+                "id_token": id_token,
+                "token_type": "Bearer",
+                "expires_in": 3600,
+            }
+        )
+
+    @app.route("/certs")
+    def certs():
+        app.calls["certs"] += 1
+        key = {
+            "kty": "RSA",
+            "alg": "RS256",
+            "use": "sig",
+            "kid": KEY_ID,
+            "n": _b64(numbers.n),
+            "e": _b64(numbers.e),
+        }
+        response = jsonify({"keys": [key]})
+        response.headers["Cache-Control"] = "public, max-age=3600"
+        return response
+
+    return app
+
+
+def serve(app: Flask, port: int):
+    import logging
+
+    from werkzeug.serving import make_server
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = make_server("127.0.0.1", port, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def check(port: int, logins: int) -> int:
+    """Sign in `logins` times through the API's callback"""
+    base = f"http://127.0.0.1:{port}"
+    os.environ.update(
+        {
+            "GOOGLE_CLIENT_ID": "fake-client",
+            "GOOGLE_CLIENT_SECRET": "fake-secret",
+            "GOOGLE_AUTH_URL": f"{base}/auth",
+            "GOOGLE_TOKEN_URL": f"{base}/token",
+            "GOOGLE_JWKS_URL": f"{base}/certs",
+            "GOOGLE_ISSUERS": base,
+        }
+    )
+    provider = create_fake_provider(base)
+    server = serve(provider, port)
+
+    from server import create_app
+
+    client = create_app().test_client()
+    failures = 0
+    started = time.perf_counter()
+    for i in range(logins):
+        # What the browser does: /auth, then the provider redirects back
+        redirect_uri = "http://localhost:3000/api/auth/google/callback"
+        query = urlencode(
+            {
+                "client_id": "fake-client",
+                "redirect_uri": redirect_uri,
+                "login_hint": f"fake.user{i % 3}@example.com",
+            }
+        )
+        location = provider.test_client().get(f"/auth?{query}").headers["Location"]
+        response = client.get("/api/auth/google/callback?" + location.split("?", 1)[1])
+        if response.status_code != 200:
+            failures += 1
+            print(f"✗ {response.status_code} {response.get_json()}")
+    elapsed = time.perf_counter() - started
+    server.shutdown()
+
+    print(
+        f"\n{logins - failures}/{logins} sign ins, {elapsed / logins * 1000:.1f}ms each"
+    )
+    print(f"Provider calls: {provider.calls}")
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fake Google OAuth provider")
+    parser.add_argument("--port", type=int, default=9400)
+    parser.add_argument(
+        "--check", action="store_true", help="run the API callback against it"
+    )
+    parser.add_argument("--logins", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.check:
+        return check(args.port, args.logins)
+
+    issuer = f"http://localhost:{args.port}"
+    print(f"Fake OAuth provider on {issuer} (GOOGLE_ISSUERS={issuer})")
+    create_fake_provider(issuer).run(port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Send saved search digests, for cron:
+
+    0 8 * * * cd server && python scripts/send_search_digests.py
+
+Each candidate with digest searches gets one notification listing the
+jobs they matched since the previous run. Instant searches are notified
+as jobs are posted and are not touched here.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from services.saved_searches import DIGEST_BATCH, send_digests
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=DIGEST_BATCH)
+    args = parser.parse_args(argv)
+
+    print(f"Sent {send_digests(args.batch_size)} digests")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Delete used and expired password reset tokens, for cron:
+
+    */30 * * * * cd server && python scripts/sweep_reset_tokens.py
+
+Workers also sweep on their own while reset links are requested (see
+RESET_TOKEN_SWEEP_INTERVAL); this covers quiet periods.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+from services.reset_tokens import RESET_TOKEN_SWEEP_BATCH, sweep
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=RESET_TOKEN_SWEEP_BATCH)
+    args = parser.parse_args(argv)
+
+    print(f"Deleted {sweep(args.batch_size)} reset tokens")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -258,8 +258,7 @@ notifications_list = []
 notification_types = ["connection_request", "connection_accepted", "job_application", "application_status", "job_posted"]
 
 for _ in range(100):
-    sender = random.choice(users_list)
-    receiver = random.choice([u for u in users_list if u.id != sender.id])
+    sender, receiver = random.sample(users_list, 2)
     
     notif = Notification(
         sender_id=sender.id,
@@ -282,8 +281,7 @@ connections_list = []
 connection_combinations = set()
 
 for _ in range(100):
-    sender = random.choice(users_list)
-    receiver = random.choice([u for u in users_list if u.id != sender.id])
+    sender, receiver = random.sample(users_list, 2)
     combo = tuple(sorted([sender.id, receiver.id]))
     
     if combo not in connection_combinations: